@@ -1,934 +1,243 @@
 """
 Software configuration for Soplos Welcome.
 Defines available software categories and packages.
+
+The catalog itself lives in catalog.json next to this module. It is read
+and validated on first use, not at import, and titles and descriptions are
+stored untranslated and translated when they are read.
 """
 
+import json
 import os
+import threading
 from pathlib import Path
 from core.i18n_manager import _
 
 # Get project root
 PROJECT_ROOT = Path(__file__).parent.parent
 
-# Software categories with their packages
-SOFTWARE_CATEGORIES = {
-    'browsers': {
-        'title': _('Web Browsers'),
-        'icon': 'browsers',
-        'packages': [
-            {
-                'name': 'Firefox',
-                'package': 'firefox',
-                'flatpak': 'org.mozilla.firefox',
-                'icon': 'firefox.png',
-                'description': _('Free and open-source web browser developed by Mozilla'),
-                'official': True
-            },
-            {
-                'name': 'Google Chrome',
-                'package': 'google-chrome-stable',
-                'icon': 'chrome.png',
-                'description': _('Web browser developed by Google'),
-                'official': False,
-                'install_commands': [
-                    'wget -q -O /tmp/google-chrome.deb https://dl.google.com/linux/direct/google-chrome-stable_current_amd64.deb',
-                    'apt install -y /tmp/google-chrome.deb',
-                    'rm /tmp/google-chrome.deb'
-                ]
-            },
-            {
-                'name': 'Chromium',
-                'package': 'chromium',
-                'flatpak': 'org.chromium.Chromium',
-                'icon': 'chromium.png',
-                'description': _('Open-source project behind Google Chrome'),
-                'official': True
-            },
-            {
-                'name': 'Brave',
-                'package': 'brave-browser',
-                'flatpak': 'com.brave.Browser',
-                'icon': 'brave.png',
-                'description': _('Privacy-focused browser that blocks ads'),
-                'official': False,
-                'install_commands': [
-                    'apt install -y curl',
-                    'curl -fsSLo /usr/share/keyrings/brave-browser-archive-keyring.gpg https://brave-browser-apt-release.s3.brave.com/brave-browser-archive-keyring.gpg',
-                    'curl -fsSLo /etc/apt/sources.list.d/brave-browser-release.sources https://brave-browser-apt-release.s3.brave.com/brave-browser.sources',
-                    'apt update',
-                    'apt install -y brave-browser'
-                ]
-            },
-            {
-                'name': 'LibreWolf',
-                'package': 'librewolf',
-                'flatpak': 'io.gitlab.librewolf-community',
-                'icon': 'librewolf.png',
-                'description': _('Firefox fork focused on privacy, security and freedom'),
-                'official': False
-            },
-            {
-                'name': 'Vivaldi',
-                'package': None,
-                'flatpak': 'com.vivaldi.Vivaldi',
-                'icon': 'vivaldi.png',
-                'description': _('Feature-packed web browser with built-in tools'),
-                'official': False
-            },
-            {
-                'name': 'Opera GX',
-                'package': None,
-                'flatpak': 'com.opera.opera-gx',
-                'icon': 'opera-gx.png',
-                'description': _('Gaming browser with system resource controls'),
-                'official': False
-            },
-            {
-                'name': 'Opera',
-                'package': None,
-                'flatpak': 'com.opera.Opera',
-                'icon': 'opera.png',
-                'description': _('Feature-rich browser with built-in VPN and ad blocker'),
-                'official': False
-            },
-            {
-                'name': 'Zen Browser',
-                'package': 'zen-browser',
-                'icon': 'zen-browser.png',
-                'description': _('Privacy-focused Firefox-based browser with beautiful design'),
-                'official': False,
-                'install_commands': [
-                    'ZEN_URL=$(curl -s https://api.github.com/repos/sh4r10/zen-browser-debian/releases/latest | grep browser_download_url | grep -v zip | grep -v tar | cut -d\\" -f4)',
-                    'wget -q --show-progress -O /tmp/zen-browser.deb "$ZEN_URL"',
-                    'apt install -y /tmp/zen-browser.deb',
-                    'rm -f /tmp/zen-browser.deb'
-                ]
-            },
-            {
-                'name': 'Helium',
-                'package': 'helium-bin',
-                'icon': 'helium.png',
-                'description': _('Privacy-focused browser built on Chromium with YouTube integration'),
-                'official': False,
-                'install_commands': [
-                    'HELIUM_URL=$(curl -s https://api.github.com/repos/imputnet/helium-linux/releases/latest | grep browser_download_url | grep amd64.deb | cut -d\\" -f4)',
-                    'wget -q --show-progress -O /tmp/helium.deb "$HELIUM_URL"',
-                    'apt install -y /tmp/helium.deb',
-                    'rm -f /tmp/helium.deb'
-                ]
-            },
-            {
-                'name': 'Midori',
-                'package': 'midori',
-                'icon': 'midori.png',
-                'description': _('Lightweight, fast and secure web browser'),
-                'official': False,
-                'install_commands': [
-                    'wget -q -O /tmp/midori.deb https://github.com/goastian/midori-desktop/releases/download/v11.6/midori_11.6-1_amd64.deb',
-                    'apt install -y /tmp/midori.deb',
-                    'rm /tmp/midori.deb'
-                ]
-            },
-            {
-                'name': 'Brave Origin',
-                'package': 'brave-origin',
-                'icon': 'brave-origin.png',
-                'description': _('Privacy-focused browser by Brave with integrated AI assistant'),
-                'official': False,
-                'install_commands': [
-                    'curl -fsS https://dl.brave.com/install.sh | FLAVOR=origin sh',
-                    f'bash \'{os.path.join(PROJECT_ROOT, "services", "brave-origin-icon-patch.sh")}\' \'{os.path.join(PROJECT_ROOT, "assets", "icons", "browsers", "brave-origin-icons")}\'',
-                ]
-            },
-        ]
-    },
-    
-    'comunications': {
-        'title': _('Communication'),
-        'icon': 'comunications',
-        'packages': [
-            {
-                'name': 'Thunderbird',
-                'package': 'thunderbird',
-                'flatpak': 'org.mozilla.Thunderbird',
-                'icon': 'thunderbird.png',
-                'description': _('Free email client developed by Mozilla'),
-                'official': True
-            },
-            {
-                'name': 'Discord',
-                'package': 'discord',
-                'flatpak': 'com.discordapp.Discord',
-                'icon': 'discord.png',
-                'description': _('Communication app for communities and gaming'),
-                'official': False
-            },
-            {
-                'name': 'Telegram',
-                'package': 'telegram-desktop',
-                'flatpak': 'org.telegram.desktop',
-                'icon': 'telegram.png',
-                'description': _('Fast and secure messaging app'),
-                'official': False
-            },
-            {
-                'name': 'Signal',
-                'package': 'signal-desktop',
-                'flatpak': 'org.signal.Signal',
-                'icon': 'signal.png',
-                'description': _('Private messaging with end-to-end encryption'),
-                'official': False
-            },
-            {
-                'name': 'Element',
-                'package': 'element-desktop',
-                'flatpak': 'im.riot.Riot',
-                'icon': 'element.png',
-                'description': _('Matrix client for decentralized communication'),
-                'official': False
-            },
-            {
-                'name': 'WhatsApp',
-                'package': None,
-                'flatpak': 'io.github.mimbrero.WhatsAppDesktop',
-                'icon': 'whatsapp.png',
-                'description': _('Unofficial WhatsApp desktop client'),
-                'official': False
-            },
-            {
-                'name': 'Slack',
-                'package': None,
-                'flatpak': 'com.slack.Slack',
-                'icon': 'slack.png',
-                'description': _('Team collaboration and communication platform'),
-                'official': False
-            },
-            {
-                'name': 'Zoom',
-                'package': None,
-                'flatpak': 'us.zoom.Zoom',
-                'icon': 'zoom.png',
-                'description': _('Video conferencing and meetings'),
-                'official': False
-            }
-        ]
-    },
-    
-    'developer': {
-        'title': _('Development'),
-        'icon': 'vscode.png',
-        'packages': [
-            {
-                'name': 'Visual Studio Code',
-                'package': 'code',
-                'flatpak': 'com.visualstudio.code',
-                'icon': 'vscode.png',
-                'description': _('Source code editor developed by Microsoft'),
-                'official': False,
-                'install_commands': [
-                    'apt install -y wget gpg apt-transport-https',
-                    'wget -qO- https://packages.microsoft.com/keys/microsoft.asc | gpg --dearmor --yes > /usr/share/keyrings/packages.microsoft.gpg',
-                    'echo "deb [arch=amd64 signed-by=/usr/share/keyrings/packages.microsoft.gpg] https://packages.microsoft.com/repos/code stable main" | tee /etc/apt/sources.list.d/vscode.list > /dev/null',
-                    'apt update',
-                    'apt install -y code'
-                ]
-            },
-            {
-                'name': 'VSCodium',
-                'package': 'codium',
-                'flatpak': 'com.vscodium.codium',
-                'icon': 'vscodium.png',
-                'description': _('Free version of Visual Studio Code without telemetry'),
-                'official': False
-            },
-            {
-                'name': 'Google Antigravity',
-                'package': 'antigravity',
-                'icon': 'antigravity.png',
-                'description': _('Advanced Agentic AI Coding Assistant'),
-                'official': False,
-                'install_commands': [
-                    'mkdir -p /etc/apt/keyrings',
-                    'curl -fsSL https://us-central1-apt.pkg.dev/doc/repo-signing-key.gpg | gpg --dearmor --yes -o /etc/apt/keyrings/antigravity-repo-key.gpg',
-                    'echo "deb [signed-by=/etc/apt/keyrings/antigravity-repo-key.gpg] https://us-central1-apt.pkg.dev/projects/antigravity-auto-updater-dev/ antigravity-debian main" | tee /etc/apt/sources.list.d/antigravity.list > /dev/null',
-                    'apt update',
-                    'apt install -y antigravity'
-                ]
-            },
-            {
-                'name': 'Sublime Text',
-                'package': 'sublime-text',
-                'flatpak': 'com.sublimetext.three',
-                'icon': 'sublime-text.png',
-                'description': _('Sophisticated text editor for code and markup'),
-                'official': False,
-                'install_commands': [
-                    'apt install -y wget gpg apt-transport-https',
-                    'mkdir -p /etc/apt/keyrings',
-                    'wget -qO /etc/apt/keyrings/sublimehq-pub.asc https://download.sublimetext.com/sublimehq-pub.gpg',
-                    'echo -e "Types: deb\\nURIs: https://download.sublimetext.com/\\nSuites: apt/stable/\\nSigned-By: /etc/apt/keyrings/sublimehq-pub.asc" | tee /etc/apt/sources.list.d/sublime-text.sources > /dev/null',
-                    'apt update',
-                    'apt install -y sublime-text'
-                ]
-            },
-            {
-                'name': 'Cursor',
-                'package': 'cursor',
-                'install_commands': [
-                    'wget -q -O /tmp/cursor.deb "https://api2.cursor.sh/updates/download/golden/linux-x64-deb/cursor/0.43.3"',
-                    'apt install -y /tmp/cursor.deb',
-                    'rm /tmp/cursor.deb'
-                ],
-                'icon': 'cursor.png',
-                'description': _('Code editor with integrated AI'),
-                'official': False
-            },
-            {
-                'name': 'Zed',
-                'package': None,
-                'flatpak': 'dev.zed.Zed',
-                'icon': 'zed.png',
-                'description': _('High-performance, multiplayer code editor'),
-                'official': False
-            },
-            {
-                'name': 'Pulsar',
-                'package': None,
-                'flatpak': 'dev.pulsar_edit.Pulsar',
-                'icon': 'pulsar.png',
-                'description': _('A community-led, hyper-hackable text editor'),
-                'official': False
-            },
-            {
-                'name': 'Geany',
-                'package': 'geany',
-                'flatpak': 'org.geany.Geany',
-                'icon': 'geany.png',
-                'description': _('Lightweight and fast IDE with multi-language support'),
-                'official': True
-            },
-            {
-                'name': 'Bluefish',
-                'package': 'bluefish',
-                'icon': 'bluefish.png',
-                'description': _('Advanced editor for web programmers'),
-                'official': True
-            },
-            {
-                'name': 'Postman',
-                'package': None,
-                'flatpak': 'com.getpostman.Postman',
-                'icon': 'postman.png',
-                'description': _('API development and testing platform'),
-                'official': False
-            }
-        ]
-    },
-    
-    'graphics': {
-        'title': _('Graphics and Design'),
-        'icon': 'graphics',
-        'packages': [
-            # Image editing
-            {
-                'name': 'GIMP',
-                'package': 'gimp',
-                'flatpak': 'org.gimp.GIMP',
-                'icon': 'gimp.png',
-                'description': _('Advanced and free image editor'),
-                'official': True
-            },
-            {
-                'name': 'Krita',
-                'package': 'krita',
-                'flatpak': 'org.kde.krita',
-                'icon': 'krita.png',
-                'description': _('Professional digital painting program'),
-                'official': True
-            },
-            {
-                'name': 'Affinity Suite',
-                'package': None,
-                'icon': 'affinity.png',
-                'description': _('Professional photo editing, design and publishing suite'),
-                'official': False,
-                'check_path': '~/AppImages/Affinity-3.0.2-x86_64.AppImage',
-                'install_commands': [
-                    'REAL_HOME=$(getent passwd $PKEXEC_UID | cut -d: -f6)',
-                    'REAL_USER=$(getent passwd $PKEXEC_UID | cut -d: -f1)',
-                    'sudo -u $REAL_USER mkdir -p "$REAL_HOME/AppImages/.icons"',
-                    'sudo -u $REAL_USER mkdir -p "$REAL_HOME/.local/share/applications"',
-                    'wget -q -O "$REAL_HOME/AppImages/Affinity-3.0.2-x86_64.AppImage" "https://github.com/ryzendew/Linux-Affinity-Installer/releases/download/3.2.0/Affinity-3.0.2-x86_64.AppImage"',
-                    'chmod +x "$REAL_HOME/AppImages/Affinity-3.0.2-x86_64.AppImage"',
-                    f'cp {os.path.join(PROJECT_ROOT, "assets", "icons", "graphics", "affinity.png")} "$REAL_HOME/AppImages/.icons/AffinitySuite.png"',
-                    'chown -R $PKEXEC_UID:$PKEXEC_UID "$REAL_HOME/AppImages"',
-                    "printf '[Desktop Entry]\\nName=Affinity Suite\\nExec=%s/AppImages/Affinity-3.0.2-x86_64.AppImage\\nIcon=%s/AppImages/.icons/AffinitySuite.png\\nType=Application\\nCategories=Graphics;\\nComment=Professional photo editing, design and publishing suite\\n' \"$REAL_HOME\" \"$REAL_HOME\" | sudo -u $REAL_USER tee \"$REAL_HOME/.local/share/applications/affinity.desktop\" > /dev/null",
-                ],
-                'uninstall_commands': [
-                    'REAL_HOME=$(getent passwd $PKEXEC_UID | cut -d: -f6)',
-                    'rm -f "$REAL_HOME/AppImages/Affinity-3.0.2-x86_64.AppImage"',
-                    'rm -f "$REAL_HOME/AppImages/.icons/AffinitySuite.png"',
-                    'rm -f "$REAL_HOME/.local/share/applications/affinity.desktop"'
-                ]
-            },
-            # Vector / Design
-            {
-                'name': 'Inkscape',
-                'package': 'inkscape',
-                'flatpak': 'org.inkscape.Inkscape',
-                'icon': 'inkscape.png',
-                'description': _('Professional vector graphics editor'),
-                'official': True
-            },
-            # 3D
-            {
-                'name': 'Blender',
-                'package': 'blender',
-                'flatpak': 'org.blender.Blender',
-                'icon': 'blender.png',
-                'description': _('Complete and free 3D creation suite'),
-                'official': True
-            },
-            # Photography / RAW
-            {
-                'name': 'darktable',
-                'package': 'darktable',
-                'flatpak': 'org.darktable.Darktable',
-                'icon': 'darktable.png',
-                'description': _('Virtual lighttable for photography'),
-                'official': True
-            },
-            {
-                'name': 'RapidRAW',
-                'package': None,
-                'flatpak': 'io.github.CyberTimon.RapidRAW',
-                'icon': 'rapidraw.png',
-                'description': _('Fast and modern RAW photo editor'),
-                'official': False
-            },
-            {
-                'name': 'RawTherapee',
-                'package': 'rawtherapee',
-                'flatpak': 'com.rawtherapee.RawTherapee',
-                'icon': 'rawtherapee.png',
-                'description': _('Advanced RAW photo processing program'),
-                'official': True
-            },
-            {
-                'name': 'ART',
-                'package': None,
-                'flatpak': 'us.pixls.art.ART',
-                'icon': 'art.png',
-                'description': _('Advanced RAW photo editor with local adjustments'),
-                'official': False
-            },
-            {
-                'name': 'Hugin',
-                'package': 'hugin',
-                'icon': 'hugin.png',
-                'description': _('Panorama photo stitcher'),
-                'official': True
-            }
-        ]
-    },
-    
-    'multimedia': {
-        'title': _('Multimedia'),
-        'icon': 'multimedia',
-        'packages': [
-            # Media players
-            {
-                'name': 'VLC Media Player',
-                'package': 'vlc',
-                'flatpak': 'org.videolan.VLC',
-                'icon': 'vlc.png',
-                'description': _('Universal media player'),
-                'official': True
-            },
-            {
-                'name': 'MPV',
-                'package': 'mpv',
-                'flatpak': 'io.mpv.Mpv',
-                'icon': 'mpv.png',
-                'description': _('Minimalist and powerful media player'),
-                'official': True
-            },
-            {
-                'name': 'Kodi',
-                'package': 'kodi',
-                'flatpak': 'tv.kodi.Kodi',
-                'icon': 'kodi.png',
-                'description': _('Open-source media center'),
-                'official': True
-            },
-            {
-                'name': 'Spotify',
-                'package': None,
-                'flatpak': 'com.spotify.Client',
-                'icon': 'spotify.png',
-                'description': _('Digital music streaming service'),
-                'official': False
-            },
-            # Video
-            {
-                'name': 'OBS Studio',
-                'package': 'obs-studio',
-                'flatpak': 'com.obsproject.Studio',
-                'icon': 'obs-studio.png',
-                'description': _('Software for streaming and video recording'),
-                'official': True
-            },
-            {
-                'name': 'Kdenlive',
-                'package': 'kdenlive',
-                'flatpak': 'org.kde.kdenlive',
-                'icon': 'kdenlive.png',
-                'description': _('Professional non-linear video editor'),
-                'official': True
-            },
-            {
-                'name': 'OpenShot',
-                'package': 'openshot-qt',
-                'flatpak': 'org.openshot.OpenShot',
-                'icon': 'openshot.png',
-                'description': _('Easy to use video editor'),
-                'official': True
-            },
-            {
-                'name': 'HandBrake',
-                'package': 'handbrake',
-                'flatpak': 'fr.handbrake.ghb',
-                'icon': 'handbrake.png',
-                'description': _('Open source video transcoder'),
-                'official': True
-            },
-            {
-                'name': 'DaVinci Resolve',
-                'package': None,
-                'flatpak': None,
-                'icon': 'davinci-resolve.png',
-                'description': _('Professional video editing (Script by Daniel Tufvesson)'),
-                'official': False,
-                'custom_install': True
-            },
-            # Audio / DAW
-            {
-                'name': 'Audacity',
-                'package': 'audacity',
-                'flatpak': 'org.audacityteam.Audacity',
-                'icon': 'audacity.png',
-                'description': _('Free and open-source audio editor'),
-                'official': True
-            },
-            {
-                'name': 'LMMS',
-                'package': 'lmms',
-                'icon': 'lmms.png',
-                'description': _('Digital audio workstation'),
-                'official': True
-            },
-            {
-                'name': 'Mixxx',
-                'package': 'mixxx',
-                'icon': 'mixxx.png',
-                'description': _('Professional DJ software'),
-                'official': True
-            },
-            {
-                'name': 'Bitwig Studio',
-                'package': None,
-                'flatpak': 'com.bitwig.BitwigStudio',
-                'icon': 'bitwig-studio.png',
-                'description': _('Professional digital audio workstation for music production'),
-                'official': False
-            },
-            {
-                'name': 'Reaper',
-                'package': None,
-                'flatpak': 'fm.reaper.Reaper',
-                'icon': 'reaper.png',
-                'description': _('Professional digital audio workstation and MIDI sequencer'),
-                'official': False
-            },
-            {
-                'name': 'Zrythm',
-                'package': None,
-                'flatpak': 'org.zrythm.Zrythm',
-                'icon': 'zrythm.png',
-                'description': _('Free and open-source digital audio workstation'),
-                'official': False
-            },
-            {
-                'name': 'Ardour',
-                'package': None,
-                'flatpak': 'org.ardour.Ardour',
-                'icon': 'ardour.png',
-                'description': _('Professional recording, editing and mixing DAW'),
-                'official': False
-            }
-        ]
-    },
-    
-    'office': {
-        'title': _('Office'),
-        'icon': 'office',
-        'packages': [
-            # Office suites
-            {
-                'name': 'LibreOffice',
-                'package': 'libreoffice',
-                'flatpak': 'org.libreoffice.LibreOffice',
-                'icon': 'libreoffice.png',
-                'description': _('Complete and free office suite'),
-                'official': True
-            },
-            {
-                'name': 'OnlyOffice',
-                'package': 'onlyoffice-desktopeditors',
-                'flatpak': 'org.onlyoffice.desktopeditors',
-                'icon': 'onlyoffice.png',
-                'description': _('Office suite compatible with Microsoft Office'),
-                'official': False
-            },
-            {
-                'name': 'WPS Office',
-                'package': None,
-                'flatpak': 'com.wps.Office',
-                'icon': 'wpsoffice.png',
-                'description': _('Lightweight and elegant office suite'),
-                'official': False
-            },
-            {
-                'name': 'Calligra',
-                'package': None,
-                'flatpak': 'org.kde.calligra',
-                'icon': 'calligra.png',
-                'description': _('KDE office suite: word processor, spreadsheet and presentation'),
-                'official': True
-            },
-            {
-                'name': 'Collabora Office',
-                'package': None,
-                'flatpak': 'org.collaboraoffice.CollaboraOffice',
-                'icon': 'collabora.png',
-                'description': _('Enterprise-grade LibreOffice fork by Collabora'),
-                'official': True
-            },
-            # PDF
-            {
-                'name': 'Adobe Reader',
-                'package': None,
-                'flatpak': 'com.adobe.Reader',
-                'icon': 'reader.png',
-                'description': _('Adobe PDF reader'),
-                'official': False
-            },
-            {
-                'name': 'JoPDF',
-                'package': 'jopdf',
-                'flatpak': None,
-                'icon': 'jopdf.png',
-                'description': _('PDF editor: annotate, sign, fill forms and merge PDFs'),
-                'official': False,
-                'install_commands': [
-                    'wget -q -O /tmp/jopdf.deb https://cdn.jopdf.com/download/jopdf/jopdf-linux-amd64_setup.deb',
-                    'apt install -y /tmp/jopdf.deb',
-                    'rm /tmp/jopdf.deb'
-                ]
-            }
-        ]
-    },
-    
-    'gaming': {
-        'title': _('Gaming'),
-        'icon': 'steam.png',
-        'packages': [
-            {
-                'name': 'Steam',
-                'package': None,
-                'flatpak': 'com.valvesoftware.Steam',
-                'icon': 'steam.png',
-                'description': _('Digital distribution platform for video games'),
-                'official': False
-            },
-            {
-                'name': 'Lutris',
-                'package': 'lutris',
-                'flatpak': 'net.lutris.Lutris',
-                'icon': 'lutris.png',
-                'description': _('Unified platform for managing games on Linux'),
-                'official': True
-            },
-            {
-                'name': 'Bottles',
-                'package': None,
-                'flatpak': 'com.usebottles.bottles',
-                'icon': 'bottles.png',
-                'description': _('Run Windows applications on Linux using Wine'),
-                'official': False
-            },
-            {
-                'name': 'RetroArch',
-                'package': 'retroarch',
-                'flatpak': 'org.libretro.RetroArch',
-                'icon': 'retroarch.png',
-                'description': _('Frontend for emulators and game engines'),
-                'official': True
-            },
-            {
-                'name': 'Heroic Games Launcher',
-                'package': None,
-                'flatpak': 'com.heroicgameslauncher.hgl',
-                'icon': 'heroic.png',
-                'description': _('Launcher for Epic, GOG and Amazon Games'),
-                'official': False
-            },
-            {
-                'name': 'ES-DE',
-                'package': None,
-                'icon': 'ES-DE.png',
-                'description': _('Frontend for emulators with a modern interface'),
-                'official': False,
-                'check_path': '~/AppImages/ES-DE_x64.AppImage',
-                'install_commands': [
-                    'REAL_HOME=$(getent passwd $PKEXEC_UID | cut -d: -f6)',
-                    'REAL_USER=$(getent passwd $PKEXEC_UID | cut -d: -f1)',
-                    'sudo -u $REAL_USER mkdir -p "$REAL_HOME/AppImages/.icons"',
-                    'wget -q -O "$REAL_HOME/AppImages/ES-DE_x64.AppImage" "https://gitlab.com/es-de/emulationstation-de/-/package_files/246875981/download"',
-                    'chmod +x "$REAL_HOME/AppImages/ES-DE_x64.AppImage"',
-                    f'cp {os.path.join(PROJECT_ROOT, "assets", "icons", "gaming", "ES-DE.png")} "$REAL_HOME/AppImages/.icons/ES-DE.png"',
-                    'chown -R $PKEXEC_UID:$PKEXEC_UID "$REAL_HOME/AppImages"',
-                    'sudo -u $REAL_USER mkdir -p "$REAL_HOME/.local/share/applications"',
-                    "printf '[Desktop Entry]\\nName=ES-DE\\nExec=%s/AppImages/ES-DE_x64.AppImage\\nIcon=%s/AppImages/.icons/ES-DE.png\\nType=Application\\nCategories=Game;\\nComment=Frontend for emulators with a modern interface\\n' \"$REAL_HOME\" \"$REAL_HOME\" | sudo -u $REAL_USER tee \"$REAL_HOME/.local/share/applications/es-de.desktop\" > /dev/null"
-                ],
-                'uninstall_commands': [
-                    'REAL_HOME=$(getent passwd $PKEXEC_UID | cut -d: -f6)',
-                    'rm -f "$REAL_HOME/AppImages/ES-DE_x64.AppImage"',
-                    'rm -f "$REAL_HOME/AppImages/.icons/ES-DE.png"',
-                    'rm -f "$REAL_HOME/.local/share/applications/es-de.desktop"'
-                ]
-            },
-            {
-                'name': 'PPSSPP',
-                'package': None,
-                'flatpak': 'org.ppsspp.PPSSPP',
-                'icon': 'ppsspp.png',
-                'description': _('PSP emulator with high-quality rendering'),
-                'official': False,
-                'post_install_script': 'ppsspp-lutris-runner.sh'
-            }
-        ]
-    },
-
-    'app_management': {
-        'title': _('App Management'),
-        'icon': 'app_management',
-        'packages': [
-            {
-                'name': 'Soplos WebApp Manager',
-                'package': 'soplos-webapp-manager',
-                'icon': 'soplos-webapps-manager.png',
-                'description': _('Manage your web applications with ease'),
-                'official': True
-            },
-            {
-                'name': 'Soplos AppImage Manager',
-                'package': 'soplos-appimage-manager',
-                'icon': 'soplos-appimage-manager.png',
-                'description': _('Manage and integrate AppImages on your system'),
-                'official': True
-            },
-            {
-                'name': 'Flatseal',
-                'package': None,
-                'flatpak': 'com.github.tchx84.Flatseal',
-                'icon': 'flatseal.png',
-                'description': _('Manage Flatpak permissions'),
-                'official': False
-            },
-            {
-                'name': 'Gear Lever',
-                'package': None,
-                'flatpak': 'it.mijorus.gearlever',
-                'icon': 'gear-lever.png',
-                'description': _('Manage AppImages effortlessly'),
-                'official': False
-            },
-            {
-                'name': 'Warehouse',
-                'package': None,
-                'flatpak': 'io.github.flattool.Warehouse',
-                'icon': 'warehouse.png',
-                'description': _('Manage and control your Flatpak apps and runtimes'),
-                'official': False
-            }
-        ]
-    },
-    'downloads': {
-        'title': _('Downloads'),
-        'icon': 'downloads',
-        'packages': [
-            {
-                'name': 'qBittorrent',
-                'package': None,
-                'flatpak': 'org.qbittorrent.qBittorrent',
-                'icon': 'qbittorrent.png',
-                'description': _('Free and open-source BitTorrent client'),
-                'official': False
-            },
-            {
-                'name': 'Transmission',
-                'package': 'transmission-gtk',
-                'icon': 'transmission.png',
-                'description': _('Lightweight and easy-to-use BitTorrent client'),
-                'official': False
-            },
-            {
-                'name': 'JDownloader',
-                'package': None,
-                'flatpak': 'org.jdownloader.JDownloader',
-                'icon': 'jdownloader.png',
-                'description': _('Download manager for direct downloads, video sites and file hosts'),
-                'official': False
-            },
-            {
-                'name': 'Syncthing Tray',
-                'package': None,
-                'flatpak': 'io.github.martchus.syncthingtray',
-                'icon': 'syncthing.png',
-                'description': _('Tray application for Syncthing — sync files between devices'),
-                'official': False
-            }
-        ]
-    },
-    'hardware': {
-        'title': _('Hardware'),
-        'icon': 'hardware',
-        'packages': [
-            {
-                'name': 'Resources',
-                'package': None,
-                'flatpak': 'net.nokyan.Resources',
-                'icon': 'resources.png',
-                'description': _('Modern system monitor with detailed resource usage'),
-                'official': False
-            },
-            {
-                'name': 'LACT',
-                'package': None,
-                'flatpak': 'io.github.ilya_zlobintsev.LACT',
-                'icon': 'lact.png',
-                'description': _('GPU control center for AMD and NVIDIA on Linux'),
-                'official': False
-            },
-            {
-                'name': 'CPU Power',
-                'package': 'cpupower-gui',
-                'packages': 'linux-cpupower cpupower-gui',
-                'icon': 'cpupower.png',
-                'description': _('Control the CPU frequency governor from a graphical interface'),
-                'official': False
-            },
-            {
-                'name': 'amdgpu_top',
-                'package': 'amdgpu-top',
-                'icon': 'amdgpu-top.png',
-                'description': _('Real-time AMD GPU usage monitor with detailed metrics'),
-                'official': False,
-                'install_commands': [
-                    'AMDGPU_TOP_URL=$(curl -s https://api.github.com/repos/Umio-Yasuno/amdgpu_top/releases/latest | grep browser_download_url | grep amd64.deb | cut -d\\" -f4)',
-                    'wget -q --show-progress -O /tmp/amdgpu-top.deb "$AMDGPU_TOP_URL"',
-                    'apt install -y /tmp/amdgpu-top.deb',
-                    'rm -f /tmp/amdgpu-top.deb'
-                ]
-            },
-            {
-                'name': 'nvtop',
-                'package': 'nvtop',
-                'icon': 'nvtop.png',
-                'description': _('GPU process monitor for NVIDIA, AMD and Intel'),
-                'official': True
-            },
-            {
-                'name': 'CoolerControl',
-                'package': None,
-                'flatpak': None,
-                'icon': 'coolercontrol.png',
-                'description': _('Fan and cooling control with a web interface'),
-                'official': False,
-                'check_path': '~/AppImages/CoolerControlD-x86_64.AppImage',
-                'install_commands': [
-                    f'bash {os.path.join(PROJECT_ROOT, "services", "coolercontrol-install.sh")} {os.path.join(PROJECT_ROOT, "assets", "icons", "hardware", "coolercontrol.png")}'
-                ],
-                'uninstall_commands': [
-                    'REAL_HOME=$(getent passwd $PKEXEC_UID | cut -d: -f6)',
-                    'rm -f "$REAL_HOME/AppImages/CoolerControlD-x86_64.AppImage"',
-                    'rm -f "$REAL_HOME/AppImages/.icons/coolercontrol.png"',
-                    'rm -f "$REAL_HOME/.local/share/applications/soplos-appimage-coolercontrold.desktop"',
-                    'rm -f "$REAL_HOME/.local/share/applications/soplos-webapp-coolercontrol-ui-111987.desktop"',
-                    'rm -rf "$REAL_HOME/.local/share/soplos-webapps/coolercontrol-ui-111987"'
-                ]
-            }
-        ]
-    },
-    'files': {
-        'title': _('Files'),
-        'icon': 'files',
-        'packages': [
-            {
-                'name': 'PeaZip',
-                'package': None,
-                'flatpak': 'io.github.peazip.PeaZip',
-                'icon': 'peazip.png',
-                'description': _('Free file archiver and extractor utility'),
-                'official': False
-            },
-            {
-                'name': 'FileZilla',
-                'package': 'filezilla',
-                'icon': 'filezilla.png',
-                'description': _('Fast and reliable FTP, FTPS and SFTP client'),
-                'official': False
-            },
-            {
-                'name': 'GNOME Commander',
-                'package': 'gnome-commander',
-                'icon': 'gnome-commander.png',
-                'description': _('Twin-panel file manager for GNOME'),
-                'official': False
-            },
-            {
-                'name': 'Double Commander',
-                'package': None,
-                'flatpak': None,
-                'icon': 'doublecmd.png',
-                'description': _('Twin-panel file manager with advanced features'),
-                'official': False,
-                'check_path': '~/AppImages/doublecmd-gtk-latest-x86_64.AppImage',
-                'install_commands': [
-                    'REAL_HOME=$(getent passwd $PKEXEC_UID | cut -d: -f6)',
-                    'REAL_USER=$(getent passwd $PKEXEC_UID | cut -d: -f1)',
-                    'sudo -u "$REAL_USER" mkdir -p "$REAL_HOME/AppImages/.icons"',
-                    'sudo -u "$REAL_USER" mkdir -p "$REAL_HOME/.local/share/applications"',
-                    'wget -q --show-progress -O "$REAL_HOME/AppImages/doublecmd-gtk-latest-x86_64.AppImage" "https://download.opensuse.org/repositories/home:/Alexx2000/AppImage/doublecmd-gtk-latest-x86_64.AppImage"',
-                    'chmod +x "$REAL_HOME/AppImages/doublecmd-gtk-latest-x86_64.AppImage"',
-                    f'cp {os.path.join(PROJECT_ROOT, "assets", "icons", "files", "doublecmd.png")} "$REAL_HOME/AppImages/.icons/doublecmd.png"',
-                    'chown -R "$PKEXEC_UID:$PKEXEC_UID" "$REAL_HOME/AppImages"',
-                    "printf '[Desktop Entry]\\nType=Application\\nName=Double Commander\\nExec=%s/AppImages/doublecmd-gtk-latest-x86_64.AppImage\\nIcon=%s/AppImages/.icons/doublecmd.png\\nCategories=FileManager;\\nComment=Twin-panel file manager with advanced features\\nX-AppImage-Integrate=true\\n' \"$REAL_HOME\" \"$REAL_HOME\" | sudo -u \"$REAL_USER\" tee \"$REAL_HOME/.local/share/applications/doublecmd.desktop\" > /dev/null",
-                    'chown "$PKEXEC_UID:$PKEXEC_UID" "$REAL_HOME/.local/share/applications/doublecmd.desktop"',
-                    'sudo -u "$REAL_USER" update-desktop-database "$REAL_HOME/.local/share/applications" 2>/dev/null || true'
-                ],
-                'uninstall_commands': [
-                    'REAL_HOME=$(getent passwd $PKEXEC_UID | cut -d: -f6)',
-                    'rm -f "$REAL_HOME/AppImages/doublecmd-gtk-latest-x86_64.AppImage"',
-                    'rm -f "$REAL_HOME/AppImages/.icons/doublecmd.png"',
-                    'rm -f "$REAL_HOME/.local/share/applications/doublecmd.desktop"'
-                ]
-            }
-        ]
-    }
+CATALOG_PATH = PROJECT_ROOT / 'config' / 'catalog.json'
+CATALOG_VERSION = 1
+
+# Stands for PROJECT_ROOT inside catalog strings (bundled scripts and icons)
+PROJECT_ROOT_TOKEN = '@PROJECT_ROOT@'
+
+# Catalog fields that hold a msgid rather than display text
+TRANSLATED_FIELDS = frozenset(['title', 'description'])
+
+_STRINGS = (list, str)  # a list whose items must all be str
+_OPTIONAL_STR = (str, type(None))
+
+# field -> (accepted types, required)
+CATEGORY_SCHEMA = {
+    'title': (str, True),
+    'icon': (str, True),
+    'packages': (list, True),
 }
 
+PACKAGE_SCHEMA = {
+    'name': (str, True),
+    'description': (str, True),
+    'icon': (str, False),
+    'package': (_OPTIONAL_STR, False),
+    'packages': (str, False),  # space-separated, when the app needs several
+    'flatpak': (_OPTIONAL_STR, False),
+    'official': (bool, False),
+    'deb_url': (str, False),
+    'deb_sha256': (str, False),
+    'check_path': (str, False),
+    'install_commands': (_STRINGS, False),
+    'uninstall_commands': (_STRINGS, False),
+    'post_install_script': (str, False),
+    'custom_install': (bool, False),
+    'webapp_url': (str, False),
+    'webapp_id': (str, False),
+    'webapp_icon': (str, False),
+}
+
+
+class CatalogEntry(dict):
+    """
+    A category or package of the catalog.
+
+    Translated fields hold their msgid and go through _() when read, so
+    loading the catalog costs no gettext lookups and a language switch
+    applies to entries that are already loaded.
+    """
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        return _(value) if key in TRANSLATED_FIELDS and value else value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
+def _validate(entry, schema: dict, where: str) -> list:
+    """Schema violations of one catalog entry, as readable messages."""
+    if not isinstance(entry, dict):
+        return [f"{where}: expected an object"]
+    errors = []
+    for field, (types, required) in schema.items():
+        if field not in entry:
+            if required:
+                errors.append(f"{where}: missing '{field}'")
+            continue
+        value = entry[field]
+        if types is _STRINGS:
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                errors.append(f"{where}: '{field}' must be a list of strings")
+        elif not isinstance(value, types):
+            errors.append(f"{where}: '{field}' has the wrong type")
+    for field in entry:
+        if field not in schema:
+            errors.append(f"{where}: unknown field '{field}'")
+    return errors
+
+
+def _expand(value):
+    """Replace the project root token in a string or list of strings."""
+    root = str(PROJECT_ROOT)
+    if isinstance(value, str):
+        return value.replace(PROJECT_ROOT_TOKEN, root)
+    if isinstance(value, list):
+        return [_expand(item) for item in value]
+    return value
+
+
+def _load_packages(entries, where: str) -> list:
+    """Validated CatalogEntry packages; invalid ones are reported and skipped."""
+    packages = []
+    for i, entry in enumerate(entries):
+        errors = _validate(entry, PACKAGE_SCHEMA, f"{where}[{i}]")
+        if errors:
+            print("Skipping invalid catalog entry: " + "; ".join(errors))
+            continue
+        packages.append(CatalogEntry((field, _expand(value)) for field, value in entry.items()))
+    return packages
+
+
+def _read_catalog(path) -> tuple:
+    """
+    Parse and validate the catalog file.
+
+    Returns:
+        (categories, launchers); both empty if the file cannot be used
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error reading software catalog {path}: {e}")
+        return {}, []
+    if not isinstance(data, dict) or data.get('version') != CATALOG_VERSION:
+        print(f"Error reading software catalog {path}: unsupported version")
+        return {}, []
+
+    categories = {}
+    for category_id, category in (data.get('categories') or {}).items():
+        errors = _validate(category, CATEGORY_SCHEMA, category_id)
+        if errors:
+            print("Skipping invalid catalog category: " + "; ".join(errors))
+            continue
+        categories[category_id] = CatalogEntry(
+            title=category['title'],
+            icon=category['icon'],
+            packages=_load_packages(category['packages'], category_id),
+        )
+    launchers = _load_packages(data.get('launchers') or [], 'launchers')
+    return categories, launchers
+
+
+def catalog_messages(path=CATALOG_PATH) -> list:
+    """
+    Translatable strings of the catalog file, for the POT template.
+
+    Returns:
+        (msgid, comment) pairs in file order, each msgid once; comment names
+        the entries that use it
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error reading software catalog {path}: {e}")
+        return []
+
+    entries = []
+    for category_id, category in (data.get('categories') or {}).items():
+        entries.append((category_id, category))
+        for package in category.get('packages') or []:
+            entries.append((f"{category_id}/{package.get('name')}", package))
+    for launcher in data.get('launchers') or []:
+        entries.append((f"launchers/{launcher.get('name')}", launcher))
+
+    messages = {}
+    for where, entry in entries:
+        for field in sorted(TRANSLATED_FIELDS):
+            value = entry.get(field)
+            if isinstance(value, str) and value:
+                messages.setdefault(value, []).append(f"{where} {field}")
+    return [(msgid, ', '.join(used_by)) for msgid, used_by in messages.items()]
+
+
+class SoftwareCatalog:
+    """
+    The catalog file, loaded on first use.
+
+    Lookups use whatever is loaded. get_all_categories() and get_launchers(),
+    which tabs call when they build, also stat the file and load it again if
+    it changed, so an updated catalog shows up on the next rebuild.
+    """
+
+    def __init__(self, path=CATALOG_PATH):
+        self.path = path
+        self.categories = {}
+        self.launchers = []
+        self.index = None
+        self._signature = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _stat_signature(self):
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def ensure_loaded(self, check_changed: bool = False):
+        if self._loaded and not check_changed:
+            return self
+        signature = self._stat_signature()
+        if self._loaded and signature == self._signature:
+            return self
+        with self._lock:
+            # Another thread may have loaded while this one waited.
+            if not self._loaded or signature != self._signature:
+                categories, launchers = _read_catalog(self.path)
+                self.index = CatalogIndex(categories)
+                self.categories, self.launchers = categories, launchers
+                self._signature = signature
+                self._loaded = True
+        return self
+
+
+# Global instance for easy access
+_catalog = SoftwareCatalog()
+
+def _get_catalog(check_changed: bool = False) -> SoftwareCatalog:
+    return _catalog.ensure_loaded(check_changed)
+
+def __getattr__(name):
+    # SOFTWARE_CATEGORIES and CATALOG_INDEX used to be built at import;
+    # keep them readable as module attributes without loading eagerly.
+    if name == 'SOFTWARE_CATEGORIES':
+        return _get_catalog().categories
+    if name == 'CATALOG_INDEX':
+        return _get_catalog().index
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_icon_path(category: str, icon_name: str) -> Path:
     """Get the full path to an icon file."""
     if category and icon_name:
@@ -944,19 +253,110 @@ def get_category_icon_path(category: str) -> Path:
 
 def get_all_categories():
     """Get all software categories."""
-    return SOFTWARE_CATEGORIES
+    return _get_catalog(check_changed=True).categories
+
+def get_launchers() -> list:
+    """Game launchers shown by the Gaming tab."""
+    return _get_catalog(check_changed=True).launchers
 
 def get_category(category_name: str):
     """Get a specific category."""
-    return SOFTWARE_CATEGORIES.get(category_name, {})
+    return _get_catalog().categories.get(category_name, {})
+
+def get_category_packages(category_name: str) -> list:
+    """Packages of a category, or an empty list."""
+    return _get_catalog().index.by_category.get(category_name, [])
 
 def get_package_info(category_name: str, package_name: str):
     """Get information about a specific package."""
-    category = get_category(category_name)
-    if not category:
-        return None
+    return _get_catalog().index.by_name.get((category_name, package_name.lower()))
+
+# Catalog entries that install from Flathub even when an APT package exists.
+# This matches the behavior of previous versions (Tyron/Tyson)
+PREFER_FLATPAK = frozenset([
+    'Telegram', 'Discord', 'Signal', 'Element', 'WhatsApp',
+    'LibreWolf', 'LibreOffice', 'OnlyOffice', 'WPS Office',
+    'OpenShot', 'Kdenlive', 'Shotcut',
+    'OBS Studio', 'HandBrake',
+    'VSCodium', 'Pulsar',
+    'Steam', 'Heroic Games Launcher', 'Bottles',
+    'Lutris'
+])
+
+def _resolve_install_method(package: dict) -> str:
+    if package['name'] in PREFER_FLATPAK and package.get('flatpak'):
+        return 'flatpak'
+        
+    # Check for custom installation handlers
+    if package.get('name') == 'DaVinci Resolve':
+        return 'davinci_resolve'
+
+    # Check for custom installation commands
+    if 'install_commands' in package:
+        return 'custom'
+        
+    # Check for .deb URL installation
+    if package.get('deb_url'):
+        return 'deb'
+        
+    # Default Priority: APT > Flatpak
+    if package.get('package'): # APT package
+        return 'apt'
+    elif package.get('flatpak'):
+        return 'flatpak'
     
-    for package in category.get('packages', []):
-        if package['name'].lower() == package_name.lower():
-            return package
-    return None
+    return 'unknown'
+
+class CatalogIndex:
+    """
+    Lookup tables over the catalog, built once per load.
+
+    Every map points at the catalog's own package dicts, so a lookup returns
+    the same object the UI was built from. Entries found under an APT
+    package or Flatpak ref are (category_id, package) pairs, since one
+    application may be listed in more than one category.
+    """
+
+    def __init__(self, categories: dict):
+        self.by_name = {}      # (category_id, lowercased name) -> package
+        self.by_package = {}   # dpkg package -> [(category_id, package)]
+        self.by_flatpak = {}   # flatpak ref -> [(category_id, package)]
+        self.by_category = {}  # category_id -> [package]
+        self.by_method = {}    # install method -> [(category_id, package)]
+        self._methods = {}     # id(package) -> install method
+        
+        for category_id, category_data in categories.items():
+            packages = category_data.get('packages', [])
+            self.by_category[category_id] = packages
+            for package in packages:
+                entry = (category_id, package)
+                self.by_name.setdefault((category_id, package['name'].lower()), package)
+                if package.get('package'):
+                    self.by_package.setdefault(package['package'], []).append(entry)
+                if package.get('flatpak'):
+                    self.by_flatpak.setdefault(package['flatpak'], []).append(entry)
+                method = _resolve_install_method(package)
+                self._methods[id(package)] = method
+                self.by_method.setdefault(method, []).append(entry)
+
+    def install_method(self, package: dict) -> str:
+        """Install method of a package; catalog entries answer from the index."""
+        method = self._methods.get(id(package))
+        return method if method is not None else _resolve_install_method(package)
+
+def get_install_method(package: dict) -> str:
+    """Preferred installation method: 'apt', 'flatpak', 'deb', 'custom',
+    'davinci_resolve' or 'unknown'."""
+    return _get_catalog().index.install_method(package)
+
+def find_by_package(package_name: str) -> list:
+    """Catalog entries installed through a dpkg package, as (category_id, package)."""
+    return _get_catalog().index.by_package.get(package_name, [])
+
+def find_by_flatpak(flatpak_id: str) -> list:
+    """Catalog entries installed through a Flatpak ref, as (category_id, package)."""
+    return _get_catalog().index.by_flatpak.get(flatpak_id, [])
+
+def get_packages_by_method(method: str) -> list:
+    """Catalog entries using an install method, as (category_id, package)."""
+    return _get_catalog().index.by_method.get(method, [])
@@ -20,6 +20,8 @@ from .environment import (
 )
 from .theme_manager import ThemeManager, get_theme_manager, initialize_theming
 from .i18n_manager import I18nManager, get_i18n_manager, initialize_i18n, _, ngettext
+from .startup_profiler import StartupProfiler, get_startup_profiler
+from .snapshot_cache import SnapshotCache, get_snapshot_cache, get_cache_dir
 
 __all__ = [
     # Application
@@ -45,5 +47,14 @@ __all__ = [
     'get_i18n_manager', 
     'initialize_i18n',
     '_',
-    'ngettext'
+    'ngettext',
+    
+    # Startup Profiling
+    'StartupProfiler',
+    'get_startup_profiler',
+    
+    # Snapshot Cache
+    'SnapshotCache',
+    'get_snapshot_cache',
+    'get_cache_dir'
 ]
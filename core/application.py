@@ -16,6 +16,7 @@ from gi.repository import Gtk, Gdk, GLib, Gio
 from .environment import get_environment_detector
 from .theme_manager import get_theme_manager, initialize_theming
 from .i18n_manager import get_i18n_manager, initialize_i18n, _
+from .startup_profiler import get_startup_profiler
 
 
 class SoplosWelcomeApplication(Gtk.Application):
@@ -26,6 +27,9 @@ class SoplosWelcomeApplication(Gtk.Application):
     
     def __init__(self):
         """Initialize the Soplos Welcome application."""
+        # Start the startup clock before anything else runs
+        self.profiler = get_startup_profiler()
+        
         super().__init__(
             application_id='org.soplos.welcome',
             flags=Gio.ApplicationFlags.HANDLES_COMMAND_LINE
@@ -55,6 +59,8 @@ class SoplosWelcomeApplication(Gtk.Application):
     def on_shutdown(self, app):
         """Called when the application shuts down."""
         print("Shutting down Soplos Welcome...")
+        # Rewrite the profile so it includes tabs built after the first frame
+        self.profiler.write()
         self._cleanup_garbage()
 
     def _cleanup_garbage(self):
@@ -98,17 +104,28 @@ class SoplosWelcomeApplication(Gtk.Application):
         print("Starting Soplos Welcome 2.0...")
         
         # Initialize core systems
-        self._initialize_environment()
-        self._initialize_internationalization()
-        self._initialize_theming()
-        self._setup_application_properties()
+        with self.profiler.phase('_initialize_environment'):
+            self._initialize_environment()
+        with self.profiler.phase('_initialize_internationalization'):
+            self._initialize_internationalization()
+        with self.profiler.phase('_initialize_theming'):
+            self._initialize_theming()
+        with self.profiler.phase('_setup_application_properties'):
+            self._setup_application_properties()
         
         print("Application initialization completed")
     
     def on_activate(self, app):
         """Called when the application is activated."""
         if self.main_window is None:
-            self._create_main_window()
+            with self.profiler.phase('_create_main_window'):
+                self._create_main_window()
+            
+            # Present the window
+            with self.profiler.phase('present'):
+                self.main_window.present()
+            self.main_window.connect_after('draw', self._on_first_frame)
+            return
         
         # Present the window
         self.main_window.present()
@@ -140,6 +157,12 @@ class SoplosWelcomeApplication(Gtk.Application):
                         print(f"Invalid theme: {theme_name}")
                 elif arg in ['--debug']:
                     self._enable_debug_mode()
+                elif arg == '--profile-startup':
+                    self.profiler.enable()
+                elif arg.startswith('--profile-startup='):
+                    self.profiler.enable(report_path=arg.split('=', 1)[1])
+                elif arg.startswith('--profile-trace='):
+                    self.profiler.enable(trace_path=arg.split('=', 1)[1])
                 else:
                     print(f"Unknown argument: {arg}")
         
@@ -147,6 +170,18 @@ class SoplosWelcomeApplication(Gtk.Application):
         self.activate()
         return 0
     
+    def _on_first_frame(self, window, cr):
+        """Record the first frame and write the startup profile if requested."""
+        window.disconnect_by_func(self._on_first_frame)
+        self.profiler.mark('first_frame', once=True)
+        
+        env = self.environment_detector
+        if env:
+            self.profiler.set_metadata('desktop_environment', env.desktop_environment.value)
+            self.profiler.set_metadata('display_protocol', env.display_protocol.value)
+        self.profiler.write()
+        return False
+    
     def _initialize_environment(self):
         """Initialize environment detection."""
         try:
@@ -306,6 +341,11 @@ Examples:
 For more information, visit: https://soplos.org
 """)
         print(help_text)
+        print(_("""Profiling:
+  --profile-startup[=FILE]  Write startup phase timings as JSON
+                            (default: ~/.cache/soplos-welcome/startup-profile.json)
+  --profile-trace=FILE      Write startup phases in Chrome trace format
+"""))
     
     def _print_version(self):
         """Print version information."""
@@ -7,10 +7,21 @@ and system environment configuration.
 import os
 import subprocess
 import configparser
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 from enum import Enum
 
+from .snapshot_cache import get_snapshot_cache
+
+
+# Upper bound for a full detection. Probes still running when it expires
+# are abandoned and their values fall back to 'unknown'.
+DETECTION_DEADLINE = 5.0
+
+# Window managers looked for when wmctrl is unavailable, in priority order
+WM_PROCESSES = ['kwin', 'gnome-shell', 'xfwm4', 'openbox', 'i3', 'awesome']
+
 
 class DesktopEnvironment(Enum):
     """Supported desktop environments."""
@@ -45,19 +56,45 @@ class EnvironmentDetector:
         self._display_protocol = None
         self._theme_type = None
         self._environment_info = {}
+        self._detection_result = None
         
-    def detect_all(self) -> Dict[str, str]:
+    def detect_all(self, refresh: bool = False) -> Dict[str, str]:
         """
         Performs complete environment detection.
         
+        The external probes (gsettings/kdeglobals/xfconf-query, wmctrl, the
+        pgrep fallbacks and qmake) are independent of each other and run
+        concurrently under one shared deadline, so a detection costs about
+        as much as its slowest probe. The result is kept for the rest of the
+        session; callers after the first get the stored copy.
+        
+        Everything but the theme is also kept in the snapshot cache between
+        launches. When the snapshot matches the session only the theme is
+        probed, and the full detection reruns in the background to refresh
+        the snapshot for the next launch.
+        
+        Args:
+            refresh: Run the probes again instead of returning the stored result
+        
         Returns:
             Dictionary with all detected environment information
         """
-        self._detect_desktop_environment()
-        self._detect_display_protocol()
-        self._detect_theme_type()
-        self._detect_additional_info()
+        if self._detection_result is not None and not refresh:
+            return dict(self._detection_result)
+        
+        cache = get_snapshot_cache()
+        if not refresh and self._apply_snapshot(cache.get('environment')):
+            # The theme can be switched at any time, so it is never cached
+            self._detect_theme_type()
+            cache.revalidate('environment', self._revalidate_snapshot)
+        else:
+            self._apply_probes(self._run_probes())
+            cache.set('environment', self._get_snapshot())
         
+        self._detection_result = self._build_result()
+        return dict(self._detection_result)
+    
+    def _build_result(self) -> Dict[str, str]:
         return {
             'desktop_environment': self._desktop_env.value,
             'display_protocol': self._display_protocol.value,
@@ -65,22 +102,129 @@ class EnvironmentDetector:
             'environment_info': self._environment_info
         }
     
+    def _get_snapshot(self) -> Dict:
+        """The cacheable part of the detection."""
+        return self._snapshot_of(self._desktop_env, self._display_protocol,
+                                 self._environment_info)
+    
+    @staticmethod
+    def _snapshot_of(desktop_env, display_protocol, environment_info) -> Dict:
+        return {
+            'desktop_environment': desktop_env.value,
+            'display_protocol': display_protocol.value,
+            'environment_info': dict(environment_info),
+        }
+    
+    def _apply_snapshot(self, snapshot) -> bool:
+        """Load a cached detection. Returns False if there is none or it is unusable."""
+        if not snapshot:
+            return False
+        try:
+            desktop_env = DesktopEnvironment(snapshot['desktop_environment'])
+            display_protocol = DisplayProtocol(snapshot['display_protocol'])
+            environment_info = dict(snapshot['environment_info'])
+        except (KeyError, ValueError, TypeError):
+            return False
+        self._desktop_env = desktop_env
+        self._display_protocol = display_protocol
+        self._environment_info = environment_info
+        return True
+    
+    def _revalidate_snapshot(self) -> Dict:
+        """
+        Background re-detection: returns the new snapshot for the next
+        launch. This session keeps the result it already handed out, so the
+        detector itself is only ever written from the caller's thread.
+        """
+        probes = self._run_probes()
+        return self._snapshot_of(probes['desktop_environment'], probes['display_protocol'],
+                                 probes['environment_info'])
+    
+    def _apply_probes(self, probes: Dict):
+        """Stores the results of _run_probes() on the detector."""
+        self._desktop_env = probes['desktop_environment']
+        self._display_protocol = probes['display_protocol']
+        self._theme_type = probes['theme_type']
+        self._environment_info = probes['environment_info']
+    
+    def _run_probes(self) -> Dict:
+        """
+        Runs every probe concurrently and returns their results.
+        
+        Probes only return values, never write to the detector: one that
+        overruns the deadline is abandoned but may still finish later.
+        """
+        executor = ThreadPoolExecutor(max_workers=len(WM_PROCESSES) + 3,
+                                      thread_name_prefix='env-detect')
+        try:
+            # The theme lookup depends on the desktop, so those two run as one chain
+            theme_future = executor.submit(self._probe_desktop_and_theme)
+            wmctrl_future = executor.submit(self._probe_wmctrl)
+            pgrep_futures = [executor.submit(self._probe_process, wm) for wm in WM_PROCESSES]
+            qt_future = executor.submit(self._detect_qt_version)
+            
+            # Environment-only and in-process lookups need no thread
+            display_protocol = self._probe_display_protocol()
+            gtk_version = self._detect_gtk_version()
+            
+            wait([theme_future, wmctrl_future, qt_future, *pgrep_futures],
+                 timeout=DETECTION_DEADLINE)
+        finally:
+            # Do not block on probes that overran the deadline
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        desktop_env, theme_type = (self._future_result(theme_future) or
+                                   (DesktopEnvironment.UNKNOWN, ThemeType.UNKNOWN))
+        
+        # wmctrl wins over the process list; the process list is read in
+        # priority order so the answer matches the old sequential loop.
+        window_manager = self._future_result(wmctrl_future)
+        if not window_manager:
+            window_manager = next((wm for wm, future in zip(WM_PROCESSES, pgrep_futures)
+                                   if self._future_result(future)), 'unknown')
+        
+        return {
+            'desktop_environment': desktop_env,
+            'display_protocol': display_protocol,
+            'theme_type': theme_type,
+            'environment_info': {
+                'desktop_session': os.environ.get('DESKTOP_SESSION', ''),
+                'gdm_session': os.environ.get('GDMSESSION', ''),
+                'window_manager': window_manager,
+                'gtk_version': gtk_version,
+                'qt_version': self._future_result(qt_future) or 'unknown',
+            },
+        }
+    
+    @staticmethod
+    def _future_result(future):
+        """Result of a finished probe, or None if it failed or is still running."""
+        if not future.done() or future.cancelled() or future.exception() is not None:
+            return None
+        return future.result()
+    
+    def _probe_desktop_and_theme(self) -> Tuple[DesktopEnvironment, ThemeType]:
+        """Detects the desktop environment and then its theme preference."""
+        desktop_env = self._probe_desktop_environment()
+        return desktop_env, self._probe_theme_type(desktop_env)
+    
     def _detect_desktop_environment(self) -> DesktopEnvironment:
         """Detects the current desktop environment."""
+        self._desktop_env = self._probe_desktop_environment()
+        return self._desktop_env
+    
+    def _probe_desktop_environment(self) -> DesktopEnvironment:
         # Check XDG_CURRENT_DESKTOP first (most reliable)
         current_desktop = os.environ.get('XDG_CURRENT_DESKTOP', '').lower()
         
         if 'gnome' in current_desktop:
-            self._desktop_env = DesktopEnvironment.GNOME
+            return DesktopEnvironment.GNOME
         elif 'kde' in current_desktop or 'plasma' in current_desktop:
-            self._desktop_env = DesktopEnvironment.KDE
+            return DesktopEnvironment.KDE
         elif 'xfce' in current_desktop:
-            self._desktop_env = DesktopEnvironment.XFCE
-        else:
-            # Fallback detection methods
-            self._desktop_env = self._fallback_desktop_detection()
-        
-        return self._desktop_env
+            return DesktopEnvironment.XFCE
+        # Fallback detection methods
+        return self._fallback_desktop_detection()
     
     def _fallback_desktop_detection(self) -> DesktopEnvironment:
         """Fallback method for desktop environment detection."""
@@ -112,32 +256,34 @@ class EnvironmentDetector:
     
     def _detect_display_protocol(self) -> DisplayProtocol:
         """Detects the display server protocol (X11 or Wayland)."""
+        self._display_protocol = self._probe_display_protocol()
+        return self._display_protocol
+    
+    def _probe_display_protocol(self) -> DisplayProtocol:
         session_type = os.environ.get('XDG_SESSION_TYPE', '').lower()
         
         if session_type == 'wayland':
-            self._display_protocol = DisplayProtocol.WAYLAND
+            return DisplayProtocol.WAYLAND
         elif session_type == 'x11' or os.environ.get('DISPLAY'):
-            self._display_protocol = DisplayProtocol.X11
-        else:
-            self._display_protocol = DisplayProtocol.UNKNOWN
-            
-        return self._display_protocol
+            return DisplayProtocol.X11
+        return DisplayProtocol.UNKNOWN
     
     def _detect_theme_type(self) -> ThemeType:
         """Detects system theme preference (dark/light)."""
+        self._theme_type = self._probe_theme_type(self._desktop_env)
+        return self._theme_type
+    
+    def _probe_theme_type(self, desktop_env) -> ThemeType:
         try:
-            if self._desktop_env == DesktopEnvironment.GNOME:
-                self._theme_type = self._detect_gnome_theme()
-            elif self._desktop_env == DesktopEnvironment.KDE:
-                self._theme_type = self._detect_kde_theme()
-            elif self._desktop_env == DesktopEnvironment.XFCE:
-                self._theme_type = self._detect_xfce_theme()
-            else:
-                self._theme_type = ThemeType.UNKNOWN
+            if desktop_env == DesktopEnvironment.GNOME:
+                return self._detect_gnome_theme()
+            elif desktop_env == DesktopEnvironment.KDE:
+                return self._detect_kde_theme()
+            elif desktop_env == DesktopEnvironment.XFCE:
+                return self._detect_xfce_theme()
         except Exception:
-            self._theme_type = ThemeType.UNKNOWN
-            
-        return self._theme_type
+            pass
+        return ThemeType.UNKNOWN
     
     def _detect_gnome_theme(self) -> ThemeType:
         """Detects GNOME theme preference."""
@@ -232,41 +378,41 @@ class EnvironmentDetector:
         
         return ThemeType.LIGHT  # Default to light
     
-    def _detect_additional_info(self):
-        """Collects additional environment information."""
-        self._environment_info = {
-            'desktop_session': os.environ.get('DESKTOP_SESSION', ''),
-            'gdm_session': os.environ.get('GDMSESSION', ''),
-            'window_manager': self._detect_window_manager(),
-            'gtk_version': self._detect_gtk_version(),
-            'qt_version': self._detect_qt_version(),
-        }
-    
     def _detect_window_manager(self) -> str:
         """Detects the current window manager."""
+        # Try wmctrl first
+        name = self._probe_wmctrl()
+        if name:
+            return name
+        
+        # Fallback: check common window managers
+        for wm in WM_PROCESSES:
+            if self._probe_process(wm):
+                return wm
+            
+        return 'unknown'
+    
+    def _probe_wmctrl(self) -> Optional[str]:
+        """Window manager name reported by wmctrl, or None."""
         try:
-            # Try wmctrl first
             result = subprocess.run(['wmctrl', '-m'], 
                                    capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
                 for line in result.stdout.split('\n'):
                     if line.startswith('Name:'):
                         return line.split(':', 1)[1].strip()
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
+        except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError):
             pass
-        
-        # Fallback: check common window managers
-        wm_processes = ['kwin', 'gnome-shell', 'xfwm4', 'openbox', 'i3', 'awesome']
+        return None
+    
+    def _probe_process(self, name: str) -> bool:
+        """True if a process with this name is running."""
         try:
-            for wm in wm_processes:
-                result = subprocess.run(['pgrep', wm], 
-                                       capture_output=True, timeout=2)
-                if result.returncode == 0:
-                    return wm
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-            pass
-            
-        return 'unknown'
+            result = subprocess.run(['pgrep', name], 
+                                   capture_output=True, timeout=2)
+            return result.returncode == 0
+        except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError):
+            return False
     
     def _detect_gtk_version(self) -> str:
         """Detects GTK version."""
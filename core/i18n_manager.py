@@ -279,16 +279,24 @@ class I18nManager:
         """
         return self.get_translation(message, **kwargs)
     
-    def create_pot_template(self, source_files: List[str], output_file: str):
+    def create_pot_template(self, source_files: List[str], output_file: str,
+                            include_catalog: bool = True):
         """
         Create a POT template file for translators.
         
+        Category titles and package descriptions only exist in
+        config/catalog.json, which xgettext cannot read; they are written to
+        a POT of their own and merged in with msgcat, so translators get
+        them from the same template as the rest of the app.
+        
         Args:
             source_files: List of Python source files to extract strings from
             output_file: Output POT file path
+            include_catalog: Also extract the software catalog's strings
         """
         try:
             import subprocess
+            import tempfile
             
             cmd = [
                 'xgettext',
@@ -305,10 +313,28 @@ class I18nManager:
             ] + source_files
             
             result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"POT template created: {output_file}")
-            else:
+            if result.returncode != 0:
                 print(f"Error creating POT template: {result.stderr}")
+                return
+            
+            if include_catalog:
+                from config.software import CATALOG_PATH, catalog_messages
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    catalog_pot = os.path.join(tmp_dir, 'catalog.pot')
+                    reference = os.path.relpath(CATALOG_PATH, Path(__file__).parent.parent)
+                    _write_pot_entries(catalog_pot, catalog_messages(), reference)
+                    # --use-first keeps xgettext's header; strings used in
+                    # both places get both references
+                    result = subprocess.run(
+                        ['msgcat', '--use-first', '--output-file=' + output_file,
+                         output_file, catalog_pot],
+                        capture_output=True, text=True
+                    )
+                if result.returncode != 0:
+                    print(f"Error adding catalog strings to POT template: {result.stderr}")
+                    return
+            
+            print(f"POT template created: {output_file}")
                 
         except FileNotFoundError:
             print("xgettext not found. Please install gettext tools.")
@@ -316,6 +342,34 @@ class I18nManager:
             print(f"Error creating POT template: {e}")
 
 
+def _po_quote(text: str) -> str:
+    """A string as a PO file literal."""
+    escaped = (text.replace('\\', '\\\\').replace('"', '\\"')
+               .replace('\n', '\\n').replace('\t', '\\t'))
+    return f'"{escaped}"'
+
+
+def _write_pot_entries(path: str, messages, reference: str):
+    """
+    Write messages not found in Python sources as a POT file.
+    
+    Args:
+        path: Output POT file path
+        messages: (msgid, comment) pairs; comment may be empty
+        reference: Source file named in every entry's reference
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('msgid ""\nmsgstr ""\n'
+                '"Content-Type: text/plain; charset=UTF-8\\n"\n'
+                '"Content-Transfer-Encoding: 8bit\\n"\n')
+        for msgid, comment in messages:
+            f.write('\n')
+            if comment:
+                f.write(f"#. {comment}\n")
+            f.write(f"#: {reference}\n")
+            f.write(f"msgid {_po_quote(msgid)}\nmsgstr \"\"\n")
+
+
 # Global i18n manager instance
 _i18n_manager = None
 
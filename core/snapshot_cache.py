@@ -0,0 +1,173 @@
+"""
+Snapshot cache for Soplos Welcome.
+Keeps slow-to-derive facts about the session and the hardware between
+launches, keyed on a cheap fingerprint of the machine state.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+# Bump when the layout or meaning of a stored section changes
+SNAPSHOT_VERSION = 1
+
+# Session variables that decide the desktop, display protocol and WM
+FINGERPRINT_ENV_VARS = [
+    'XDG_CURRENT_DESKTOP', 'XDG_SESSION_TYPE', 'XDG_SESSION_DESKTOP',
+    'DESKTOP_SESSION', 'GDMSESSION', 'DISPLAY', 'WAYLAND_DISPLAY',
+    'KDE_SESSION_VERSION', 'GNOME_DESKTOP_SESSION_ID',
+]
+
+PCI_DEVICES_DIR = '/sys/bus/pci/devices'
+DPKG_STATUS_PATH = '/var/lib/dpkg/status'
+
+
+def get_cache_dir() -> Path:
+    """Per-user cache directory of the application."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return Path(cache_home) / 'soplos-welcome'
+
+
+def compute_fingerprint() -> str:
+    """
+    Hash of the inputs the cached facts derive from: the session variables,
+    the kernel release, the set of PCI devices and the time of the last
+    package transaction (GTK/Qt versions only change through dpkg).
+    All of it is read without starting a process.
+    """
+    parts = {name: os.environ.get(name, '') for name in FINGERPRINT_ENV_VARS}
+    parts['kernel'] = os.uname().release
+    try:
+        parts['pci'] = sorted(os.listdir(PCI_DEVICES_DIR))
+    except OSError:
+        parts['pci'] = []
+    try:
+        parts['dpkg'] = os.stat(DPKG_STATUS_PATH).st_mtime_ns
+    except OSError:
+        parts['dpkg'] = None
+    data = json.dumps(parts, sort_keys=True).encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
+
+
+class SnapshotCache:
+    """
+    Versioned JSON snapshot of named sections.
+
+    The snapshot is only trusted when its version and fingerprint match the
+    running session. Values served from it are revalidated on a background
+    thread, and the fresh value is written back for the next launch.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else get_cache_dir() / 'snapshot.json'
+        self._fingerprint = None
+        self._sections = None
+        self._revalidating = set()
+        self._lock = threading.Lock()
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = compute_fingerprint()
+        return self._fingerprint
+
+    def _load(self):
+        """Read the snapshot once; a stale or unreadable one counts as empty."""
+        if self._sections is not None:
+            return
+        sections = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == SNAPSHOT_VERSION and data.get('fingerprint') == self.fingerprint:
+                sections = data.get('sections', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Ignoring unreadable snapshot cache: {e}")
+        self._sections = sections
+
+    def get(self, section: str, default: Any = None) -> Any:
+        """Cached value of a section, or default when there is none."""
+        with self._lock:
+            self._load()
+            return self._sections.get(section, default)
+
+    def set(self, section: str, value: Any):
+        """Store a section and write the snapshot."""
+        with self._lock:
+            self._load()
+            if self._sections.get(section) == value:
+                return
+            self._sections[section] = value
+            self._save()
+
+    def _save(self):
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'fingerprint': self.fingerprint,
+            'sections': self._sections,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            # Atomic replace, so a concurrent launch never reads half a file
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error writing snapshot cache: {e}")
+
+    def get_or_compute(self, section: str, compute: Callable[[], Any], revalidate: bool = True) -> Any:
+        """
+        Return the cached section if there is one, otherwise compute and store it.
+
+        Args:
+            section: Section name
+            compute: Callable producing the fresh, JSON-serialisable value
+            revalidate: On a cache hit, recompute in the background and store the result
+        """
+        value = self.get(section)
+        if value is not None:
+            if revalidate:
+                self.revalidate(section, compute)
+            return value
+        value = compute()
+        self.set(section, value)
+        return value
+
+    def revalidate(self, section: str, compute: Callable[[], Any]):
+        """Recompute a section on a daemon thread, at most once at a time per section."""
+        with self._lock:
+            if section in self._revalidating:
+                return
+            self._revalidating.add(section)
+
+        def worker():
+            try:
+                self.set(section, compute())
+            except Exception as e:
+                print(f"Error revalidating snapshot section {section}: {e}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(section)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+
+# Global instance for easy access
+_snapshot_cache = None
+
+def get_snapshot_cache() -> SnapshotCache:
+    """
+    Returns the global snapshot cache instance.
+    Creates it if it doesn't exist.
+    """
+    global _snapshot_cache
+    if _snapshot_cache is None:
+        _snapshot_cache = SnapshotCache()
+    return _snapshot_cache
@@ -0,0 +1,179 @@
+"""
+Startup profiler for Soplos Welcome.
+Timestamps the startup phases and writes them as a JSON report or a
+Chrome trace, so startup time can be compared between releases and machines.
+"""
+
+import os
+import json
+import time
+import threading
+import platform
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+from .snapshot_cache import get_cache_dir
+
+
+def _process_age() -> Optional[float]:
+    """Seconds since the process was started, read from /proc. Covers the
+    interpreter start and module imports that run before this module loads."""
+    try:
+        with open('/proc/self/stat', 'r') as f:
+            # The command name may contain spaces; fields resume after ')'.
+            fields = f.read().rsplit(')', 1)[1].split()
+        start_ticks = int(fields[19])
+        with open('/proc/uptime', 'r') as f:
+            uptime = float(f.read().split()[0])
+        return max(uptime - start_ticks / os.sysconf('SC_CLK_TCK'), 0.0)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class StartupProfiler:
+    """
+    Records named phases and instant marks relative to a common origin.
+
+    Recording is always on because GApplication runs startup before the
+    command line is parsed; it costs two clock reads per phase. The report
+    is only written when --profile-startup or --profile-trace asked for it.
+    """
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._origin_wall = time.time()
+        self._process_age = _process_age()
+        self._phases = []
+        self._marks = []
+        self._metadata = {}
+        self._lock = threading.Lock()
+        self.report_path = None
+        self.trace_path = None
+
+    @property
+    def enabled(self) -> bool:
+        """True if a report or trace was requested."""
+        return self.report_path is not None or self.trace_path is not None
+
+    def enable(self, report_path: Optional[str] = None, trace_path: Optional[str] = None):
+        """
+        Request output. With neither path given, the JSON report goes to the
+        cache directory.
+        """
+        if report_path is None and trace_path is None:
+            report_path = str(get_cache_dir() / 'startup-profile.json')
+        if report_path is not None:
+            self.report_path = report_path
+        if trace_path is not None:
+            self.trace_path = trace_path
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as a phase."""
+        start = self._now()
+        try:
+            yield
+        finally:
+            end = self._now()
+            with self._lock:
+                self._phases.append({
+                    'name': name,
+                    'start': start,
+                    'duration': end - start,
+                    'thread': threading.get_ident(),
+                })
+
+    def mark(self, name: str, once: bool = False):
+        """Record an instant event. With once=True, repeated marks are ignored."""
+        with self._lock:
+            if once and any(m['name'] == name for m in self._marks):
+                return
+            self._marks.append({'name': name, 'time': self._now(),
+                                'thread': threading.get_ident()})
+
+    def set_metadata(self, key: str, value):
+        """Attach context (desktop, kernel, ...) that explains differences between machines."""
+        self._metadata[key] = value
+
+    def get_report(self) -> Dict:
+        """Build the JSON-serialisable report. Times are in milliseconds from the origin."""
+        from core import __version__
+
+        with self._lock:
+            phases = sorted(self._phases, key=lambda p: p['start'])
+            marks = sorted(self._marks, key=lambda m: m['time'])
+
+        first_frame = next((m['time'] for m in marks if m['name'] == 'first_frame'), None)
+        return {
+            'version': __version__,
+            'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self._origin_wall)),
+            'python': platform.python_version(),
+            'kernel': platform.release(),
+            'metadata': dict(self._metadata),
+            'process_age_at_origin_ms': round(self._process_age * 1000, 1) if self._process_age is not None else None,
+            'time_to_first_frame_ms': round(first_frame * 1000, 3) if first_frame is not None else None,
+            'phases': [{'name': p['name'],
+                        'start_ms': round(p['start'] * 1000, 3),
+                        'duration_ms': round(p['duration'] * 1000, 3)} for p in phases],
+            'marks': [{'name': m['name'], 'time_ms': round(m['time'] * 1000, 3)} for m in marks],
+        }
+
+    def get_trace(self) -> Dict:
+        """Build the report in Chrome trace event format (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        with self._lock:
+            events = [{'name': p['name'], 'cat': 'startup', 'ph': 'X', 'pid': pid, 'tid': p['thread'],
+                       'ts': round(p['start'] * 1e6), 'dur': round(p['duration'] * 1e6)}
+                      for p in self._phases]
+            events += [{'name': m['name'], 'cat': 'startup', 'ph': 'i', 's': 'g', 'pid': pid,
+                        'tid': m['thread'], 'ts': round(m['time'] * 1e6)}
+                       for m in self._marks]
+        events.sort(key=lambda e: e['ts'])
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write(self) -> bool:
+        """
+        Write the requested report and/or trace. Safe to call more than once;
+        later calls include the phases recorded since.
+
+        Returns:
+            True if everything requested was written
+        """
+        if not self.enabled:
+            return False
+
+        ok = True
+        outputs = []
+        if self.report_path:
+            outputs.append((self.report_path, self.get_report()))
+        if self.trace_path:
+            outputs.append((self.trace_path, self.get_trace()))
+
+        for path, data in outputs:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+                print(f"Startup profile written to {path}")
+            except OSError as e:
+                print(f"Error writing startup profile {path}: {e}")
+                ok = False
+        return ok
+
+
+# Global instance for easy access
+_startup_profiler = None
+
+def get_startup_profiler() -> StartupProfiler:
+    """
+    Returns the global startup profiler instance.
+    Creates it if it doesn't exist.
+    """
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler()
+    return _startup_profiler
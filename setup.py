@@ -1,14 +1,84 @@
-from setuptools import setup, find_packages
+import os
+
+from setuptools import Command, setup, find_packages
+from setuptools.command.build import build
+from setuptools.command.install import install
+from distutils.command.install_data import install_data
+
+# Where the app's data lives once installed; assets/ sits next to the code
+APP_DATA_DIR = 'share/soplos-welcome'
+
+
+class BuildIconAtlas(Command):
+    """Build the pre-scaled icon atlas (see utils/icon_atlas.py) into the build directory."""
+
+    description = "build the pre-scaled icon atlas"
+    user_options = [('build-dir=', 'd', "directory to write the atlas to")]
+
+    def initialize_options(self):
+        self.build_dir = None
+
+    def finalize_options(self):
+        if self.build_dir is None:
+            build_base = self.get_finalized_command('build').build_base
+            self.build_dir = os.path.join(build_base, 'icon-atlas')
+
+    def run(self):
+        try:
+            from utils.icon_atlas import build_atlas
+        except (ImportError, ValueError) as e:
+            # GdkPixbuf is needed to scale the icons; without it the app
+            # falls back to the original files.
+            self.warn(f"icon atlas not built: {e}")
+            return
+        self.announce(f"building icon atlas in {self.build_dir}", level=2)
+        build_atlas(atlas_dir=self.build_dir)
+
+    def get_outputs(self):
+        if not os.path.isdir(self.build_dir):
+            return []
+        return sorted(os.path.join(self.build_dir, name) for name in os.listdir(self.build_dir))
+
+
+class BuildWithIconAtlas(build):
+    sub_commands = build.sub_commands + [('build_icon_atlas', None)]
+
+
+class InstallWithIconAtlas(install):
+    # install_data normally only runs when data_files is set up front; the
+    # atlas is added to it once it has been built
+    sub_commands = [(name, None if name == 'install_data' else predicate)
+                    for name, predicate in install.sub_commands]
+
+
+class InstallDataWithIconAtlas(install_data):
+    """Install the built atlas where the app looks for it (ICONS_DIR/atlas)."""
+
+    def run(self):
+        self.run_command('build_icon_atlas')
+        files = self.get_finalized_command('build_icon_atlas').get_outputs()
+        if files:
+            self.data_files = list(self.data_files or []) + [
+                (os.path.join(APP_DATA_DIR, 'assets', 'icons', 'atlas'), files)
+            ]
+        super().run()
+
 
 setup(
     name="soplos-welcome",
     version="2.1.1-9",
-    packages=find_packages(),
+    packages=find_packages(exclude=['tests']),
     install_requires=[
         'PyGObject>=3.40.0',
         'python-xlib>=0.29',
         'psutil>=5.8.0'
     ],
+    cmdclass={
+        'build': BuildWithIconAtlas,
+        'build_icon_atlas': BuildIconAtlas,
+        'install': InstallWithIconAtlas,
+        'install_data': InstallDataWithIconAtlas,
+    },
     entry_points={
         'console_scripts': [
             'soplos-welcome=main:main',
@@ -0,0 +1,190 @@
+"""
+Tests for utils.downloader against a local HTTP server that supports
+keep-alive, Range and If-Range.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils import downloader
+from utils.downloader import Artifact, Downloader, VALIDATOR_SUFFIX
+
+
+ALPHA = os.urandom(200 * 1024)
+BETA = os.urandom(120 * 1024)
+SLOW = os.urandom(512 * 1024)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get('Range'), self.headers.get('If-Range')))
+
+        if self.path == '/redirect':
+            self._send_empty(302, {'Location': '/alpha.deb'})
+            return
+        entry = server.files.get(self.path)
+        if entry is None:
+            self._send_empty(404)
+            return
+
+        body, etag = entry
+        start = 0
+        status = 200
+        match = re.match(r'bytes=(\d+)-$', self.headers.get('Range') or '')
+        if_range = self.headers.get('If-Range')
+        if match and (if_range is None or if_range == etag):
+            start = int(match.group(1))
+            if start >= len(body):
+                self._send_empty(416, {'Content-Range': f"bytes */{len(body)}"})
+                return
+            status = 206
+
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body) - start))
+        self.send_header('ETag', etag)
+        if status == 206:
+            self.send_header('Content-Range', f"bytes {start}-{len(body) - 1}/{len(body)}")
+        self.end_headers()
+        step = 4096 if self.path == '/slow.deb' else len(body)
+        try:
+            for i in range(start, len(body), step):
+                self.wfile.write(body[i:i + step])
+                if step != len(body):
+                    time.sleep(0.01)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _send_empty(self, status, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.requests = []
+    httpd.files = {
+        '/alpha.deb': (ALPHA, '"alpha-1"'),
+        '/beta.deb': (BETA, '"beta-1"'),
+        '/slow.deb': (SLOW, '"slow-1"'),
+    }
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(downloader, 'RETRY_DELAY', 0)
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_parallel_downloads(server, tmp_path):
+    artifacts = [
+        Artifact(server.base + '/alpha.deb', str(tmp_path / 'alpha.deb'), _sha256(ALPHA)),
+        Artifact(server.base + '/beta.deb', str(tmp_path / 'beta.deb')),
+    ]
+    progress = []
+
+    failed = Downloader().download(artifacts, lambda *args: progress.append(args))
+
+    assert failed == []
+    assert _read(tmp_path / 'alpha.deb') == ALPHA
+    assert _read(tmp_path / 'beta.deb') == BETA
+    assert not os.path.exists(tmp_path / 'alpha.deb.part')
+    assert progress[-1][:2] == (len(ALPHA) + len(BETA), len(ALPHA) + len(BETA))
+
+
+def test_redirect_is_followed(server, tmp_path):
+    artifact = Artifact(server.base + '/redirect', str(tmp_path / 'alpha.deb'))
+
+    assert Downloader().download([artifact]) == []
+    assert _read(tmp_path / 'alpha.deb') == ALPHA
+
+
+def test_missing_file_fails(server, tmp_path):
+    artifact = Artifact(server.base + '/missing.deb', str(tmp_path / 'missing.deb'))
+
+    assert Downloader().download([artifact]) == [artifact]
+    assert artifact.error.startswith('HTTP 404')
+    assert not os.path.exists(tmp_path / 'missing.deb')
+
+
+def test_checksum_mismatch_fails(server, tmp_path):
+    artifact = Artifact(server.base + '/alpha.deb', str(tmp_path / 'alpha.deb'), _sha256(BETA))
+
+    assert Downloader().download([artifact]) == [artifact]
+    assert 'SHA-256 mismatch' in artifact.error
+    assert not os.path.exists(tmp_path / 'alpha.deb')
+    assert not os.path.exists(tmp_path / 'alpha.deb.part')
+
+
+def test_resume_from_good_part(server, tmp_path):
+    part = tmp_path / 'alpha.deb.part'
+    part.write_bytes(ALPHA[:50 * 1024])
+    (tmp_path / ('alpha.deb.part' + VALIDATOR_SUFFIX)).write_text('"alpha-1"')
+    artifact = Artifact(server.base + '/alpha.deb', str(tmp_path / 'alpha.deb'))
+
+    assert Downloader().download([artifact]) == []
+    assert _read(tmp_path / 'alpha.deb') == ALPHA
+    assert server.requests == [('/alpha.deb', f"bytes={50 * 1024}-", '"alpha-1"')]
+    assert not os.path.exists(str(part) + VALIDATOR_SUFFIX)
+
+
+def test_stale_part_is_downloaded_again(server, tmp_path):
+    (tmp_path / 'alpha.deb.part').write_bytes(os.urandom(50 * 1024))
+    (tmp_path / ('alpha.deb.part' + VALIDATOR_SUFFIX)).write_text('"alpha-0"')
+    artifact = Artifact(server.base + '/alpha.deb', str(tmp_path / 'alpha.deb'))
+
+    assert Downloader().download([artifact]) == []
+    assert _read(tmp_path / 'alpha.deb') == ALPHA
+
+
+def test_part_without_validator_is_discarded(server, tmp_path):
+    (tmp_path / 'alpha.deb.part').write_bytes(os.urandom(50 * 1024))
+    artifact = Artifact(server.base + '/alpha.deb', str(tmp_path / 'alpha.deb'))
+
+    assert Downloader().download([artifact]) == []
+    assert _read(tmp_path / 'alpha.deb') == ALPHA
+    assert server.requests == [('/alpha.deb', None, None)]
+
+
+def test_cancel_keeps_part(server, tmp_path):
+    cancel_event = threading.Event()
+    artifact = Artifact(server.base + '/slow.deb', str(tmp_path / 'slow.deb'))
+
+    def on_progress(done, total, rate):
+        if done:
+            cancel_event.set()
+
+    assert Downloader().download([artifact], on_progress, cancel_event) == [artifact]
+    assert artifact.error == 'cancelled'
+    assert not os.path.exists(tmp_path / 'slow.deb')
+    assert 0 < os.path.getsize(tmp_path / 'slow.deb.part') < len(SLOW)
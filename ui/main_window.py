@@ -9,6 +9,8 @@ from gi.repository import Gtk, Gdk, GLib, GdkPixbuf, Pango
 
 from core.i18n_manager import _
 from core import __version__
+from core.startup_profiler import get_startup_profiler
+from utils.operation_scheduler import get_operation_scheduler
 from ui import DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT, CSS_CLASSES
 
 
@@ -230,6 +232,25 @@ class MainWindow(Gtk.ApplicationWindow):
         self.progress_label.set_max_width_chars(80)  # Limit width
         progress_box.pack_start(self.progress_label, False, False, 0)
         
+        # Operations waiting for a running one to free what they need
+        self.queue_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        self.queue_label = Gtk.Label()
+        self.queue_label.get_style_context().add_class('dim-label')
+        self.queue_label.set_ellipsize(Pango.EllipsizeMode.END)
+        self.queue_label.set_halign(Gtk.Align.START)
+        self.queue_box.pack_start(self.queue_label, True, True, 0)
+        queue_cancel_button = Gtk.Button.new_with_label(_("Cancel waiting"))
+        queue_cancel_button.connect('clicked', lambda button: get_operation_scheduler().cancel_queued())
+        self.queue_box.pack_end(queue_cancel_button, False, False, 0)
+        self.queue_box.set_no_show_all(True)
+        self.queue_label.show()
+        queue_cancel_button.show()
+        progress_box.pack_start(self.queue_box, False, False, 0)
+        
+        scheduler = get_operation_scheduler()
+        handler_id = scheduler.connect('queue-changed', self._on_queue_changed)
+        self.connect('destroy', lambda *args: scheduler.disconnect(handler_id))
+        
         self.progress_revealer.add(progress_box)
         
         # Add tabs AFTER progress widgets exist
@@ -239,6 +260,10 @@ class MainWindow(Gtk.ApplicationWindow):
         main_vbox.pack_start(self.progress_revealer, False, False, 0)
         main_vbox.pack_start(notebook_container, True, True, 0)
     
+    # Tabs built in idle time after the window is on screen, most likely
+    # next first. The rest are only built when the user opens them.
+    PREWARM_TABS = ("SoftwareTab", "RecommendedTab")
+    
     def _create_tabs(self):
         """Create all application tabs."""
         # Tab definitions (name, class_name, icon_name) - CORRECT ORDER
@@ -252,71 +277,20 @@ class MainWindow(Gtk.ApplicationWindow):
             (_("Customization"), "CustomizationTab", "preferences-desktop-theme")
         ]
         
+        # Only the Welcome tab is built up front; every other page starts as
+        # an empty box and gets its tab packed in on first view, so the time
+        # to the first frame does not depend on the heavier tabs (driver
+        # checks, security probes, kernel listing).
+        self._lazy_pages = {}
+        
         for tab_name, tab_class, icon_name in tab_definitions:
             try:
-                # Create appropriate tab content
                 if tab_class == "WelcomeTab":
-                    from .tabs.welcome_tab import WelcomeTab
-                    tab_content = WelcomeTab(self.i18n_manager, self.theme_manager, self.application.assets_path,
-                                             on_gaming_activate=self._toggle_gaming_tab)
-                elif tab_class == "SoftwareTab":
-                    from .tabs.software_tab import SoftwareTab
-                    tab_content = SoftwareTab(
-                        self.i18n_manager, 
-                        self.theme_manager, 
-                        self.environment_detector,
-                        self,  # parent_window for progress access
-                        self.progress_bar,
-                        self.progress_label
-                    )
-                elif tab_class == "RecommendedTab":
-                    from .tabs.recommended_tab import RecommendedTab
-                    self.recommended_tab = RecommendedTab(
-                        self.i18n_manager, 
-                        self.theme_manager,
-                        self,  # parent_window
-                        self.progress_bar,
-                        self.progress_label
-                    )
-                    tab_content = self.recommended_tab
-                elif tab_class == "DriversTab":
-                    from .tabs.drivers_tab import DriversTab
-                    tab_content = DriversTab(
-                        self.i18n_manager,
-                        self.theme_manager,
-                        self.environment_detector,
-                        self,  # parent_window
-                        self.progress_bar,
-                        self.progress_label
-                    )
-                elif tab_class == "KernelsTab":
-                    from .tabs.kernels_tab import KernelsTab
-                    tab_content = KernelsTab(
-                        self.i18n_manager,
-                        self.theme_manager,
-                        self,  # parent_window
-                        self.progress_bar,
-                        self.progress_label
-                    )
-                elif tab_class == "SecurityTab":
-                    from .tabs.security_tab import SecurityTab
-                    tab_content = SecurityTab(
-                        self.i18n_manager,
-                        self.theme_manager,
-                        self,  # parent_window
-                        self.progress_bar,
-                        self.progress_label
-                    )
-                elif tab_class == "CustomizationTab":
-                    from .tabs.customization_tab import CustomizationTab
-                    tab_content = CustomizationTab(
-                        self.i18n_manager, 
-                        self.theme_manager,
-                        self.environment_detector
-                    )
+                    with get_startup_profiler().phase(tab_class):
+                        tab_content = self._build_tab(tab_name, tab_class, icon_name)
                 else:
-                    # Create placeholder tab for others
-                    tab_content = self._create_placeholder_tab(tab_name, tab_class, icon_name)
+                    tab_content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+                    self._lazy_pages[tab_content] = (tab_name, tab_class, icon_name)
                 
                 # Create tab label with icon
                 tab_label_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
@@ -339,30 +313,125 @@ class MainWindow(Gtk.ApplicationWindow):
             except Exception as e:
                 print(f"Error creating tab {tab_name}: {e}")
         
-        # Initialize hidden Gaming Tab (Easter Egg)
-        try:
-            from .tabs.gaming_tab import GamingTab
-            self.gaming_tab = GamingTab(
+        self.notebook.connect('switch-page', self._on_switch_page)
+        
+        # Prewarming starts once the first frame is on screen
+        self._prewarm_queue = [page for page, (_name, tab_class, _icon) in self._lazy_pages.items()
+                               if tab_class in self.PREWARM_TABS]
+        self._first_draw_handler = self.connect_after('draw', self._on_first_draw)
+        
+        # Hidden Gaming Tab (Easter Egg) is built the first time it is toggled
+        self.gaming_tab = None
+        self.gaming_tab_label = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        icon = Gtk.Image.new_from_icon_name("input-gaming", Gtk.IconSize.MENU)
+        label = Gtk.Label(label=_("Gaming"))
+        self.gaming_tab_label.pack_start(icon, False, False, 0)
+        self.gaming_tab_label.pack_start(label, False, False, 0)
+        self.gaming_tab_label.show_all()
+        self.gaming_tab_added = False
+        
+        print("✅ All tabs created successfully")
+    
+    def _build_tab(self, tab_name, tab_class, icon_name):
+        """Construct the content widget of a tab."""
+        if tab_class == "WelcomeTab":
+            from .tabs.welcome_tab import WelcomeTab
+            tab_content = WelcomeTab(self.i18n_manager, self.theme_manager, self.application.assets_path,
+                                     on_gaming_activate=self._toggle_gaming_tab)
+        elif tab_class == "SoftwareTab":
+            from .tabs.software_tab import SoftwareTab
+            tab_content = SoftwareTab(
+                self.i18n_manager, 
+                self.theme_manager, 
+                self.environment_detector,
+                self,  # parent_window for progress access
+                self.progress_bar,
+                self.progress_label
+            )
+        elif tab_class == "RecommendedTab":
+            from .tabs.recommended_tab import RecommendedTab
+            self.recommended_tab = RecommendedTab(
+                self.i18n_manager, 
+                self.theme_manager,
+                self,  # parent_window
+                self.progress_bar,
+                self.progress_label
+            )
+            tab_content = self.recommended_tab
+        elif tab_class == "DriversTab":
+            from .tabs.drivers_tab import DriversTab
+            tab_content = DriversTab(
                 self.i18n_manager,
                 self.theme_manager,
-                self,
+                self.environment_detector,
+                self,  # parent_window
                 self.progress_bar,
                 self.progress_label
             )
-            self.gaming_tab_label = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
-            icon = Gtk.Image.new_from_icon_name("input-gaming", Gtk.IconSize.MENU)
-            label = Gtk.Label(label=_("Gaming"))
-            self.gaming_tab_label.pack_start(icon, False, False, 0)
-            self.gaming_tab_label.pack_start(label, False, False, 0)
-            self.gaming_tab_label.show_all()
-            self.gaming_tab_added = False
-        except Exception as e:
-            print(f"Error creating GamingTab: {e}")
-            self.gaming_tab = None
-            self.gaming_tab_label = None
-            self.gaming_tab_added = False
+        elif tab_class == "KernelsTab":
+            from .tabs.kernels_tab import KernelsTab
+            tab_content = KernelsTab(
+                self.i18n_manager,
+                self.theme_manager,
+                self,  # parent_window
+                self.progress_bar,
+                self.progress_label
+            )
+        elif tab_class == "SecurityTab":
+            from .tabs.security_tab import SecurityTab
+            tab_content = SecurityTab(
+                self.i18n_manager,
+                self.theme_manager,
+                self,  # parent_window
+                self.progress_bar,
+                self.progress_label
+            )
+        elif tab_class == "CustomizationTab":
+            from .tabs.customization_tab import CustomizationTab
+            tab_content = CustomizationTab(
+                self.i18n_manager, 
+                self.theme_manager,
+                self.environment_detector
+            )
+        else:
+            # Create placeholder tab for others
+            tab_content = self._create_placeholder_tab(tab_name, tab_class, icon_name)
         
-        print("✅ All tabs created successfully")
+        return tab_content
+    
+    def _on_switch_page(self, notebook, page, page_num):
+        """Build a lazy tab right before it is shown for the first time."""
+        if page in self._lazy_pages:
+            self._build_lazy_page(page)
+    
+    def _build_lazy_page(self, page):
+        """Pack the real tab into its page box. Returns False if already built."""
+        tab_info = self._lazy_pages.pop(page, None)
+        if tab_info is None:
+            return False
+        tab_name, tab_class, icon_name = tab_info
+        try:
+            with get_startup_profiler().phase(tab_class):
+                tab_content = self._build_tab(tab_name, tab_class, icon_name)
+            page.pack_start(tab_content, True, True, 0)
+            tab_content.show_all()
+            print(f"Built tab: {tab_name}")
+        except Exception as e:
+            print(f"Error creating tab {tab_name}: {e}")
+        return True
+    
+    def _on_first_draw(self, widget, cr):
+        """Start prewarming at low priority, below input and redraws."""
+        self.disconnect(self._first_draw_handler)
+        GLib.idle_add(self._prewarm_next_tab, priority=GLib.PRIORITY_LOW)
+        return False
+    
+    def _prewarm_next_tab(self):
+        """Build one queued tab per idle call so input stays responsive."""
+        while self._prewarm_queue:
+            if self._build_lazy_page(self._prewarm_queue.pop(0)):
+                return bool(self._prewarm_queue)
+        return False
     
     def _create_notebook_controls_overlay(self, overlay_container):
         """Create window control buttons as overlay on the notebook."""
@@ -616,6 +685,20 @@ class MainWindow(Gtk.ApplicationWindow):
         while Gtk.events_pending():
             Gtk.main_iteration()
     
+    def _on_queue_changed(self, scheduler):
+        """Show which operations are waiting for a running one."""
+        queued = scheduler.queued()
+        if queued:
+            labels = ", ".join(operation.label for operation in queued)
+            if len(queued) == 1:
+                self.queue_label.set_text(_("1 operation waiting: {}").format(labels))
+            else:
+                self.queue_label.set_text(_("{} operations waiting: {}").format(len(queued), labels))
+            self.queue_label.set_tooltip_text("\n".join(operation.label for operation in queued))
+            self.queue_box.show()
+        else:
+            self.queue_box.hide()
+    
     def hide_progress(self):
         """Hide progress bar."""
         self.progress_revealer.set_reveal_child(False)
@@ -693,8 +776,21 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def _toggle_gaming_tab(self):
         """Toggle the visibility of the hidden Gaming Tab."""
-        if not hasattr(self, 'gaming_tab') or self.gaming_tab is None:
-            return
+        if self.gaming_tab is None:
+            try:
+                from .tabs.gaming_tab import GamingTab
+                with get_startup_profiler().phase("GamingTab"):
+                    self.gaming_tab = GamingTab(
+                        self.i18n_manager,
+                        self.theme_manager,
+                        self,
+                        self.progress_bar,
+                        self.progress_label
+                    )
+            except Exception as e:
+                print(f"Error creating GamingTab: {e}")
+                self.gaming_tab = None
+                return
             
         if self.gaming_tab_added:
             # Remove tab
@@ -8,9 +8,10 @@ import os
 import subprocess
 import threading
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GdkPixbuf, GLib
+from gi.repository import Gtk, GLib
 
 from core.i18n_manager import _
+from utils.icon_cache import get_icon_cache
 
 
 class CustomizationTab(Gtk.ScrolledWindow):
@@ -532,19 +533,10 @@ class CustomizationTab(Gtk.ScrolledWindow):
 
         # Load icon
         icon_path = os.path.join(self.icons_path, icon_filename)
-        try:
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                filename=icon_path,
-                width=64,
-                height=64,
-                preserve_aspect_ratio=True
-            )
-            icon = Gtk.Image.new_from_pixbuf(pixbuf)
-            tool_box.pack_start(icon, False, False, 5)
-        except Exception as e:
-            print(f"Error loading icon {icon_path}: {e}")
+        icon = get_icon_cache().new_image(icon_path, 64)
+        if icon is None:
             icon = Gtk.Image.new_from_icon_name("preferences-desktop", Gtk.IconSize.DIALOG)
-            tool_box.pack_start(icon, False, False, 5)
+        tool_box.pack_start(icon, False, False, 5)
 
         # Add title label (bold)
         title_label = Gtk.Label()
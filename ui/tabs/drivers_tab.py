@@ -13,6 +13,9 @@ from gi.repository import Gtk, GLib
 from core.i18n_manager import _
 from config.paths import ASSETS_DIR
 from utils.command_runner import CommandRunner
+from utils.package_index import get_package_index
+from utils.flatpak_index import get_flatpak_index
+from utils.pci_devices import list_pci_devices, is_display_device, is_wireless_device, VENDOR_NVIDIA
 
 
 # Compatibility patch for NVIDIA DKMS sources on Soplos kernel 7.x.
@@ -730,7 +733,7 @@ class DriversTab(Gtk.ScrolledWindow):
 
         Strategy 1 — sysfs: works when the interface is up and driver loaded normally.
         Strategy 2 — iw dev: works when the interface is down but module is loaded.
-        Strategy 3 — lspci -k: works even when the module is NOT loaded (broken state
+        Strategy 3 — PCI modalias: works even when the module is NOT loaded (broken state
                      after reboot), which is exactly the case this button is meant to fix.
         Returns (iface_or_None, driver) — driver is always set if hardware is found.
         """
@@ -764,28 +767,17 @@ class DriversTab(Gtk.ScrolledWindow):
         except Exception:
             pass
 
-        # Strategy 3: lspci -k — detects the module even when not loaded
+        # Strategy 3: PCI device modalias matched against modules.alias — the
+        # same lookup as lspci -k, it finds the module even when not loaded.
         # This is the critical fallback for the "no WiFi after reboot" case
         try:
-            result = subprocess.run(['lspci', '-k'], capture_output=True, text=True)
-            lines = result.stdout.splitlines()
-            in_wifi = False
-            for line in lines:
-                lower = line.lower()
-                if any(k in lower for k in ('network controller', 'wireless', 'wifi', 'wi-fi')):
-                    in_wifi = True
-                elif line and not line.startswith('\t') and not line.startswith(' '):
-                    in_wifi = False
-                if in_wifi:
-                    if 'kernel modules:' in lower:
-                        modules = line.split(':', 1)[1].strip().split(',')
-                        driver = modules[0].strip()
-                        if driver:
-                            return None, driver
-                    elif 'kernel driver in use:' in lower:
-                        driver = line.split(':', 1)[1].strip()
-                        if driver:
-                            return None, driver
+            for device in list_pci_devices(with_modules=True):
+                if not is_wireless_device(device):
+                    continue
+                if device['driver']:
+                    return None, device['driver']
+                if device['modules']:
+                    return None, device['modules'][0]
         except Exception:
             pass
 
@@ -898,11 +890,8 @@ echo "Wi-Fi repair completed. Driver: {driver}"
         is absent, and demanding it made this return False forever, so the
         button never showed the stack as installed.
         """
-        return (
-            self._is_package_installed('firmware-amd-graphics') and
-            self._is_package_installed('libgl1-mesa-dri') and
-            self._is_package_installed('mesa-vulkan-drivers')
-        )
+        required = ['firmware-amd-graphics', 'libgl1-mesa-dri', 'mesa-vulkan-drivers']
+        return len(get_package_index().snapshot().installed_many(required)) == len(required)
 
     def _is_module_loaded(self, *module_names):
         """Return True if any of the given kernel modules are currently loaded."""
@@ -917,14 +906,7 @@ echo "Wi-Fi repair completed. Driver: {driver}"
 
     def _is_package_installed(self, package):
         """Check if a dpkg package is installed."""
-        try:
-            result = subprocess.run(
-                ['dpkg', '-s', package],
-                capture_output=True, text=True
-            )
-            return 'Status: install ok installed' in result.stdout
-        except Exception:
-            return False
+        return get_package_index().is_installed(package)
 
     def _get_nvidia_active_version(self):
         """Return major version string of active NVIDIA driver (e.g. '590'), or None."""
@@ -942,22 +924,13 @@ echo "Wi-Fi repair completed. Driver: {driver}"
             pass
         # Fallback: scan dpkg only if NVIDIA hardware is present (e.g. first boot with nouveau)
         try:
-            lspci = subprocess.run(['lspci'], capture_output=True, text=True)
-            if not any(k in lspci.stdout for k in ('NVIDIA', 'GeForce', 'Quadro', 'Tesla')):
+            if not any(d['vendor_id'] == VENDOR_NVIDIA and is_display_device(d)
+                       for d in list_pci_devices()):
                 return None
         except Exception:
             return None
-        try:
-            import re
-            result = subprocess.run(['dpkg', '-l'], capture_output=True, text=True)
-            for line in result.stdout.split('\n'):
-                if not line.startswith('ii'):
-                    continue
-                parts = line.split()
-                if len(parts) >= 2 and re.fullmatch(r'nvidia-driver-(\d+)', parts[1]):
-                    return re.search(r'\d+', parts[1]).group()
-        except Exception:
-            pass
+        for name in get_package_index().snapshot().installed_matching(r'nvidia-driver-\d+$'):
+            return name.rsplit('-', 1)[1]
         return None
 
     def _apply_driver_state(self, key, installed):
@@ -1783,9 +1756,7 @@ echo "IMPORTANT: Restart the system to apply the changes."
     def _is_flatpak_installed(self, flatpak_id):
         """Check if a Flatpak app is installed."""
         try:
-            result = subprocess.run(['flatpak', 'info', flatpak_id],
-                                    capture_output=True, text=True)
-            return result.returncode == 0
+            return get_flatpak_index().is_installed(flatpak_id)
         except Exception:
             return False
 
@@ -1848,15 +1819,22 @@ echo "IMPORTANT: Restart the system to apply the changes."
                 btn.connect('clicked', install_cb)
                 parent_box.pack_start(btn, False, False, 2)
 
-        def show_results(results):
-            self.progress_bar.set_fraction(0.0)
+        dialog = None
+        slots = {}
+
+        def _on_dialog_destroy(widget):
+            # Results still arriving after the user closed the dialog are dropped
+            slots.clear()
 
+        def _open_dialog():
+            nonlocal dialog
             dialog = Gtk.Dialog(
                 title=_("Hardware Detection"),
                 parent=self.parent_window,
                 flags=0
             )
             dialog.set_default_size(700, 650)
+            dialog.connect('destroy', _on_dialog_destroy)
 
             scrolled = Gtk.ScrolledWindow()
             scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
@@ -1869,10 +1847,32 @@ echo "IMPORTANT: Restart the system to apply the changes."
             main_box.set_margin_bottom(10)
             scrolled.add(main_box)
 
-            # ── CPU ──
-            if results.get('cpu'):
+            # One slot per section in display order, so the sections keep
+            # their place whatever order the detectors finish in. Slots stay
+            # hidden until filled so empty ones take no spacing.
+            for key in section_builders:
+                slot = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+                slot.set_no_show_all(True)
+                main_box.pack_start(slot, False, False, 0)
+                slots[key] = slot
+
+            # ── Close button ──
+            close_btn = Gtk.Button(label=_("Close"))
+            close_btn.connect("clicked", lambda x: dialog.destroy())
+            btn_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+            btn_row.set_halign(Gtk.Align.END)
+            btn_row.set_margin_top(8)
+            btn_row.set_margin_bottom(10)
+            btn_row.set_margin_end(10)
+            btn_row.pack_start(close_btn, False, False, 0)
+            dialog.get_content_area().pack_start(btn_row, False, False, 0)
+
+            dialog.show_all()
+
+        # ── CPU ──
+        def _show_cpu(slot, cpu):
+            if cpu:
                 frame, box = _make_frame(_('Processor'))
-                cpu = results['cpu']
                 lbl = Gtk.Label()
                 lbl.set_markup(
                     f"<b>{_('Model:')}</b> {cpu.get('model', 'N/A')}\n"
@@ -1882,12 +1882,12 @@ echo "IMPORTANT: Restart the system to apply the changes."
                 lbl.set_xalign(0)
                 lbl.set_line_wrap(True)
                 box.pack_start(lbl, False, False, 0)
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── RAM ──
-            if results.get('memory'):
+        # ── RAM ──
+        def _show_memory(slot, mem):
+            if mem:
                 frame, box = _make_frame(_('RAM Memory'))
-                mem = results['memory']
                 lbl = Gtk.Label()
                 lbl.set_markup(
                     f"<b>{_('Total:')}</b> {mem.get('total', '?')}  "
@@ -1895,10 +1895,10 @@ echo "IMPORTANT: Restart the system to apply the changes."
                 )
                 lbl.set_xalign(0)
                 box.pack_start(lbl, False, False, 0)
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── VM ──
-            vm = results.get('vm_detection', {})
+        # ── VM ──
+        def _show_vm(slot, vm):
             if vm.get('is_vm'):
                 frame, box = _make_frame(_("Virtual Machine"))
                 lbl = Gtk.Label()
@@ -1930,10 +1930,11 @@ echo "IMPORTANT: Restart the system to apply the changes."
                         _install_vm,
                         _uninstall_vm
                     )
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── GPUs ──
-            for gpu in results.get('gpus', []):
+        # ── GPUs ──
+        def _show_gpus(slot, gpus):
+            for gpu in gpus:
                 title = f"{_('Graphics Card')} — {gpu.get('vendor', '?')} {gpu.get('model', '')}"
                 frame, box = _make_frame(title)
 
@@ -1965,10 +1966,10 @@ echo "IMPORTANT: Restart the system to apply the changes."
                         _install_gpu,
                         _uninstall_gpu if gpu.get('vendor') == 'NVIDIA' else None
                     )
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── Hybrid Graphics ──
-            hybrid = results.get('hybrid_gpu', {})
+        # ── Hybrid Graphics ──
+        def _show_hybrid_gpu(slot, hybrid):
             if hybrid.get('is_hybrid'):
                 frame, box = _make_frame(_('Hybrid Graphics'))
                 lbl = Gtk.Label()
@@ -1993,10 +1994,10 @@ echo "IMPORTANT: Restart the system to apply the changes."
                 btn_box.pack_start(primary_btn, True, True, 0)
 
                 box.pack_start(btn_box, False, False, 4)
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── Wi-Fi ──
-            wifi_list = results.get('wifi', [])
+        # ── Wi-Fi ──
+        def _show_wifi(slot, wifi_list):
             if wifi_list:
                 frame, box = _make_frame(_('Wi-Fi'))
                 for adapter in wifi_list:
@@ -2026,10 +2027,10 @@ echo "IMPORTANT: Restart the system to apply the changes."
                             _install_wifi,
                             _uninstall_wifi
                         )
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── Audio ──
-            audio_list = results.get('audio', [])
+        # ── Audio ──
+        def _show_audio(slot, audio_list):
             if audio_list:
                 frame, box = _make_frame(_('Audio'))
                 for device in audio_list:
@@ -2059,10 +2060,10 @@ echo "IMPORTANT: Restart the system to apply the changes."
                             _install_audio,
                             _uninstall_audio
                         )
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── Bluetooth ──
-            bt = results.get('bluetooth')
+        # ── Bluetooth ──
+        def _show_bluetooth(slot, bt):
             if bt:
                 frame, box = _make_frame(_('Bluetooth'))
                 bt_lbl = Gtk.Label()
@@ -2090,10 +2091,10 @@ echo "IMPORTANT: Restart the system to apply the changes."
                         _install_bt,
                         _uninstall_bt
                     )
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── Printers ──
-            pr = results.get('printers')
+        # ── Printers ──
+        def _show_printers(slot, pr):
             if pr:
                 frame, box = _make_frame(_('Printers'))
                 pr_lbl = Gtk.Label()
@@ -2121,22 +2122,24 @@ echo "IMPORTANT: Restart the system to apply the changes."
                         _install_pr,
                         _uninstall_pr
                     )
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── Storage ──
-            if results.get('storage'):
+        # ── Storage ──
+        def _show_storage(slot, storage):
+            if storage:
                 frame, box = _make_frame(_('Storage'))
-                for device in results['storage']:
+                for device in storage:
                     lbl = Gtk.Label()
                     lbl.set_markup(f"• <b>{device.get('name', '?')}:</b> {device.get('size', '?')}")
                     lbl.set_xalign(0)
                     box.pack_start(lbl, False, False, 0)
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── Network ──
-            if results.get('network'):
+        # ── Network ──
+        def _show_network(slot, network):
+            if network:
                 frame, box = _make_frame(_('Network'))
-                for iface in results['network']:
+                for iface in network:
                     text = f"• <b>{iface.get('name', '?')}:</b> {iface.get('type', '?')}"
                     if iface.get('status'):
                         text += f" — {iface['status']}"
@@ -2144,10 +2147,10 @@ echo "IMPORTANT: Restart the system to apply the changes."
                     lbl.set_markup(text)
                     lbl.set_xalign(0)
                     box.pack_start(lbl, False, False, 0)
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
 
-            # ── Unnecessary software ──
-            unnecessary = results.get('unnecessary_software', [])
+        # ── Unnecessary software ──
+        def _show_unnecessary_software(slot, unnecessary):
             if unnecessary:
                 frame, box = _make_frame(_('Unnecessary Software Detected'))
 
@@ -2185,22 +2188,43 @@ echo "IMPORTANT: Restart the system to apply the changes."
                     unin_btn = Gtk.Button(label=_("Uninstall"))
                     unin_btn.connect('clicked', _uninstall_unnecessary)
                     box.pack_start(unin_btn, False, False, 2)
-                main_box.pack_start(frame, False, False, 0)
+                slot.pack_start(frame, False, False, 0)
+
+        section_builders = {
+            'cpu': _show_cpu,
+            'memory': _show_memory,
+            'vm_detection': _show_vm,
+            'gpus': _show_gpus,
+            'hybrid_gpu': _show_hybrid_gpu,
+            'wifi': _show_wifi,
+            'audio': _show_audio,
+            'bluetooth': _show_bluetooth,
+            'printers': _show_printers,
+            'storage': _show_storage,
+            'network': _show_network,
+            'unnecessary_software': _show_unnecessary_software,
+        }
 
-            # ── Close button ──
-            close_btn = Gtk.Button(label=_("Close"))
-            close_btn.connect("clicked", lambda x: dialog.destroy())
-            btn_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-            btn_row.set_halign(Gtk.Align.END)
-            btn_row.set_margin_top(8)
-            btn_row.set_margin_bottom(10)
-            btn_row.set_margin_end(10)
-            btn_row.pack_start(close_btn, False, False, 0)
-            dialog.get_content_area().pack_start(btn_row, False, False, 0)
+        def show_result(key, value):
+            """Add one detector's result to the dialog as soon as it arrives."""
+            builder = section_builders.get(key)
+            if builder is None:
+                return
+            if dialog is None:
+                _open_dialog()
+            slot = slots.get(key)
+            if slot is None:
+                return
+            builder(slot, value)
+            slot.set_no_show_all(False)
+            slot.show_all()
 
-            dialog.show_all()
+        def show_results(results):
+            self.progress_bar.set_fraction(0.0)
+            if dialog is None:
+                _open_dialog()
 
-        scan_hardware(update_status, update_progress, show_results)
+        scan_hardware(update_status, update_progress, show_results, show_result)
     
     def _on_install_recommended_driver(self, button, driver, dialog):
         """Install recommended driver from hardware scan."""
@@ -5,12 +5,20 @@ Hidden easter egg tab with gaming optimizations and tools.
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GdkPixbuf, Pango, GLib
+from gi.repository import Gtk, Pango, GLib
 
 from config.paths import ICONS_DIR
+from config.software import get_launchers
 from core.i18n_manager import _
 from utils.command_runner import CommandRunner
-import subprocess
+from utils.package_index import get_package_index
+from utils.flatpak_index import get_flatpak_index
+from utils.icon_cache import get_icon_cache
+from utils.package_watcher import get_package_watcher
+from utils.pci_devices import (
+    list_pci_devices, describe_device, is_display_device,
+    VENDOR_NVIDIA, VENDOR_AMD, VENDOR_INTEL
+)
 import os
 
 class GamingTab(Gtk.Box):
@@ -31,6 +39,9 @@ class GamingTab(Gtk.Box):
         # Cache for launcher installation status
         self.launcher_status_cache = {}
         
+        # Launcher name -> (button box, launcher) of each built launcher widget
+        self.launcher_rows = {}
+        
         # RGB Theme state
         self.rgb_theme_active = False
         self.rgb_css_provider = None
@@ -45,6 +56,11 @@ class GamingTab(Gtk.Box):
         self._create_ui()
         self.show_all()
         
+        # Pick up installs and removals made outside this tab
+        watcher = get_package_watcher()
+        handler_id = watcher.connect('packages-changed', self._on_packages_changed)
+        self.connect('destroy', lambda *args: watcher.disconnect(handler_id))
+        
     def _create_ui(self):
         """Create the user interface."""
         # Scrollable area
@@ -163,10 +179,7 @@ class GamingTab(Gtk.Box):
         
         if icon_name.endswith('.png'):
             try:
-                icon_path = os.path.join(ICONS_DIR, icon_name)
-                if os.path.exists(icon_path):
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(icon_path, 32, 32, True)
-                    icon = Gtk.Image.new_from_pixbuf(pixbuf)
+                icon = get_icon_cache().load_image(os.path.join(ICONS_DIR, icon_name), 32)
             except Exception as e:
                 print(f"Error loading icon {icon_name}: {e}")
         
@@ -261,13 +274,9 @@ class GamingTab(Gtk.Box):
     
     def _install_cpu_power(self):
         """Install or remove CPU Power tools."""
-        import subprocess
         import os
 
-        is_installed = subprocess.run(
-            ["dpkg-query", "-W", "-f=${Status}", "cpupower-gui"],
-            capture_output=True, text=True
-        ).stdout.strip() == "install ok installed"
+        is_installed = get_package_index().is_installed("cpupower-gui")
 
         if is_installed:
             dialog = Gtk.MessageDialog(
@@ -938,50 +947,21 @@ echo "Sysctl tweaks applied successfully!"
     
     def _optimize_gpu(self):
         """Optimize GPU drivers for gaming."""
-        import subprocess
         import os
         from config.paths import BASE_DIR
         
-        # Detect GPU using lspci
-        try:
-            lspci_output = subprocess.check_output(['lspci'], universal_newlines=True)
-        except subprocess.CalledProcessError:
-            error_dialog = Gtk.MessageDialog(
-                transient_for=self.parent_window,
-                flags=0,
-                message_type=Gtk.MessageType.ERROR,
-                buttons=Gtk.ButtonsType.OK,
-                text=_("GPU Detection Failed")
-            )
-            error_dialog.format_secondary_text(_("Could not detect GPU. Please install 'pciutils' package."))
-            error_dialog.run()
-            error_dialog.destroy()
-            return
-        
-        # Determine GPU vendor(s) - detect ALL GPUs for hybrid detection
+        # Determine GPU vendor(s) - detect ALL GPUs for hybrid detection.
+        # Matching on the PCI vendor ID keeps virtual GPUs out without
+        # guessing from the device name.
         gpus = []
+        gpu_vendors = {VENDOR_NVIDIA: 'nvidia', VENDOR_AMD: 'amd', VENDOR_INTEL: 'intel'}
         
-        for line in lspci_output.lower().split('\n'):
-            # Only process VGA/3D/Display controller lines
-            if not ('vga' in line or '3d' in line or 'display' in line):
+        for device in list_pci_devices():
+            if not is_display_device(device):
                 continue
-            
-            # Check for NVIDIA
-            if 'nvidia' in line:
-                model = line.split(':')[-1].strip().title()
-                gpus.append(('nvidia', model))
-            # Check for AMD - be specific to avoid VM false positives
-            elif 'amd' in line and ('radeon' in line or 'rx ' in line or 'hd ' in line or 'r5' in line or 'r7' in line):
-                model = line.split(':')[-1].strip().title()
-                gpus.append(('amd', model))
-            # Check for ATI with word boundaries
-            elif ' ati ' in line or line.startswith('ati '):
-                model = line.split(':')[-1].strip().title()
-                gpus.append(('amd', model))
-            # Check for Intel
-            elif 'intel' in line:
-                model = line.split(':')[-1].strip().title()
-                gpus.append(('intel', model))
+            vendor = gpu_vendors.get(device['vendor_id'])
+            if vendor:
+                gpus.append((vendor, describe_device(device)))
         
         if not gpus:
             error_dialog = Gtk.MessageDialog(
@@ -1791,172 +1771,6 @@ done
 
     def _create_launchers_section(self, parent):
         """Create launchers section with install buttons and badges."""
-        # Define launchers locally (NOT from config/software.py to avoid duplicates in recommended tab)
-        self.launchers_data = [
-            {
-                'name': 'Steam',
-                'package': None,
-                'flatpak': 'com.valvesoftware.Steam',
-                'icon': 'steam.png',
-                'description': _('Digital distribution platform for video games'),
-                'official': False
-            },
-            {
-                'name': 'Lutris',
-                'package': 'lutris',
-                'flatpak': 'net.lutris.Lutris',
-                'icon': 'lutris.png',
-                'description': _('Unified platform for managing games on Linux'),
-                'official': True
-            },
-            {
-                'name': 'Heroic Games Launcher',
-                'package': None,
-                'flatpak': 'com.heroicgameslauncher.hgl',
-                'icon': 'heroic.png',
-                'description': _('Launcher for Epic, GOG and Amazon Games'),
-                'official': False
-            },
-            {
-                'name': 'Bottles',
-                'package': None,
-                'flatpak': 'com.usebottles.bottles',
-                'icon': 'bottles.png',
-                'description': _('Run Windows applications on Linux using Wine'),
-                'official': False
-            },
-            {
-                'name': 'R2ModMan',
-                'package': 'r2modman',
-                'deb_url': 'https://github.com/ebkr/r2modmanPlus/releases/download/v3.2.11/r2modman_3.2.11_amd64.deb',
-                'icon': 'r2modman.png',
-                'description': _('Mod manager for Lethal Company, Valheim and more'),
-                'official': False
-            },
-            {
-                'name': 'Vinegar (Roblox)',
-                'package': None,
-                'flatpak': 'org.vinegarhq.Vinegar',
-                'icon': 'vinegar.png',
-                'description': _('Modern launcher for playing Roblox on Linux'),
-                'official': False
-            },
-            {
-                'name': 'Sober',
-                'package': None,
-                'flatpak': 'org.vinegarhq.Sober',
-                'icon': 'sober.png',
-                'description': _('Roblox client for Linux'),
-                'official': False
-            },
-            {
-                'name': 'Prism Launcher',
-                'package': None,
-                'flatpak': 'org.prismlauncher.PrismLauncher',
-                'icon': 'prism.png',
-                'description': _('Custom launcher for Minecraft'),
-                'official': False
-            },
-            {
-                'name': 'Itch.io',
-                'package': None,
-                'flatpak': 'io.itch.itch',
-                'icon': 'itch-io.png',
-                'description': _('Indie game distribution platform'),
-                'official': False
-            },
-            {
-                'name': 'Minigalaxy',
-                'package': 'minigalaxy',
-                'flatpak': 'io.github.sharkwouter.Minigalaxy',
-                'icon': 'gog.png',
-                'description': _('Simple client for GOG.com'),
-                'official': True
-            },
-            {
-                'name': 'RetroArch',
-                'package': 'retroarch',
-                'flatpak': 'org.libretro.RetroArch',
-                'icon': 'retroarch.png',
-                'description': _('Frontend for emulators and game engines'),
-                'official': True
-            },
-            {
-                'name': 'ES-DE',
-                'package': None,
-                'flatpak': None,
-                'icon': 'ES-DE.png',
-                'description': _('Frontend for emulators with a modern interface'),
-                'official': False,
-                'check_path': '~/AppImages/ES-DE_x64.AppImage',
-                'install_commands': [
-                    'mkdir -p "$HOME/AppImages/.icons"',
-                    'wget -q -O "$HOME/AppImages/ES-DE_x64.AppImage" "https://gitlab.com/es-de/emulationstation-de/-/package_files/246875981/download"',
-                    'chmod +x "$HOME/AppImages/ES-DE_x64.AppImage"',
-                    f'cp {os.path.join(ICONS_DIR, "gaming", "ES-DE.png")} "$HOME/AppImages/.icons/ES-DE.png"',
-                    'mkdir -p "$HOME/.local/share/applications"',
-                    "printf '[Desktop Entry]\\nName=ES-DE\\nExec='\"$HOME\"'/AppImages/ES-DE_x64.AppImage\\nIcon='\"$HOME\"'/AppImages/.icons/ES-DE.png\\nType=Application\\nCategories=Game;\\nComment=Frontend for emulators with a modern interface\\n' > \"$HOME/.local/share/applications/es-de.desktop\""
-                ],
-                'uninstall_commands': [
-                    'rm -f "$HOME/AppImages/ES-DE_x64.AppImage"',
-                    'rm -f "$HOME/AppImages/.icons/ES-DE.png"',
-                    'rm -f "$HOME/.local/share/applications/es-de.desktop"'
-                ]
-            },
-            {
-                'name': 'Moonlight',
-                'package': None,
-                'flatpak': 'com.moonlight_stream.Moonlight',
-                'icon': 'moonlight.png',
-                'description': _('NVIDIA GameStream/Sunshine streaming client'),
-                'official': False
-            },
-            {
-                'name': 'Chiaki (PS4/PS5)',
-                'package': None,
-                'flatpak': 'io.github.streetpea.Chiaki4deck',
-                'icon': 'chiaki.png',
-                'description': _('PlayStation Remote Play client (HDR version)'),
-                'official': False
-            },
-            {
-                'name': 'Discord',
-                'package': None,
-                'flatpak': 'com.discordapp.Discord',
-                'icon': 'discord.png',
-                'description': _('Communication platform for gaming communities'),
-                'official': False
-            },
-            {
-                'name': 'ProtonUp-Qt',
-                'package': None,
-                'flatpak': 'net.davidotek.pupgui2',
-                'icon': 'protonup.png',
-                'description': _('Install and manage GE-Proton, Wine-GE and more for Steam and Lutris'),
-                'official': False
-            },
-            {
-                'name': 'PPSSPP',
-                'package': None,
-                'flatpak': 'org.ppsspp.PPSSPP',
-                'icon': 'ppsspp.png',
-                'description': _('PSP emulator with high-quality rendering'),
-                'official': False,
-                'post_install_script': 'ppsspp-lutris-runner.sh'
-            },
-            {
-                'name': 'GeForce NOW',
-                'package': None,
-                'flatpak': None,
-                'icon': 'geforcenow.png',
-                'description': _('NVIDIA cloud gaming — stream games from the cloud'),
-                'official': False,
-                'webapp_url': 'https://play.geforcenow.com/',
-                'webapp_id': 'geforcenow-play',
-                'webapp_icon': os.path.join(ICONS_DIR, 'gaming', 'geforcenow.png'),
-            }
-        ]
-
         # Section Frame
         section_frame = Gtk.Frame()
         section_frame.set_label_align(0.02, 0.5)
@@ -1987,7 +1801,12 @@ done
         # Clear existing children
         for child in self.launchers_grid.get_children():
             self.launchers_grid.remove(child)
+        self.launcher_rows = {}
             
+        # Launchers are their own list in the catalog, apart from its
+        # categories, so they do not show up again in the Recommended tab
+        self.launchers_data = get_launchers()
+        
         # Add launcher widgets (2 columns)
         row = 0
         col = 0
@@ -2074,6 +1893,17 @@ done
         # Button
         button_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         button_box.set_valign(Gtk.Align.CENTER)
+        self._fill_launcher_button(button_box, launcher)
+        self.launcher_rows[launcher['name']] = (button_box, launcher)
+        box.pack_start(button_box, False, False, 0)
+        
+        return box
+    
+    def _fill_launcher_button(self, button_box, launcher):
+        """(Re)build the install/uninstall button of a launcher row for its
+        current state."""
+        for child in button_box.get_children():
+            child.destroy()
         
         if self._is_launcher_installed(launcher):
             button = Gtk.Button.new_with_label(_("Uninstall"))
@@ -2087,9 +1917,7 @@ done
             button.connect('clicked', self._on_install_launcher, launcher)
         
         button_box.pack_start(button, False, False, 0)
-        box.pack_start(button_box, False, False, 0)
-        
-        return box
+        button.show()
     
     def _load_launcher_icon(self, icon_name):
         """Load launcher icon."""
@@ -2103,11 +1931,7 @@ done
             else:
                 icon_path = os.path.join(ICONS_DIR, 'gaming', icon_name)
             
-            if os.path.exists(icon_path):
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    icon_path, 48, 48, True
-                )
-                return Gtk.Image.new_from_pixbuf(pixbuf)
+            return get_icon_cache().load_image(icon_path, 48)
         except Exception as e:
             print(f"Error loading launcher icon {icon_name}: {e}")
         
@@ -2233,18 +2057,9 @@ echo "WebApp {name} created."
         
         try:
             if (method == 'apt' or method == 'deb_url') and launcher.get('package'):
-                result = subprocess.run(
-                    ['dpkg', '-s', launcher['package']],
-                    capture_output=True, text=True
-                )
-                is_installed = 'Status: install ok installed' in result.stdout
+                is_installed = get_package_index().is_installed(launcher['package'])
             elif method == 'flatpak' and launcher.get('flatpak'):
-                # Use flatpak info which returns 0 if installed, 1 if not
-                result = subprocess.run(
-                    ['flatpak', 'info', launcher['flatpak']],
-                    capture_output=True, text=True
-                )
-                is_installed = result.returncode == 0
+                is_installed = get_flatpak_index().is_installed(launcher['flatpak'])
         except:
             pass
         
@@ -2261,18 +2076,18 @@ echo "WebApp {name} created."
             command = self._build_webapp_install_command(launcher)
             script_name = f"install-webapp-{launcher['webapp_id']}.sh"
         elif method == 'apt' and launcher.get('package'):
-            command = f"pkexec apt install -y {launcher['package']}"
-            script_name = f"install-{launcher['package']}.sh"
+            self.command_runner.run_apt(['install', '-y', launcher['package']],
+                                        lambda: self._on_launcher_operation_complete(launcher),
+                                        label=launcher['name'])
+            return
         elif method == 'deb_url' and launcher.get('deb_url'):
-            # Download and install local deb with dependency handling
-            filename = f"/tmp/{launcher['package']}.deb"
-            # Use dpkg -i and fix broken dependencies if needed
-            command = (
-                f"wget -O {filename} {launcher['deb_url']} && "
-                f"pkexec bash -c 'dpkg -i {filename} || apt-get install -f -y' && "
-                f"rm -f {filename}"
+            # apt resolves the local deb's dependencies itself
+            self.command_runner.run_deb_install(
+                [(launcher['deb_url'], launcher['package'], launcher.get('deb_sha256'))],
+                lambda: self._on_launcher_operation_complete(launcher),
+                label=launcher['name']
             )
-            script_name = f"install-{launcher['package']}.sh"
+            return
         elif method == 'flatpak' and launcher.get('flatpak'):
             # Standard install (matches recommended tab behavior)
             command = f"flatpak install -y flathub {launcher['flatpak']}"
@@ -2299,13 +2114,11 @@ echo "WebApp {name} created."
                 f"update-desktop-database ~/.local/share/applications 2>/dev/null || true"
             )
             script_name = f"uninstall-webapp-{wid}.sh"
-        elif method == 'apt' and launcher.get('package'):
-            command = f"pkexec apt remove -y {launcher['package']}"
-            script_name = f"uninstall-{launcher['package']}.sh"
-
-        elif method == 'deb_url' and launcher.get('package'):
-            command = f"pkexec apt remove -y {launcher['package']}"
-            script_name = f"uninstall-{launcher['package']}.sh"
+        elif method in ('apt', 'deb_url') and launcher.get('package'):
+            self.command_runner.run_apt(['remove', '-y', launcher['package']],
+                                        lambda: self._on_launcher_operation_complete(launcher),
+                                        label=launcher['name'])
+            return
         elif method == 'flatpak' and launcher.get('flatpak'):
             # Standard uninstall (matches recommended tab behavior exactly)
             command = f"flatpak uninstall -y {launcher['flatpak']}"
@@ -2342,7 +2155,8 @@ echo "WebApp {name} created."
             # Run and refresh on complete
             self.command_runner.run_command(
                 final_command,
-                lambda: self._on_launcher_operation_complete(launcher)
+                lambda: self._on_launcher_operation_complete(launcher),
+                label=launcher['name']
             )
         except Exception as e:
             print(f"Error running launcher script: {e}")
@@ -2352,6 +2166,28 @@ echo "WebApp {name} created."
         self.launcher_status_cache.clear()
         self._populate_launchers_grid()
 
+    def _on_packages_changed(self, watcher, changed):
+        """Re-query and redraw the launchers whose package changed."""
+        names = [launcher['name'] for launcher in self.launchers_data
+                 if launcher.get('package') in changed or f"flatpak:{launcher.get('flatpak')}" in changed]
+        if names:
+            self.update_launcher_rows(names)
+    
+    def update_launcher_rows(self, names):
+        """
+        Re-query the state of the launchers with these names and update only
+        their buttons; the rest of the tab stays as it is. Names that are
+        not launchers are ignored.
+        """
+        for name in names:
+            row = self.launcher_rows.get(name)
+            if row is None:
+                continue
+            self.launcher_status_cache.pop(name, None)
+            button_box, launcher = row
+            self._fill_launcher_button(button_box, launcher)
+        return False
+
     def _on_launcher_operation_complete(self, launcher, is_install=True):
         """Handle launcher operation completion."""
         # Clear cache for this specific launcher
@@ -2373,13 +2209,22 @@ echo "WebApp {name} created."
         self._finish_launcher_complete(launcher)
 
     def _finish_launcher_complete(self, launcher):
-        """Finalize launcher completion: refresh UI and sync tabs."""
-        # Schedule grid refresh on main thread
-        GLib.idle_add(self._populate_launchers_grid)
-
-        # Targeted synchronization with Recommended tab
+        """Finalize launcher completion: update its row and sync tabs."""
+        GLib.idle_add(self._sync_completed_launcher, launcher['name'])
+    
+    def _sync_completed_launcher(self, name):
+        """Update the launcher's row here and in the Recommended tab without
+        rebuilding either page."""
+        self.update_launcher_rows([name])
+        
+        # Other tabs pick up dpkg and Flatpak changes from the watcher;
+        # diff now rather than after its settle delay.
+        get_package_watcher().check_now()
+        
+        # WebApps and AppImages leave no trace the watcher sees
         if self.parent_window and hasattr(self.parent_window, 'recommended_tab') and self.parent_window.recommended_tab:
-            GLib.idle_add(self.parent_window.recommended_tab.refresh)
+            self.parent_window.recommended_tab.update_package_rows([name])
+        return False
     
     def _toggle_rgb_theme(self):
         """Toggle RGB Gaming theme (black with red neon accents)."""
@@ -8,12 +8,13 @@ import os
 import subprocess
 import logging
 gi.require_version('Gtk', '3.0')
-gi.require_version('GdkPixbuf', '2.0')
-from gi.repository import Gtk, GLib, GdkPixbuf
+from gi.repository import Gtk, GLib
 
 from core.i18n_manager import _
 from config.paths import ICONS_DIR
 from utils.command_runner import CommandRunner
+from utils.package_index import get_package_index
+from utils.icon_cache import get_icon_cache
 from utils.hardware_detector import detect_gpu
 
 
@@ -115,13 +116,9 @@ class KernelsTab(Gtk.ScrolledWindow):
         ski_frame.add(ski_row)
 
         ski_icon_path = os.path.join(ICONS_DIR, "kernels", "org.soplos.kernel-installer.png")
-        if os.path.exists(ski_icon_path):
-            try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(ski_icon_path, 48, 48, True)
-                ski_icon = Gtk.Image.new_from_pixbuf(pixbuf)
-                ski_row.pack_start(ski_icon, False, False, 0)
-            except Exception:
-                pass
+        ski_icon = get_icon_cache().new_image(ski_icon_path, 48)
+        if ski_icon is not None:
+            ski_row.pack_start(ski_icon, False, False, 0)
 
         ski_info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
         ski_row.pack_start(ski_info_box, True, True, 0)
@@ -400,49 +397,27 @@ class KernelsTab(Gtk.ScrolledWindow):
             logging.error(f"Error detecting CPU vendor: {e}")
             return None
 
+    # Meta-package that marks each kernel flavour as installed
+    KERNEL_PACKAGES = {
+        'liquorix': 'linux-image-liquorix-amd64',
+        'xanmod-v3': 'linux-xanmod-x64v3',
+        'xanmod-v4': 'linux-xanmod-x64v4',
+        'xanmod-edge': 'linux-xanmod-edge-x64v3',
+        'xanmod-lts': 'linux-xanmod-lts-x64v3',
+    }
+
     def _is_microcode_installed(self, vendor):
         """Check if microcode is installed"""
-        try:
-            if vendor == 'intel':
-                result = subprocess.run(['dpkg', '-l', 'intel-microcode'], 
-                                      capture_output=True, text=True)
-                return result.returncode == 0
-            elif vendor == 'amd':
-                result = subprocess.run(['dpkg', '-l', 'amd64-microcode'], 
-                                      capture_output=True, text=True)
-                return result.returncode == 0
-        except Exception as e:
-            logging.error(f"Error checking microcode: {e}")
-            return False
+        if vendor == 'intel':
+            return self._is_package_installed('intel-microcode')
+        elif vendor == 'amd':
+            return self._is_package_installed('amd64-microcode')
         return False
 
     def _is_kernel_installed(self, kernel_type):
         """Check if a specific kernel is installed"""
-        try:
-            if kernel_type == "liquorix":
-                result = subprocess.run(['dpkg', '-l', 'linux-image-liquorix-amd64'], 
-                                      capture_output=True, text=True)
-                return result.returncode == 0
-            elif kernel_type == "xanmod-v3":
-                result = subprocess.run(['dpkg', '-l', 'linux-xanmod-x64v3'], 
-                                      capture_output=True, text=True)
-                return result.returncode == 0
-            elif kernel_type == "xanmod-v4":
-                result = subprocess.run(['dpkg', '-l', 'linux-xanmod-x64v4'], 
-                                      capture_output=True, text=True)
-                return result.returncode == 0
-            elif kernel_type == "xanmod-edge":
-                result = subprocess.run(['dpkg', '-l', 'linux-xanmod-edge-x64v3'], 
-                                      capture_output=True, text=True)
-                return result.returncode == 0
-            elif kernel_type == "xanmod-lts":
-                result = subprocess.run(['dpkg', '-l', 'linux-xanmod-lts-x64v3'], 
-                                      capture_output=True, text=True)
-                return result.returncode == 0
-        except Exception as e:
-            logging.error(f"Error checking kernel {kernel_type}: {e}")
-            return False
-        return False
+        package = self.KERNEL_PACKAGES.get(kernel_type)
+        return bool(package) and self._is_package_installed(package)
 
     def _is_kernel_in_use(self, kernel_type):
         """Check if a kernel is currently in use"""
@@ -588,11 +563,7 @@ class KernelsTab(Gtk.ScrolledWindow):
 
     def _is_package_installed(self, package):
         """Check if a dpkg package is installed"""
-        try:
-            result = subprocess.run(['dpkg', '-s', package], capture_output=True, text=True)
-            return result.returncode == 0 and 'Status: install ok installed' in result.stdout
-        except Exception:
-            return False
+        return get_package_index().is_installed(package)
 
     def _update_kernel_installer_button(self):
         """Update Soplos Kernel Installer button based on installation status"""
@@ -771,18 +742,11 @@ echo "{_('Uninstallation complete.')}"
             # Get current running kernel
             current_kernel = subprocess.check_output(['uname', '-r']).decode().strip()
             
-            # Get all installed kernel image packages
-            result = subprocess.run(
-                ['dpkg', '-l', 'linux-image-*'],
-                capture_output=True, text=True
-            )
-            
-            # Parse installed kernels (ignore meta-packages)
+            # Get all installed kernel image packages (ignore meta-packages)
             meta_patterns = ['linux-image-amd64', 'linux-image-liquorix-amd64', 'linux-image-xanmod', 'linux-image-686']
             installed = []
-            for line in result.stdout.splitlines():
-                if line.startswith('ii') and 'linux-image-' in line:
-                    pkg = line.split()[1]
+            for pkg in sorted(get_package_index().installed_packages()):
+                if pkg.startswith('linux-image-'):
                     if any(pattern in pkg for pattern in meta_patterns) and not any(char.isdigit() for char in pkg):
                         continue
                     installed.append(pkg)
@@ -836,8 +800,7 @@ echo "{_('Uninstallation complete.')}"
             headers_to_remove = []
             for pkg in to_remove:
                 header_pkg = pkg.replace('linux-image-', 'linux-headers-')
-                check = subprocess.run(['dpkg', '-l', header_pkg], capture_output=True, text=True)
-                if check.returncode == 0 and 'ii' in check.stdout:
+                if self._is_package_installed(header_pkg):
                     headers_to_remove.append(header_pkg)
             
             all_to_remove = to_remove + headers_to_remove
@@ -5,18 +5,96 @@ Shows curated applications based on desktop environment and user needs.
 
 import gi
 gi.require_version('Gtk', '3.0')
-gi.require_version('GdkPixbuf', '2.0')
-from gi.repository import Gtk, GdkPixbuf, GLib, Pango
+from gi.repository import Gtk, GLib, Pango
 import threading
-import subprocess
 import os
 import urllib.request
-from pathlib import Path
 
-from config.software import get_all_categories
+from config.software import get_all_categories, get_install_method, get_package_info, find_by_package, find_by_flatpak
 from core.i18n_manager import _
 
 from config.paths import ICONS_DIR
+from utils.package_index import get_package_index
+from utils.flatpak_index import get_flatpak_index
+from utils.icon_cache import get_icon_cache
+from utils.package_watcher import get_package_watcher
+from utils.operation_scheduler import PRIORITY_LOW
+from utils.catalog_search import search_catalog
+from ui.virtual_list import VirtualList, ListItem
+
+# Categories shown by the tab, in order
+RECOMMENDED_CATEGORIES = ['browsers', 'comunications', 'office', 'multimedia', 'graphics', 'developer', 'gaming', 'app_management', 'downloads', 'hardware', 'files']
+
+# Above this many packages the tab shows a virtualized list, which only
+# builds widgets for the rows in view, instead of a widget per package.
+VIRTUALIZE_THRESHOLD = 500
+
+# Fixed row heights of the virtualized list, per item kind
+VIRTUAL_ROW_HEIGHTS = {'header': 44, 'package': 84}
+
+
+class BatchSelection:
+    """
+    Packages picked in batch mode, grouped by install method.
+
+    Each method keeps an insertion-ordered map from the identifier the batch
+    installer needs to the package dict, so adding, removing and membership
+    checks are constant time and the install order is the selection order.
+    """
+
+    METHODS = ('apt', 'flatpak', 'deb', 'custom')
+
+    def __init__(self):
+        self._selected = {method: {} for method in self.METHODS}
+
+    @staticmethod
+    def _key(method: str, package: dict):
+        """Identifier of a package within its method, or None if the package
+        lacks what that method installs from."""
+        if method == 'apt':
+            return package.get('package')
+        if method == 'flatpak':
+            return package.get('flatpak')
+        if method == 'deb':
+            return (package['deb_url'], package['package']) if package.get('deb_url') else None
+        if method == 'custom':
+            if not package.get('install_commands'):
+                return None
+            return package.get('package') or package['name']
+        return None
+
+    def add(self, package: dict, method: str) -> bool:
+        """Select a package. Returns False if it cannot be batch-installed."""
+        key = self._key(method, package)
+        if key is None:
+            return False
+        self._selected[method].setdefault(key, package)
+        return True
+
+    def discard(self, package: dict, method: str):
+        key = self._key(method, package)
+        if key is not None:
+            self._selected[method].pop(key, None)
+
+    def contains(self, package: dict, method: str) -> bool:
+        key = self._key(method, package)
+        return key is not None and key in self._selected[method]
+
+    def keys(self, method: str) -> list:
+        """Identifiers selected for a method, in selection order."""
+        return list(self._selected[method])
+
+    def items(self, method: str) -> list:
+        """(identifier, package) pairs selected for a method, in selection order."""
+        return list(self._selected[method].items())
+
+    def clear(self):
+        for selected in self._selected.values():
+            selected.clear()
+
+    def __len__(self):
+        return sum(len(selected) for selected in self._selected.values())
+
 
 class RecommendedTab(Gtk.Box):
     """Recommended applications tab with curated software selections."""
@@ -39,14 +117,16 @@ class RecommendedTab(Gtk.Box):
         
         # Batch mode state
         self.batch_mode = False
-        self.selected_apt = []
-        self.selected_flatpak = []
-        self.selected_flatpak_packages = {}  # flatpak_id → package dict (for post_install_script lookup)
-        self.selected_deb_urls = []  # List of (url, package_name) tuples
-        self.selected_custom = []  # List of (commands_list, package_name) tuples
+        self.selection = BatchSelection()
         
         # Search state
         self.search_query = ""
+        self.search_scores = None  # (category_id, name) -> score of the current hits, None without a query
+        self.category_sections = []  # (frame, flowbox, child_keys) per built category
+        self.package_rows = {}  # (category_id, name) -> (action box, package) of each built package widget
+        self.no_results_label = None
+        self.virtual_list = None  # VirtualList in virtualized mode, else None
+        self.virtual_query = None  # query the virtualized list was last filled for
         
         self.set_margin_left(20)
         # No right margin on main box - scrollbar should be at window edge
@@ -54,6 +134,11 @@ class RecommendedTab(Gtk.Box):
         self.set_margin_bottom(20)
         
         self._init_ui()
+        
+        # Pick up installs and removals made outside this tab
+        watcher = get_package_watcher()
+        handler_id = watcher.connect('packages-changed', self._on_packages_changed)
+        self.connect('destroy', lambda *args: watcher.disconnect(handler_id))
 
     def _init_ui(self):
         """Initialize the UI."""
@@ -87,22 +172,41 @@ class RecommendedTab(Gtk.Box):
         self.search_entry.set_placeholder_text(_("Search programs..."))
         self.search_entry.set_max_width_chars(30)
         self.search_entry.set_valign(Gtk.Align.CENTER)
+        # search-changed is only emitted once typing pauses (GtkSearchEntry
+        # waits 150 ms), so one filter pass runs per burst of keystrokes.
         self.search_entry.connect('search-changed', self._on_search_changed)
         header_box.pack_end(self.search_entry, False, False, 0)
         
         self.pack_start(header_box, False, False, 0)
         
-        # Scrolled window for content
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_min_content_height(400)
-        
-        # Main content box - right margin to leave space for scrollbar
-        self.content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=15)
-        self.content_box.set_margin_right(20)
-        scrolled.add(self.content_box)
-        
-        self.pack_start(scrolled, True, True, 0)
+        categories = get_all_categories()
+        package_count = sum(len(categories[category_id].get('packages', []))
+                            for category_id in RECOMMENDED_CATEGORIES if category_id in categories)
+        if package_count > VIRTUALIZE_THRESHOLD:
+            # Very large catalogs: one recycled row per visible package
+            self.content_box = None
+            self.virtual_list = VirtualList(VIRTUAL_ROW_HEIGHTS, self._create_virtual_row, self._bind_virtual_row)
+            self.virtual_list.set_min_content_height(400)
+            self.virtual_list.set_margin_right(20)
+            self.pack_start(self.virtual_list, True, True, 0)
+            
+            self.no_results_label = Gtk.Label()
+            self.no_results_label.get_style_context().add_class('dim-label')
+            self.no_results_label.set_margin_top(50)
+            self.no_results_label.set_no_show_all(True)
+            self.pack_start(self.no_results_label, False, False, 0)
+        else:
+            # Scrolled window for content
+            scrolled = Gtk.ScrolledWindow()
+            scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+            scrolled.set_min_content_height(400)
+            
+            # Main content box - right margin to leave space for scrollbar
+            self.content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=15)
+            self.content_box.set_margin_right(20)
+            scrolled.add(self.content_box)
+            
+            self.pack_start(scrolled, True, True, 0)
         
         # Bottom batch action bar (initially hidden)
         self.batch_bar = Gtk.ActionBar()
@@ -140,43 +244,41 @@ class RecommendedTab(Gtk.Box):
     
     def _load_recommended_software(self):
         """Load recommended software categories."""
-        categories = get_all_categories()
+        if self.virtual_list is not None:
+            # Rows are built on demand; only the model needs filling
+            self._apply_search_filter()
+            return
         
-        # Show only selected categories with featured apps
-        recommended_categories = ['browsers', 'comunications', 'office', 'multimedia', 'graphics', 'developer', 'gaming', 'app_management', 'downloads', 'hardware', 'files']
-
+        categories = get_all_categories()
         
-        has_results = False
-        for category_id in recommended_categories:
+        self.category_sections = []
+        self.package_rows = {}
+        for category_id in RECOMMENDED_CATEGORIES:
             if category_id in categories:
                 category_data = categories[category_id]
-                if self._create_category_section(category_id, category_data, featured_only=False):
-                    has_results = True
-        
-        # Show "no results" message if search query is active but nothing matches
-        if self.search_query and not has_results:
-            no_results_label = Gtk.Label()
-            no_results_label.set_markup(f'<span size="12000">{_("No results found for")} "{self.search_query}"</span>')
-            no_results_label.get_style_context().add_class('dim-label')
-            no_results_label.set_margin_top(50)
-            self.content_box.pack_start(no_results_label, True, True, 0)
+                self._create_category_section(category_id, category_data, featured_only=False)
+        
+        # "No results" message, shown by the search filter when nothing matches
+        self.no_results_label = Gtk.Label()
+        self.no_results_label.get_style_context().add_class('dim-label')
+        self.no_results_label.set_margin_top(50)
+        self.no_results_label.set_no_show_all(True)
+        self.content_box.pack_start(self.no_results_label, True, True, 0)
+        
+        self._apply_search_filter()
     
     def _create_category_section(self, category_id: str, category_data: dict, featured_only: bool = False) -> bool:
         """Create a section for a recommended software category.
         
+        Every package gets its widget here, whatever the search query; the
+        search only shows and hides them through the FlowBox filter.
+        
         Returns:
-            bool: True if any packages were shown, False otherwise
+            bool: True if the category has any packages, False otherwise
         """
-        # Filter packages based on search query
         packages = category_data.get('packages', [])
-        if self.search_query:
-            query_lower = self.search_query.lower()
-            packages = [
-                pkg for pkg in packages
-                if query_lower in pkg['name'].lower() or query_lower in pkg.get('description', '').lower()
-            ]
         
-        # Skip category if no packages match
+        # Skip empty categories
         if not packages:
             return False
         
@@ -211,34 +313,221 @@ class RecommendedTab(Gtk.Box):
             self.desc_group = Gtk.SizeGroup(mode=Gtk.SizeGroupMode.VERTICAL)
             self.button_group = Gtk.SizeGroup(mode=Gtk.SizeGroupMode.VERTICAL)
         
-        # Packages grid
-        grid = Gtk.Grid()
-        grid.set_column_spacing(15)
-        grid.set_row_spacing(10)
-        grid.set_column_homogeneous(True)  # Make all columns same width for alignment
-        grid.set_margin_left(15)
-        grid.set_margin_right(15)
-        grid.set_margin_top(10)
-        grid.set_margin_bottom(15)
-        
-        # Add packages to grid (already filtered)
-        row = 0
-        col = 0
-        max_cols = 2
-        
-        for package in packages:
+        # Packages grid: two homogeneous columns, filtered in place by the search
+        flowbox = Gtk.FlowBox()
+        flowbox.set_selection_mode(Gtk.SelectionMode.NONE)
+        flowbox.set_homogeneous(True)  # Make all columns same width for alignment
+        flowbox.set_min_children_per_line(2)
+        flowbox.set_max_children_per_line(2)
+        flowbox.set_column_spacing(15)
+        flowbox.set_row_spacing(10)
+        flowbox.set_margin_left(15)
+        flowbox.set_margin_right(15)
+        flowbox.set_margin_top(10)
+        flowbox.set_margin_bottom(15)
+        
+        # FlowBoxChild -> (catalog position, search key), for filtering and ranking
+        child_keys = {}
+        for position, package in enumerate(packages):
             package_widget = self._create_package_widget(category_id, package)
-            grid.attach(package_widget, col, row, 1, 1)
-            
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+            flowbox.insert(package_widget, -1)
+            child_keys[package_widget.get_parent()] = (position, (category_id, package['name']))
+        flowbox.set_filter_func(self._filter_package_child, child_keys)
+        flowbox.set_sort_func(self._sort_package_children, child_keys)
         
-        frame.add(grid)
+        frame.add(flowbox)
         frame.show_all()
+        # Visibility is driven by the search filter from here on, so a later
+        # show_all() on the tab must not bring back a collapsed category.
+        frame.set_no_show_all(True)
         self.content_box.pack_start(frame, False, False, 0)
+        self.category_sections.append((frame, flowbox, child_keys))
         return True
+
+    def _matches_search(self, category_id: str, package: dict) -> bool:
+        """True if the package matches the current search query."""
+        return self.search_scores is None or (category_id, package['name']) in self.search_scores
+
+    def _filter_package_child(self, child, child_keys):
+        """FlowBox filter: keep the children whose package matches the query."""
+        return self.search_scores is None or child_keys[child][1] in self.search_scores
+
+    def _sort_package_children(self, child1, child2, child_keys):
+        """FlowBox sort: best search hits first, catalog order otherwise."""
+        position1, key1 = child_keys[child1]
+        position2, key2 = child_keys[child2]
+        if self.search_scores is not None:
+            score1 = self.search_scores.get(key1, 0)
+            score2 = self.search_scores.get(key2, 0)
+            if score1 != score2:
+                return -1 if score1 > score2 else 1
+        return position1 - position2
+
+    def _apply_search_filter(self):
+        """Show the packages matching the search query, best matches first,
+        and hide the rest without rebuilding any widget. Categories left
+        without a match are collapsed."""
+        if self.search_query:
+            self.search_scores = {(category_id, package['name']): score
+                                  for score, category_id, package in search_catalog(self.search_query)}
+        else:
+            self.search_scores = None
+        
+        if self.virtual_list is not None:
+            any_visible = self._fill_virtual_list()
+        else:
+            any_visible = self._filter_category_sections()
+        
+        if self.no_results_label is None:
+            return
+        if self.search_scores is not None and not any_visible:
+            escaped_query = GLib.markup_escape_text(self.search_query)
+            self.no_results_label.set_markup(f'<span size="12000">{_("No results found for")} "{escaped_query}"</span>')
+            self.no_results_label.show()
+        else:
+            self.no_results_label.hide()
+    
+    def _filter_category_sections(self) -> bool:
+        """Filter and sort the FlowBox of every built category in place.
+        
+        Returns:
+            bool: True if any category is left visible
+        """
+        any_visible = False
+        for frame, flowbox, child_keys in self.category_sections:
+            visible = (self.search_scores is None
+                       or any(key in self.search_scores for _position, key in child_keys.values()))
+            if visible:
+                flowbox.invalidate_filter()
+                flowbox.invalidate_sort()
+            frame.set_visible(visible)
+            any_visible = any_visible or visible
+        return any_visible
+    
+    def _fill_virtual_list(self) -> bool:
+        """Fill the virtualized list with a header per category and the
+        matching packages below it, best matches first.
+        
+        Returns:
+            bool: True if any package is listed
+        """
+        categories = get_all_categories()
+        items = []
+        for category_id in RECOMMENDED_CATEGORIES:
+            if category_id not in categories:
+                continue
+            category_data = categories[category_id]
+            packages = category_data.get('packages', [])
+            if self.search_scores is not None:
+                # sorted() is stable, so ties keep catalog order
+                packages = sorted((package for package in packages if self._matches_search(category_id, package)),
+                                  key=lambda package: -self.search_scores[(category_id, package['name'])])
+            if not packages:
+                continue
+            items.append(ListItem('header', (category_id, category_data)))
+            items.extend(ListItem('package', (category_id, package)) for package in packages)
+        
+        self.virtual_list.set_items(items)
+        if self.search_query != self.virtual_query:
+            self.virtual_query = self.search_query
+            self.virtual_list.scroll_to_top()
+        return bool(items)
+    
+    def _create_virtual_row(self, kind: str) -> Gtk.Widget:
+        """Create an empty row of the virtualized list, filled by _bind_virtual_row()."""
+        if kind == 'header':
+            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+            row.set_margin_left(10)
+            row.set_margin_top(10)
+            row.icon = Gtk.Image()
+            row.pack_start(row.icon, False, False, 0)
+            row.title_label = Gtk.Label()
+            row.title_label.set_halign(Gtk.Align.START)
+            row.pack_start(row.title_label, False, False, 0)
+            return row
+        
+        # Same layout as _create_package_widget(), with every badge in place
+        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        row.set_margin_left(25)
+        row.set_margin_right(10)
+        row.set_margin_top(8)
+        row.set_margin_bottom(8)
+        
+        row.icon = Gtk.Image()
+        row.icon.set_size_request(48, 48)
+        row.pack_start(row.icon, False, False, 0)
+        
+        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        name_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=5)
+        row.name_label = Gtk.Label()
+        row.name_label.set_halign(Gtk.Align.START)
+        name_box.pack_start(row.name_label, False, False, 0)
+        
+        row.flatpak_badge = Gtk.Label()
+        row.flatpak_badge.set_markup(f'<span size="small" foreground="#888888" background="#333333"> {_("Flatpak")} </span>')
+        row.flatpak_badge.set_valign(Gtk.Align.CENTER)
+        name_box.pack_start(row.flatpak_badge, False, False, 0)
+        
+        row.appimage_badge = Gtk.Label()
+        row.appimage_badge.set_markup(f'<span size="small" foreground="#888888" background="#333333"> {_("AppImage")} </span>')
+        row.appimage_badge.set_valign(Gtk.Align.CENTER)
+        name_box.pack_start(row.appimage_badge, False, False, 0)
+        
+        row.official_badge = Gtk.Image.new_from_icon_name("security-high-symbolic", Gtk.IconSize.MENU)
+        row.official_badge.get_style_context().add_class('success-color')
+        row.official_badge.set_tooltip_text(self.i18n_manager._("Official Package"))
+        name_box.pack_start(row.official_badge, False, False, 0)
+        info_box.pack_start(name_box, False, False, 0)
+        
+        row.desc_label = Gtk.Label()
+        row.desc_label.set_halign(Gtk.Align.START)
+        row.desc_label.set_xalign(0)
+        row.desc_label.set_line_wrap(True)
+        row.desc_label.set_lines(2)
+        row.desc_label.set_ellipsize(Pango.EllipsizeMode.END)
+        row.desc_label.get_style_context().add_class('dim-label')
+        info_box.pack_start(row.desc_label, False, False, 0)
+        row.pack_start(info_box, True, True, 0)
+        
+        row.button_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        row.button_box.set_valign(Gtk.Align.CENTER)
+        row.pack_start(row.button_box, False, False, 0)
+        return row
+    
+    def _bind_virtual_row(self, row: Gtk.Widget, item: ListItem):
+        """Show an item of the virtualized list in a (possibly recycled) row."""
+        icon_cache = get_icon_cache()
+        if item.kind == 'header':
+            category_id, category_data = item.data
+            icon_dir = os.path.join(ICONS_DIR, category_id)
+            icon_path = None
+            if category_data.get('icon'):
+                icon_path = os.path.join(icon_dir, category_data['icon'])
+            if not (icon_path and icon_cache.set_image(row.icon, icon_path, 24)):
+                icon_path = icon_cache.first_icon_in(icon_dir)
+                if icon_path:
+                    icon_cache.set_image(row.icon, icon_path, 24)
+                else:
+                    row.icon.clear()
+            title = GLib.markup_escape_text(category_data['title'])
+            row.title_label.set_markup(f'<span size="14000" weight="bold">{title}</span>')
+            return
+        
+        category_id, package = item.data
+        if package.get('icon'):
+            icon_cache.set_image(row.icon, os.path.join(ICONS_DIR, category_id, package['icon']), 48)
+        else:
+            row.icon.clear()
+        
+        name = GLib.markup_escape_text(package['name'])
+        row.name_label.set_markup(f'<span weight="bold">{name}</span>')
+        install_method = self._get_install_method(package)
+        row.flatpak_badge.set_visible(install_method == 'flatpak')
+        row.appimage_badge.set_visible(package.get('check_path', '').endswith('.AppImage'))
+        row.official_badge.set_visible(package.get('official', False) and install_method == 'apt')
+        row.desc_label.set_text(package.get('description', ''))
+        
+        self._fill_action_box(row.button_box, category_id, package)
     
     def _create_package_widget(self, category_id: str, package: dict) -> Gtk.Widget:
         """Create a widget for a single recommended package."""
@@ -322,6 +611,19 @@ class RecommendedTab(Gtk.Box):
         if self.button_group:
             self.button_group.add_widget(button_box)
         
+        self._fill_action_box(button_box, category_id, package)
+        self.package_rows[(category_id, package['name'])] = (button_box, package)
+        
+        box.pack_start(button_box, False, False, 0)
+        
+        return box
+    
+    def _fill_action_box(self, button_box: Gtk.Box, category_id: str, package: dict):
+        """(Re)build the checkbox, state label or install/uninstall button of
+        a package row for the current mode and package state."""
+        for child in button_box.get_children():
+            child.destroy()
+        
         # Check if package is being processed (installing/uninstalling)
         package_id = f"{category_id}:{package['name']}"
         is_processing = package_id in self.installing_packages
@@ -377,33 +679,24 @@ class RecommendedTab(Gtk.Box):
                 install_button.connect('clicked', self._on_install_package, category_id, package)
                 button_box.pack_start(install_button, False, False, 0)
         
-        box.pack_start(button_box, False, False, 0)
-        
-        return box
+        button_box.show_all()
     
     def _load_category_icon(self, category_id: str, specific_icon: str = None) -> Gtk.Widget:
         """Load and return a category icon."""
         try:
-            icon_dir = Path(os.path.join(ICONS_DIR, category_id))
+            icon_cache = get_icon_cache()
+            icon_dir = os.path.join(ICONS_DIR, category_id)
             
             # If specific icon is provided, try to load it first
-            if specific_icon and icon_dir.exists():
-                icon_path = icon_dir / specific_icon
-                if icon_path.exists():
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                        str(icon_path), 24, 24, True
-                    )
-                    return Gtk.Image.new_from_pixbuf(pixbuf)
-
-            # Fallback: Try to find a representative icon in the category folder
-            if icon_dir.exists():
-                # Use the first available icon as category icon
-                for icon_file in icon_dir.glob("*.png"):
-                    pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                        str(icon_file), 24, 24, True
-                    )
-                    image = Gtk.Image.new_from_pixbuf(pixbuf)
+            if specific_icon:
+                image = icon_cache.load_image(os.path.join(icon_dir, specific_icon), 24)
+                if image is not None:
                     return image
+
+            # Fallback: use the first available icon in the category folder
+            icon_path = icon_cache.first_icon_in(icon_dir)
+            if icon_path:
+                return icon_cache.load_image(icon_path, 24)
         except Exception as e:
             print(f"Error loading category icon for {category_id}: {e}")
         
@@ -416,12 +709,7 @@ class RecommendedTab(Gtk.Box):
         
         try:
             icon_path = os.path.join(ICONS_DIR, category_id, icon_name)
-            if os.path.exists(icon_path):
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    icon_path, 48, 48, True
-                )
-                image = Gtk.Image.new_from_pixbuf(pixbuf)
-                return image
+            return get_icon_cache().load_image(icon_path, 48)
         except Exception as e:
             print(f"Error loading package icon {icon_name}: {e}")
         
@@ -429,40 +717,7 @@ class RecommendedTab(Gtk.Box):
     
     def _get_install_method(self, package: dict) -> str:
         """Determine the preferred installation method for a package."""
-        # List of packages that MUST use Flatpak even if APT is available
-        # This matches the behavior of previous versions (Tyron/Tyson)
-        prefer_flatpak = [
-            'Telegram', 'Discord', 'Signal', 'Element', 'WhatsApp',
-            'LibreWolf', 'LibreOffice', 'OnlyOffice', 'WPS Office',
-            'OpenShot', 'Kdenlive', 'Shotcut',
-            'OBS Studio', 'HandBrake',
-            'VSCodium', 'Pulsar',
-            'Steam', 'Heroic Games Launcher', 'Bottles',
-            'Lutris'
-        ]
-        
-        if package['name'] in prefer_flatpak and package.get('flatpak'):
-            return 'flatpak'
-            
-        # Check for custom installation handlers
-        if package.get('name') == 'DaVinci Resolve':
-            return 'davinci_resolve'
-
-        # Check for custom installation commands
-        if 'install_commands' in package:
-            return 'custom'
-            
-        # Check for .deb URL installation
-        if package.get('deb_url'):
-            return 'deb'
-            
-        # Default Priority: APT > Flatpak
-        if package.get('package'): # APT package
-            return 'apt'
-        elif package.get('flatpak'):
-            return 'flatpak'
-        
-        return 'unknown'
+        return get_install_method(package)
     
     def _is_package_installed(self, package: dict) -> bool:
         """Check if a package is installed using the preferred method."""
@@ -484,18 +739,10 @@ class RecommendedTab(Gtk.Box):
         
         try:
             if (install_method == 'apt' or install_method == 'deb' or install_method == 'custom') and package.get('package'):
-                result = subprocess.run(
-                    ['dpkg', '-s', package['package']],
-                    capture_output=True, text=True
-                )
-                is_installed = 'Status: install ok installed' in result.stdout
+                is_installed = get_package_index().is_installed(package['package'])
             
             elif install_method == 'flatpak' and package.get('flatpak'):
-                result = subprocess.run(
-                    ['flatpak', 'info', package['flatpak']],
-                    capture_output=True, text=True
-                )
-                is_installed = result.returncode == 0
+                is_installed = get_flatpak_index().is_installed(package['flatpak'])
         
         except Exception:
             pass
@@ -512,6 +759,7 @@ class RecommendedTab(Gtk.Box):
             return  # Already installing
         
         self.installing_packages.add(package_id)
+        self._update_package_rows({(category_id, package['name'])})
         
         install_method = self._get_install_method(package)
         command = ""
@@ -522,21 +770,24 @@ class RecommendedTab(Gtk.Box):
             return
 
         if install_method == 'apt' and package.get('package'):
-            command = f"pkexec apt install -y {package['package']}"
-            script_name = f"install-{package['package']}.sh"
+            self.command_runner.run_apt(
+                ['install', '-y', package['package']],
+                lambda: self._on_package_operation_complete(package, True),
+                label=package['name']
+            )
+            return
             
         elif install_method == 'flatpak' and package.get('flatpak'):
             command = f"flatpak install -y flathub {package['flatpak']}"
             script_name = f"install-{package['flatpak']}.sh"
             
         elif install_method == 'deb' and package.get('deb_url'):
-            # Create a script for downloading and installing .deb
-            deb_url = package['deb_url']
-            pkg_name = package['package']
-            command = f"""wget -q --show-progress -O /tmp/{pkg_name}.deb "{deb_url}"
-pkexec apt install -y /tmp/{pkg_name}.deb
-rm -f /tmp/{pkg_name}.deb"""
-            script_name = f"install-{pkg_name}.sh"
+            self.command_runner.run_deb_install(
+                [(package['deb_url'], package['package'], package.get('deb_sha256'))],
+                lambda: self._on_package_operation_complete(package, True),
+                label=package['name']
+            )
+            return
             
         elif install_method == 'custom' and package.get('install_commands'):
             # Custom installation commands
@@ -557,6 +808,7 @@ rm -f /tmp/{pkg_name}.deb"""
             return  # Already processing
         
         self.installing_packages.add(package_id)
+        self._update_package_rows({(category_id, package['name'])})
         
         install_method = self._get_install_method(package)
         command = ""
@@ -569,8 +821,12 @@ rm -f /tmp/{pkg_name}.deb"""
             command = cmds
             script_name = f"uninstall-{pkg_name}.sh"
         elif (install_method == 'apt' or install_method == 'deb' or install_method == 'custom') and package.get('package'):
-            command = f"pkexec apt remove -y {package['package']}"
-            script_name = f"uninstall-{package['package']}.sh"
+            self.command_runner.run_apt(
+                ['remove', '-y', package['package']],
+                lambda: self._on_package_operation_complete(package, False),
+                label=package['name']
+            )
+            return
             
         elif install_method == 'flatpak' and package.get('flatpak'):
             command = f"flatpak uninstall -y {package['flatpak']}"
@@ -610,7 +866,8 @@ rm -f /tmp/{pkg_name}.deb"""
             
             self.command_runner.run_command(
                 final_command, 
-                lambda: self._on_package_operation_complete(package, is_install)
+                lambda: self._on_package_operation_complete(package, is_install),
+                label=package['name']
             )
                 
         except Exception as e:
@@ -628,6 +885,59 @@ rm -f /tmp/{pkg_name}.deb"""
         self.package_status_cache.clear()
         self._refresh_content()
 
+    def _on_packages_changed(self, watcher, changed):
+        """Drop cached status for the packages that changed and update only
+        the rows of the ones listed here."""
+        catalog_ids = set()
+        for name in changed:
+            if name.startswith('flatpak:'):
+                entries = find_by_flatpak(name[len('flatpak:'):])
+            else:
+                entries = find_by_package(name)
+            catalog_ids.update((category_id, package['name']) for category_id, package in entries)
+        if catalog_ids:
+            self._update_package_rows(catalog_ids)
+    
+    def update_package_rows(self, names):
+        """Redraw the rows of the packages with these names, e.g. after
+        another tab installed or removed them."""
+        catalog_ids = set()
+        for name in names:
+            catalog_ids.update(self._catalog_ids_named(name))
+        self._update_package_rows(catalog_ids)
+        return False
+    
+    def _catalog_ids_named(self, name: str) -> list:
+        """(category_id, name) of every listed entry with this name; the same
+        application can be listed in more than one category."""
+        ids = []
+        for category_id in RECOMMENDED_CATEGORIES:
+            package = get_package_info(category_id, name)
+            if package is not None:
+                ids.append((category_id, package['name']))
+        return ids
+    
+    def _update_package_rows(self, catalog_ids):
+        """
+        Re-query the state of some packages and update only their rows'
+        action area. The rest of the page, its scroll position and the
+        status of every other package stay as they are.
+        """
+        for _category_id, name in catalog_ids:
+            self.package_status_cache.pop(name, None)
+        
+        if self.virtual_list is not None:
+            self.virtual_list.rebind(
+                lambda item: item.kind == 'package' and (item.data[0], item.data[1]['name']) in catalog_ids)
+            return False
+        
+        for catalog_id in catalog_ids:
+            row = self.package_rows.get(catalog_id)
+            if row is not None:
+                button_box, package = row
+                self._fill_action_box(button_box, catalog_id[0], package)
+        return False
+
     def _on_package_operation_complete(self, package: dict, is_install: bool):
         """Handle completion of package operation."""
         # Invalidate cache
@@ -656,13 +966,22 @@ rm -f /tmp/{pkg_name}.deb"""
         self._finish_package_complete(package)
 
     def _finish_package_complete(self, package: dict):
-        """Finalize package completion: refresh UI and sync tabs."""
-        # Refresh UI
-        GLib.idle_add(self._refresh_content)
-
-        # Targeted synchronization with Gaming tab
+        """Finalize package completion: update its rows and sync tabs."""
+        GLib.idle_add(self._sync_completed_packages, [package['name']])
+    
+    def _sync_completed_packages(self, names):
+        """Update the rows of packages whose operation finished, here and in
+        the Gaming tab, without rebuilding either page."""
+        self.update_package_rows(names)
+        
+        # Other tabs pick up dpkg and Flatpak changes from the watcher;
+        # diff now rather than after its settle delay.
+        get_package_watcher().check_now()
+        
+        # AppImages and scripts leave no trace the watcher sees
         if self.parent_window and hasattr(self.parent_window, 'gaming_tab') and self.parent_window.gaming_tab:
-            GLib.idle_add(self.parent_window.gaming_tab.refresh)
+            self.parent_window.gaming_tab.update_launcher_rows(names)
+        return False
     
     def _on_toggle_batch_mode(self, button):
         """Toggle between normal and batch installation mode."""
@@ -674,11 +993,7 @@ rm -f /tmp/{pkg_name}.deb"""
         else:
             self.batch_toggle_button.set_label(_("Multiple Selection"))
             # Clear selections when exiting batch mode
-            self.selected_apt.clear()
-            self.selected_flatpak.clear()
-            self.selected_flatpak_packages.clear()
-            self.selected_deb_urls.clear()
-            self.selected_custom.clear()
+            self.selection.clear()
             self.batch_bar.hide()
         
         # Rebuild content with new mode
@@ -689,68 +1004,20 @@ rm -f /tmp/{pkg_name}.deb"""
         install_method = self._get_install_method(package)
         
         if checkbox.get_active():
-            # Add to appropriate list
-            if install_method == 'apt' and package.get('package'):
-                if package['package'] not in self.selected_apt:
-                    self.selected_apt.append(package['package'])
-            elif install_method == 'flatpak' and package.get('flatpak'):
-                if package['flatpak'] not in self.selected_flatpak:
-                    self.selected_flatpak.append(package['flatpak'])
-                    self.selected_flatpak_packages[package['flatpak']] = package
-            elif install_method == 'deb' and package.get('deb_url'):
-                deb_info = (package['deb_url'], package['package'])
-                if deb_info not in self.selected_deb_urls:
-                    self.selected_deb_urls.append(deb_info)
-            elif install_method == 'custom' and package.get('install_commands'):
-                custom_info = (package['install_commands'], package.get('package') or package['name'])
-                if custom_info not in self.selected_custom:
-                    self.selected_custom.append(custom_info)
+            self.selection.add(package, install_method)
         else:
-            # Remove from appropriate list
-            if install_method == 'apt' and package['package'] in self.selected_apt:
-                self.selected_apt.remove(package['package'])
-            elif install_method == 'flatpak' and package['flatpak'] in self.selected_flatpak:
-                self.selected_flatpak.remove(package['flatpak'])
-                self.selected_flatpak_packages.pop(package['flatpak'], None)
-            elif install_method == 'deb':
-                deb_info = (package['deb_url'], package['package'])
-                if deb_info in self.selected_deb_urls:
-                    self.selected_deb_urls.remove(deb_info)
-            elif install_method == 'custom':
-                # Find and remove custom script
-                custom_to_remove = None
-                pkg_id = package.get('package') or package['name']
-                for custom_info in self.selected_custom:
-                    if custom_info[1] == pkg_id:
-                        custom_to_remove = custom_info
-                        break
-                if custom_to_remove:
-                    self.selected_custom.remove(custom_to_remove)
+            self.selection.discard(package, install_method)
         
         self._update_batch_bar()
     
     def _is_package_selected(self, package: dict) -> bool:
         """Check if a package is currently selected in batch mode."""
-        install_method = self._get_install_method(package)
-        
-        if install_method == 'apt' and package.get('package'):
-            return package['package'] in self.selected_apt
-        elif install_method == 'flatpak' and package.get('flatpak'):
-            return package['flatpak'] in self.selected_flatpak
-        elif install_method == 'deb' and package.get('deb_url'):
-            deb_info = (package['deb_url'], package['package'])
-            return deb_info in self.selected_deb_urls
-        elif install_method == 'custom' and package.get('install_commands'):
-            pkg_id = package.get('package') or package['name']
-            for custom_info in self.selected_custom:
-                if custom_info[1] == pkg_id:
-                    return True
-        return False
+        return self.selection.contains(package, self._get_install_method(package))
     
     def _on_search_changed(self, search_entry):
         """Handle search query changes."""
         self.search_query = search_entry.get_text().strip()
-        self._refresh_content()
+        self._apply_search_filter()
     
     def _on_select_all(self, button):
         """Select all visible uninstalled packages."""
@@ -765,12 +1032,7 @@ rm -f /tmp/{pkg_name}.deb"""
             packages = category_data.get('packages', [])
             
             # Apply search filter
-            if self.search_query:
-                query_lower = self.search_query.lower()
-                packages = [
-                    pkg for pkg in packages
-                    if query_lower in pkg['name'].lower() or query_lower in pkg.get('description', '').lower()
-                ]
+            packages = [pkg for pkg in packages if self._matches_search(category_id, pkg)]
             
             # Select each uninstalled package
             for package in packages:
@@ -780,40 +1042,21 @@ rm -f /tmp/{pkg_name}.deb"""
                 if install_method == 'davinci_resolve' or self._is_package_installed(package):
                     continue
                 
-                # Add to appropriate list if not already selected
-                if install_method == 'apt' and package.get('package'):
-                    if package['package'] not in self.selected_apt:
-                        self.selected_apt.append(package['package'])
-                elif install_method == 'flatpak' and package.get('flatpak'):
-                    if package['flatpak'] not in self.selected_flatpak:
-                        self.selected_flatpak.append(package['flatpak'])
-                        self.selected_flatpak_packages[package['flatpak']] = package
-                elif install_method == 'deb' and package.get('deb_url'):
-                    deb_info = (package['deb_url'], package['package'])
-                    if deb_info not in self.selected_deb_urls:
-                        self.selected_deb_urls.append(deb_info)
-                elif install_method == 'custom' and package.get('install_commands'):
-                    custom_info = (package['install_commands'], package.get('package') or package['name'])
-                    if custom_info not in self.selected_custom:
-                        self.selected_custom.append(custom_info)
+                self.selection.add(package, install_method)
         
         self._update_batch_bar()
         self._refresh_content()
     
     def _on_deselect_all(self, button):
         """Deselect all packages."""
-        self.selected_apt.clear()
-        self.selected_flatpak.clear()
-        self.selected_flatpak_packages.clear()
-        self.selected_deb_urls.clear()
-        self.selected_custom.clear()
+        self.selection.clear()
         
         self._update_batch_bar()
         self._refresh_content()
     
     def _update_batch_bar(self):
         """Update the batch action bar with selection count."""
-        total = len(self.selected_apt) + len(self.selected_flatpak) + len(self.selected_deb_urls) + len(self.selected_custom)
+        total = len(self.selection)
         
         if total > 0:
             self.batch_label.set_text(_("{} programs selected").format(total) if total != 1 else _("1 program selected"))
@@ -823,7 +1066,7 @@ rm -f /tmp/{pkg_name}.deb"""
     
     def _on_install_batch(self, button):
         """Install all selected packages."""
-        total = len(self.selected_apt) + len(self.selected_flatpak) + len(self.selected_deb_urls) + len(self.selected_custom)
+        total = len(self.selection)
         
         if total == 0:
             return
@@ -838,17 +1081,20 @@ rm -f /tmp/{pkg_name}.deb"""
         )
         
         details = []
-        if self.selected_apt:
-            details.append(f"APT: {', '.join(self.selected_apt)}")
-        if self.selected_flatpak:
-            flatpak_names = [fp.split('.')[-1] for fp in self.selected_flatpak]
+        selected_apt = self.selection.keys('apt')
+        selected_flatpak = self.selection.keys('flatpak')
+        selected_deb = self.selection.keys('deb')
+        selected_custom = self.selection.keys('custom')
+        if selected_apt:
+            details.append(f"APT: {', '.join(selected_apt)}")
+        if selected_flatpak:
+            flatpak_names = [fp.split('.')[-1] for fp in selected_flatpak]
             details.append(f"Flatpak: {', '.join(flatpak_names)}")
-        if self.selected_deb_urls:
-            deb_names = [name for _, name in self.selected_deb_urls]
+        if selected_deb:
+            deb_names = [name for _, name in selected_deb]
             details.append(f".deb: {', '.join(deb_names)}")
-        if self.selected_custom:
-            custom_names = [name for _, name in self.selected_custom]
-            details.append(f"Custom: {', '.join(custom_names)}")
+        if selected_custom:
+            details.append(f"Custom: {', '.join(selected_custom)}")
         
         dialog.format_secondary_text("\n".join(details))
         
@@ -867,87 +1113,60 @@ rm -f /tmp/{pkg_name}.deb"""
     
     def _install_batch_step_1_apt(self):
         """Step 1: Install all APT packages in single command."""
-        if self.selected_apt:
-            packages = ' '.join(self.selected_apt)
-            cmd = f"pkexec apt install -y {packages}"
-            self.command_runner.run_command(cmd, self._install_batch_step_2_flatpak)
+        selected_apt = self.selection.keys('apt')
+        if selected_apt:
+            self.command_runner.run_apt(['install', '-y', *selected_apt], self._install_batch_step_2_flatpak,
+                                        priority=PRIORITY_LOW,
+                                        on_cancelled=self._install_batch_cancelled)
         else:
             self._install_batch_step_2_flatpak()
     
     def _install_batch_step_2_flatpak(self):
-        """Step 2: Install Flatpak packages sequentially."""
-        if self.selected_flatpak:
-            self._install_next_flatpak(0)
-        else:
-            self._install_batch_step_3_deb()
-    
-    def _install_next_flatpak(self, index):
-        """Install next Flatpak package."""
-        if index >= len(self.selected_flatpak):
+        """Step 2: Install all Flatpak packages in a single transaction."""
+        selected_flatpak = self.selection.items('flatpak')  # (flatpak_id, package) pairs
+        if not selected_flatpak:
             self._install_batch_step_3_deb()
             return
         
-        flatpak_id = self.selected_flatpak[index]
-        package = self.selected_flatpak_packages.get(flatpak_id, {})
-        script_path = f"/tmp/batch-flatpak-{flatpak_id.replace('.', '-')}.sh"
+        # Post-install scripts run per app once the transaction is done
         app_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        with open(script_path, "w") as f:
-            f.write("#!/bin/bash\n")
-            f.write(f"flatpak install -y flathub {flatpak_id}\n")
+        post_install = []
+        for flatpak_id, package in selected_flatpak:
             if package.get('post_install_script'):
                 patch = os.path.join(app_root, 'services', package['post_install_script'])
                 if os.path.exists(patch):
-                    f.write(f"bash '{patch}'\n")
-        os.chmod(script_path, 0o755)
-        self.command_runner.run_command(script_path, lambda: self._install_next_flatpak(index + 1))
+                    post_install.append((flatpak_id, patch))
+        
+        self.command_runner.run_flatpak_install(
+            [flatpak_id for flatpak_id, package in selected_flatpak],
+            self._install_batch_step_3_deb,
+            post_install=post_install,
+            priority=PRIORITY_LOW,
+            label=", ".join(package['name'] for flatpak_id, package in selected_flatpak),
+            on_cancelled=self._install_batch_cancelled
+        )
     
     def _install_batch_step_3_deb(self):
-        """Step 3: Install all .deb packages in single consolidated script."""
-        if not self.selected_deb_urls:
+        """Step 3: Download all .deb packages in parallel, then install them in one apt transaction."""
+        selected_deb = self.selection.items('deb')  # ((url, package_name), package) pairs
+        if not selected_deb:
             self._install_batch_step_4_custom()
             return
         
-        # Create a single script that downloads and installs ALL .deb packages
-        script_path = "/tmp/batch-install-deb-all.sh"
-        
-        try:
-            with open(script_path, "w") as f:
-                f.write("#!/bin/bash\n")
-                f.write("# Batch download and installation of .deb packages\n\n")
-                
-                f.write("set -e  # Exit on error\n\n")
-                
-                # First, download all .deb files (no root needed)
-                for deb_url, pkg_name in self.selected_deb_urls:
-                    f.write(f"echo '{_('Downloading')} {pkg_name}...'\n")
-                    f.write(f'wget -q --show-progress -O /tmp/{pkg_name}.deb "{deb_url}" || {{ echo "{_("Download failed for")} {pkg_name}"; exit 1; }}\n')
-                    f.write(f'chmod 644 /tmp/{pkg_name}.deb\n')
-                
-                f.write(f"\necho '{_('Installing all .deb packages...')}'\n")
-                
-                # Then install all at once (running as root)
-                deb_files = " ".join([f"/tmp/{pkg_name}.deb" for _, pkg_name in self.selected_deb_urls])
-                f.write(f"dpkg -i {deb_files} || apt-get install -f -y || {{ echo '{_("Installation failed")}'; exit 1; }}\n")
-                
-                # Cleanup
-                for _, pkg_name in self.selected_deb_urls:
-                    f.write(f"rm -f /tmp/{pkg_name}.deb\n")
-                
-                f.write(f"echo '{_('All .deb packages installed successfully')}'\n")
-            
-            os.chmod(script_path, 0o755)
-            
-            # Execute entire script with pkexec (single password prompt, root permissions for download & install)
-            cmd = f"pkexec {script_path}"
-            self.command_runner.run_command(cmd, self._install_batch_step_4_custom)
-            
-        except Exception as e:
-            print(f"Error creating consolidated .deb script: {e}")
-            self._install_batch_step_4_custom()
+        debs = [(deb_url, pkg_name, package.get('deb_sha256'))
+                for (deb_url, pkg_name), package in selected_deb]
+        self.command_runner.run_deb_install(
+            debs,
+            self._install_batch_step_4_custom,
+            priority=PRIORITY_LOW,
+            label=", ".join(package['name'] for _key, package in selected_deb),
+            on_cancelled=self._install_batch_cancelled
+        )
     
     def _install_batch_step_4_custom(self):
         """Step 4: Install custom script packages in single consolidated script."""
-        if not self.selected_custom:
+        selected_custom = self.selection.items('custom')  # (package_name, package) pairs
+        if not selected_custom:
             self._install_batch_complete()
             return
         
@@ -959,7 +1178,8 @@ rm -f /tmp/{pkg_name}.deb"""
                 f.write("#!/bin/bash\n")
                 f.write("# Batch installation of custom script packages\n\n")
 
-                for commands_list, pkg_name in self.selected_custom:
+                for pkg_name, package in selected_custom:
+                    commands_list = package['install_commands']
                     f.write(f"# Installing {pkg_name}\n")
                     f.write(f"echo 'Installing {pkg_name}...'\n")
                     f.write("(\n")
@@ -973,7 +1193,8 @@ rm -f /tmp/{pkg_name}.deb"""
             
             # Single pkexec call for ALL custom scripts
             cmd = f"pkexec {script_path}"
-            self.command_runner.run_command(cmd, self._install_batch_complete)
+            self.command_runner.run_command(cmd, self._install_batch_complete, priority=PRIORITY_LOW,
+                                            on_cancelled=self._install_batch_cancelled)
             
         except Exception as e:
             print(f"Error creating consolidated custom script: {e}")
@@ -981,24 +1202,18 @@ rm -f /tmp/{pkg_name}.deb"""
     
     def _install_batch_complete(self):
         """Complete batch installation."""
-        # Clear selections
-        self.selected_apt.clear()
-        self.selected_flatpak.clear()
-        self.selected_deb_urls.clear()
-        self.selected_custom.clear()
+        installed_names = [package['name'] for method in BatchSelection.METHODS
+                           for _key, package in self.selection.items(method)]
         
-        # Clear cache
-        self.package_status_cache.clear()
+        # Clear selections
+        self.selection.clear()
         
         # Re-enable batch mode toggle
         self.batch_toggle_button.set_sensitive(True)
         
-        # Refresh UI
-        self._refresh_content()
-        
-        # Targeted synchronization with Gaming tab
-        if self.parent_window and hasattr(self.parent_window, 'gaming_tab') and self.parent_window.gaming_tab:
-            GLib.idle_add(self.parent_window.gaming_tab.refresh)
+        # Update the rows of the installed packages, and the batch bar
+        self._sync_completed_packages(installed_names)
+        self._update_batch_bar()
         
         # Show completion dialog
         dialog = Gtk.MessageDialog(
@@ -1012,6 +1227,25 @@ rm -f /tmp/{pkg_name}.deb"""
         dialog.run()
         dialog.destroy()
     
+    def _install_batch_cancelled(self):
+        """
+        A batch step was cancelled: skip the remaining steps and keep what
+        is still missing selected, so the batch can be started again.
+        """
+        selected = [(method, package) for method in BatchSelection.METHODS
+                    for _key, package in self.selection.items(method)]
+        
+        # Earlier steps may have installed part of the selection
+        for method, package in selected:
+            self.package_status_cache.pop(package['name'], None)
+            if self._is_package_installed(package):
+                self.selection.discard(package, method)
+        
+        self.batch_toggle_button.set_sensitive(True)
+        self._sync_completed_packages([package['name'] for _method, package in selected])
+        self._update_batch_bar()
+        return False
+    
     def _clear_status(self):
         """Clear the status message."""
         self.status_label.set_text(_("Ready"))
@@ -1019,6 +1253,11 @@ rm -f /tmp/{pkg_name}.deb"""
     
     def _refresh_content(self):
         """Refresh the entire content area."""
+        if self.virtual_list is not None:
+            # Refill the model; only the rows in view are bound again
+            self._load_recommended_software()
+            return
+        
         # Remove all children
         for child in self.content_box.get_children():
             child.destroy()
@@ -1089,15 +1328,16 @@ rm -f /tmp/{pkg_name}.deb"""
         # Start installation process
         package_id = "multimedia:DaVinci Resolve"
         self.installing_packages.add(package_id)
-        self._refresh_content()
+        self._update_package_rows({('multimedia', 'DaVinci Resolve')})
         
         # Step 1: Install dependencies
         self._davinci_step_1_deps(filename, package_data)
 
     def _davinci_step_1_deps(self, filename, package_data):
         """Step 1: Install dependencies (requires root)."""
-        cmd = "pkexec apt-get install -y fakeroot xorriso unzip"
-        self.command_runner.run_command(cmd, lambda: self._davinci_step_2_extract(filename, package_data))
+        self.command_runner.run_apt(['install', '-y', 'fakeroot', 'xorriso', 'unzip'],
+                                    lambda: self._davinci_step_2_extract(filename, package_data),
+                                    on_cancelled=lambda: self._davinci_cancelled(None, package_data))
 
     def _davinci_step_2_extract(self, filename, package_data):
         """Step 2: Extract installer to local work directory."""
@@ -1114,11 +1354,11 @@ rm -f /tmp/{pkg_name}.deb"""
         if filename.lower().endswith(".zip"):
             # Unzip to work dir
             cmd = f"unzip -o '{filename}' -d '{work_dir}'"
-            self.command_runner.run_command(cmd, lambda: self._davinci_step_3_convert(work_dir, package_data))
         else:
             # Copy .run file
             cmd = f"cp '{filename}' '{work_dir}/'"
-            self.command_runner.run_command(cmd, lambda: self._davinci_step_3_convert(work_dir, package_data))
+        self.command_runner.run_command(cmd, lambda: self._davinci_step_3_convert(work_dir, package_data),
+                                        on_cancelled=lambda: self._davinci_cancelled(work_dir, package_data))
 
     def _davinci_step_3_convert(self, work_dir, package_data):
         """Step 3: Run makeresolvedeb (as user)."""
@@ -1161,7 +1401,8 @@ rm -f /tmp/{pkg_name}.deb"""
         # IMPORTANT: Run as current user, NOT root. CommandRunner runs as user by default.
         # We chain commands: cd to dir, then run script
         cmd = f"cd '{work_dir}' && ./makeresolvedeb.sh '{run_file}'"
-        self.command_runner.run_command(cmd, lambda: self._davinci_step_4_install(work_dir, package_data))
+        self.command_runner.run_command(cmd, lambda: self._davinci_step_4_install(work_dir, package_data),
+                                        on_cancelled=lambda: self._davinci_cancelled(work_dir, package_data))
 
     def _davinci_step_4_install(self, work_dir, package_data):
         """Step 4: Install generated .deb(s) (requires root).
@@ -1173,10 +1414,11 @@ rm -f /tmp/{pkg_name}.deb"""
             self._on_package_operation_complete(package_data, False)
             return
 
-        deb_paths = " ".join(f"'{os.path.join(work_dir, f)}'" for f in deb_files)
+        deb_paths = [os.path.join(work_dir, f) for f in deb_files]
 
-        cmd = f"pkexec apt-get install -y {deb_paths}"
-        self.command_runner.run_command(cmd, lambda: self._davinci_step_5_patches(work_dir, package_data))
+        self.command_runner.run_apt(['install', '-y', *deb_paths],
+                                    lambda: self._davinci_step_5_patches(work_dir, package_data),
+                                    on_cancelled=lambda: self._davinci_cancelled(work_dir, package_data))
 
     def _davinci_step_5_patches(self, work_dir, package_data):
         """Step 5: Offer optional patches via dialog."""
@@ -1245,28 +1487,42 @@ rm -f /tmp/{pkg_name}.deb"""
         def after_patches():
             self._davinci_cleanup(work_dir, package_data)
 
+        def cancelled():
+            self._davinci_cancelled(work_dir, package_data)
+
         def run_gpu():
             script = os.path.join(app_root, "services", "davinci-gpu-patch.sh")
             self.command_runner.run_command(
                 f"pkexec bash '{script}'",
-                after_patches
+                after_patches,
+                on_cancelled=cancelled
             )
 
         if apply_mic and apply_gpu:
             mic_script = os.path.join(app_root, "services", "davinci-virtual-mic.sh")
             self.command_runner.run_command(
                 f"pkexec bash '{mic_script}'",
-                run_gpu
+                run_gpu,
+                on_cancelled=cancelled
             )
         elif apply_mic:
             mic_script = os.path.join(app_root, "services", "davinci-virtual-mic.sh")
             self.command_runner.run_command(
                 f"pkexec bash '{mic_script}'",
-                after_patches
+                after_patches,
+                on_cancelled=cancelled
             )
         elif apply_gpu:
             run_gpu()
 
+    def _davinci_cancelled(self, work_dir, package_data):
+        """A step was cancelled: drop the work directory and reset the row
+        without running the remaining steps."""
+        if work_dir:
+            import shutil
+            shutil.rmtree(work_dir, ignore_errors=True)
+        self._on_package_operation_complete(package_data, False)
+
     def _davinci_cleanup(self, work_dir, package_data):
         """Step 5: Cleanup."""
         import shutil
@@ -1279,7 +1535,7 @@ rm -f /tmp/{pkg_name}.deb"""
         if package_id in self.installing_packages:
             self.installing_packages.remove(package_id)
         
-        self._refresh_content()
+        self._update_package_rows({('multimedia', 'DaVinci Resolve')})
         
         
         # Show success dialog
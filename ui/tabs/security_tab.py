@@ -7,12 +7,15 @@ import gi
 import os
 import subprocess
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib, GdkPixbuf
+from gi.repository import Gtk, GLib
 
 ICONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'assets', 'icons', 'security')
 
 from core.i18n_manager import _
 from utils.command_runner import CommandRunner
+from utils.package_index import get_package_index
+from utils.flatpak_index import get_flatpak_index
+from utils.icon_cache import get_icon_cache
 
 
 class SecurityTab(Gtk.ScrolledWindow):
@@ -77,15 +80,10 @@ class SecurityTab(Gtk.ScrolledWindow):
         hbox.set_margin_top(4)
         hbox.set_margin_bottom(4)
 
-        icon_path = os.path.join(ICONS_DIR, icon_file)
-        if os.path.exists(icon_path):
-            try:
-                pb = GdkPixbuf.Pixbuf.new_from_file_at_scale(icon_path, 48, 48, True)
-                img = Gtk.Image.new_from_pixbuf(pb)
-                img.set_valign(Gtk.Align.CENTER)
-                hbox.pack_start(img, False, False, 0)
-            except Exception:
-                pass
+        img = get_icon_cache().new_image(os.path.join(ICONS_DIR, icon_file), 48)
+        if img is not None:
+            img.set_valign(Gtk.Align.CENTER)
+            hbox.pack_start(img, False, False, 0)
 
         info_vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
         info_vbox.set_valign(Gtk.Align.CENTER)
@@ -512,14 +510,7 @@ class SecurityTab(Gtk.ScrolledWindow):
     
     def _is_package_installed(self, package_name):
         """Check if a package is installed."""
-        try:
-            result = subprocess.run(
-                ["dpkg-query", "-W", "-f=${Status}", package_name],
-                capture_output=True, text=True
-            )
-            return "install ok installed" in result.stdout
-        except:
-            return False
+        return get_package_index().is_installed(package_name)
     
     def _update_all_buttons(self):
         """Update all buttons based on installation status."""
@@ -732,11 +723,7 @@ class SecurityTab(Gtk.ScrolledWindow):
     def _is_flatpak_installed(self, flatpak_id):
         """Check if a Flatpak app is installed."""
         try:
-            result = subprocess.run(
-                ['flatpak', 'info', flatpak_id],
-                capture_output=True, text=True
-            )
-            return result.returncode == 0
+            return get_flatpak_index().is_installed(flatpak_id)
         except Exception:
             return False
 
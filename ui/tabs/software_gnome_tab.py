@@ -7,10 +7,14 @@ import gi
 import os
 import subprocess
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GdkPixbuf, GLib
+from gi.repository import Gtk
 
 from core.i18n_manager import _
 from utils.command_runner import CommandRunner
+from utils.package_index import get_package_index
+from utils.flatpak_index import get_flatpak_index
+from utils.icon_cache import get_icon_cache
+from utils.package_watcher import get_package_watcher
 from config.paths import BASE_DIR
 
 
@@ -37,6 +41,11 @@ class SoftwareGnomeTab(Gtk.Box):
         
         self.set_border_width(10)
         self._init_ui()
+        
+        # Buttons follow installs and removals made anywhere, a terminal included
+        watcher = get_package_watcher()
+        handler_id = watcher.connect('packages-changed', self._on_packages_changed)
+        self.connect('destroy', lambda *args: watcher.disconnect(handler_id))
     
     def _init_ui(self):
         """Initialize the GNOME software interface."""
@@ -191,29 +200,16 @@ class SoftwareGnomeTab(Gtk.Box):
     
     def _load_icon(self, icon_path, size=48):
         """Load icon with fallback support."""
-        try:
-            if os.path.exists(icon_path):
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                    icon_path, size, size, True
-                )
-                return Gtk.Image.new_from_pixbuf(pixbuf)
-        except Exception as e:
-            print(f"Error loading icon {icon_path}: {e}")
+        image = get_icon_cache().load_image(icon_path, size)
+        if image is not None:
+            return image
         
         # Fallback to system icon
         return Gtk.Image.new_from_icon_name("application-x-executable", Gtk.IconSize.DIALOG)
     
     def _is_package_installed(self, package_name):
         """Check if a package is installed."""
-        try:
-            result = subprocess.run(
-                ["dpkg-query", "-W", "-f=${Status}", package_name],
-                capture_output=True, text=True
-            )
-            return "install ok installed" in result.stdout
-        except Exception as e:
-            print(f"Error checking package {package_name}: {e}")
-            return False
+        return get_package_index().is_installed(package_name)
     
     def _is_snap_app_installed(self, snap_name):
         """Check if a snap package is installed."""
@@ -226,9 +222,7 @@ class SoftwareGnomeTab(Gtk.Box):
     def _is_flatpak_app_installed(self, app_id):
         """Check if a Flatpak app is installed."""
         try:
-            result = subprocess.run(["flatpak", "info", app_id],
-                                    capture_output=True, text=True)
-            return result.returncode == 0
+            return get_flatpak_index().is_installed(app_id)
         except Exception:
             return False
 
@@ -282,12 +276,6 @@ class SoftwareGnomeTab(Gtk.Box):
         container.pack_start(new_button, False, False, 0)
         new_button.show()
 
-    def _schedule_snap_update(self, snap_name, container):
-        GLib.timeout_add(1000, lambda: self._update_snap_button(snap_name, container) or False)
-
-    def _schedule_flatpak_update(self, app_id, container):
-        GLib.timeout_add(1000, lambda: self._update_flatpak_app_button(app_id, container) or False)
-
     def _on_snap_install_clicked(self, widget, snap_name, container):
         """Install a snap app, offering to install snapd first if missing."""
         if not self._is_package_installed("snapd"):
@@ -309,13 +297,13 @@ class SoftwareGnomeTab(Gtk.Box):
         else:
             script = f"pkexec snap install {snap_name}"
         self._create_and_run_script(script, f"install-snap-{snap_name}.sh",
-                                    on_complete=lambda: self._schedule_snap_update(snap_name, container))
+                                    on_complete=lambda: self._update_snap_button(snap_name, container))
 
     def _on_snap_uninstall_clicked(self, widget, snap_name, container):
         """Uninstall a snap app."""
         script = f"pkexec snap remove {snap_name}"
         self._create_and_run_script(script, f"uninstall-snap-{snap_name}.sh",
-                                    on_complete=lambda: self._schedule_snap_update(snap_name, container))
+                                    on_complete=lambda: self._update_snap_button(snap_name, container))
 
     def _on_flatpak_app_install_clicked(self, widget, app_id, container):
         """Install a Flatpak app."""
@@ -362,7 +350,7 @@ class SoftwareGnomeTab(Gtk.Box):
                 "pkexec flatpak remote-add --if-not-exists --system flathub "
                 "https://dl.flathub.org/repo/flathub.flatpakrepo && "
                 "pkexec flatpak install -y --system flathub io.github.kolunmi.Bazaar",
-                lambda: self._schedule_flatpak_update(app_id, container)
+                lambda: self._update_flatpak_app_button(app_id, container)
             )
             return
 
@@ -372,7 +360,7 @@ class SoftwareGnomeTab(Gtk.Box):
 
         self.command_runner.run_command(
             f"flatpak install -y flathub {app_id}",
-            lambda: self._schedule_flatpak_update(app_id, container)
+            lambda: self._update_flatpak_app_button(app_id, container)
         )
 
     def _on_flatpak_app_uninstall_clicked(self, widget, app_id, container):
@@ -383,7 +371,7 @@ class SoftwareGnomeTab(Gtk.Box):
             self.command_runner.run_command(
                 "pkexec flatpak uninstall -y --system io.github.kolunmi.Bazaar && "
                 "pkexec flatpak remote-delete --system flathub",
-                lambda: self._schedule_flatpak_update(app_id, container)
+                lambda: self._update_flatpak_app_button(app_id, container)
             )
             return
 
@@ -393,7 +381,7 @@ class SoftwareGnomeTab(Gtk.Box):
 
         self.command_runner.run_command(
             f"flatpak uninstall -y {app_id}",
-            lambda: self._schedule_flatpak_update(app_id, container)
+            lambda: self._update_flatpak_app_button(app_id, container)
         )
 
     def _create_software_button(self, package_name, packages):
@@ -464,8 +452,22 @@ class SoftwareGnomeTab(Gtk.Box):
         """Callback after installation/removal operation."""
         if package_to_update:
             print(f"Operation completed for {package_to_update}, success: {success}")
-            # Update button after a delay
-            GLib.timeout_add(1000, lambda: self._update_software_button(package_to_update))
+            # The package index rereads the dpkg database as soon as it
+            # changes, so the button can be rebuilt right away.
+            self._update_software_button(package_to_update)
+
+    def _on_packages_changed(self, watcher, changed):
+        """Rebuild only the buttons whose package changed state."""
+        for key in changed:
+            if key not in self.software_buttons:
+                continue
+            container = self.software_buttons[key]['container']
+            if key.startswith("snap:"):
+                self._update_snap_button(key[5:], container)
+            elif key.startswith("flatpak:"):
+                self._update_flatpak_app_button(key[8:], container)
+            else:
+                self._update_software_button(key)
     
     # Event handlers
     def _on_repo_selector_clicked(self, widget):
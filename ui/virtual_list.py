@@ -0,0 +1,143 @@
+"""
+Virtualized list widget for Soplos Welcome.
+Shows a Gio.ListStore through a small pool of recycled row widgets, so only
+the rows in view exist no matter how long the list is.
+"""
+
+import bisect
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, Gio, GObject
+
+
+# Rows built beyond each edge of the viewport, so short scrolls do not
+# show rows before they are bound.
+OVERSCAN_ROWS = 4
+
+
+class ListItem(GObject.Object):
+    """
+    Model item for a VirtualList.
+
+    kind selects the row factory and row height; data is whatever the bind
+    callback needs to fill a row.
+    """
+
+    def __init__(self, kind: str, data):
+        super().__init__()
+        self.kind = kind
+        self.data = data
+
+
+class VirtualList(Gtk.ScrolledWindow):
+    """
+    Scrolled list over a Gio.ListStore of ListItems.
+
+    Every kind of item has a fixed row height, so the offset of any item is
+    known without building its row. Rows are created through create_row(kind),
+    positioned in a Gtk.Layout and filled through bind_row(row, item). A row
+    that scrolls out of view goes back to its kind's pool and is bound to the
+    next item of that kind that scrolls in.
+    """
+
+    def __init__(self, row_heights: dict, create_row, bind_row):
+        super().__init__()
+        self.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+
+        self.row_heights = row_heights
+        self._create_row = create_row
+        self._bind_row = bind_row
+
+        self.model = Gio.ListStore.new(ListItem)
+        self._offsets = [0]  # offset of each item, then the total height
+        self._active = {}    # item position -> row
+        self._pool = {kind: [] for kind in row_heights}
+        self._width = 0
+
+        self.layout = Gtk.Layout()
+        self.add(self.layout)
+
+        self.model.connect('items-changed', self._on_items_changed)
+        self.get_vadjustment().connect('value-changed', lambda *args: self._update_rows())
+        self.layout.connect('size-allocate', self._on_size_allocate)
+
+    def set_items(self, items):
+        """Replace the whole model in one step."""
+        self.model.splice(0, self.model.get_n_items(), items)
+
+    def scroll_to_top(self):
+        self.get_vadjustment().set_value(0)
+
+    def rebind(self, predicate=None):
+        """
+        Fill the realized rows again from their items, e.g. after the state
+        they show changed. With a predicate, only rows whose item matches.
+        """
+        for position, row in self._active.items():
+            item = self.model.get_item(position)
+            if predicate is None or predicate(item):
+                self._bind_row(row, item)
+
+    def _on_items_changed(self, model, position, removed, added):
+        offsets = [0]
+        for i in range(model.get_n_items()):
+            offsets.append(offsets[-1] + self.row_heights[model.get_item(i).kind])
+        self._offsets = offsets
+
+        # Positions shifted, so every realized row is rebound
+        for row_position in list(self._active):
+            self._release(row_position)
+        self.layout.set_size(self._width, offsets[-1])
+        self._update_rows()
+
+    def _on_size_allocate(self, layout, allocation):
+        if allocation.width == self._width:
+            return
+        self._width = allocation.width
+        self.layout.set_size(self._width, self._offsets[-1])
+        for position, row in self._active.items():
+            row.set_size_request(self._width, self._row_height(position))
+        self._update_rows()
+
+    def _row_height(self, position):
+        return self._offsets[position + 1] - self._offsets[position]
+
+    def _release(self, position):
+        row = self._active.pop(position)
+        row.hide()
+        self._pool[row.virtual_kind].append(row)
+
+    def _update_rows(self):
+        """Realize the rows in view and recycle the ones that left it."""
+        count = self.model.get_n_items()
+        if count == 0:
+            return
+        adjustment = self.get_vadjustment()
+        top = adjustment.get_value()
+        bottom = top + (adjustment.get_page_size() or self.get_allocated_height())
+
+        first = max(0, bisect.bisect_right(self._offsets, top) - 1 - OVERSCAN_ROWS)
+        last = min(count - 1, bisect.bisect_left(self._offsets, bottom) + OVERSCAN_ROWS)
+
+        for position in [p for p in self._active if p < first or p > last]:
+            self._release(position)
+
+        for position in range(first, last + 1):
+            if position in self._active:
+                continue
+            item = self.model.get_item(position)
+            pool = self._pool[item.kind]
+            if pool:
+                row = pool.pop()
+                self.layout.move(row, 0, self._offsets[position])
+            else:
+                row = self._create_row(item.kind)
+                row.virtual_kind = item.kind
+                # Children start visible; bind_row hides what an item lacks
+                row.show_all()
+                self.layout.put(row, 0, self._offsets[position])
+            row.set_size_request(self._width, self._row_height(position))
+            self._bind_row(row, item)
+            row.show()
+            self._active[position] = row
@@ -0,0 +1,196 @@
+"""
+Catalog search module for Soplos Welcome.
+Indexes the software catalog once per language and answers ranked,
+accent-insensitive and typo-tolerant queries from memory.
+"""
+
+import re
+import threading
+import unicodedata
+
+from config.software import get_all_categories
+from core.i18n_manager import get_current_language
+
+
+# Weight of a match by the field it was found in
+FIELD_WEIGHTS = {
+    'name': 8.0,
+    'package': 4.0,
+    'flatpak': 3.0,
+    'description': 1.0,
+}
+
+# Weight of a match by how the query token matched an indexed token
+MATCH_EXACT = 1.0
+MATCH_PREFIX = 0.8
+MATCH_INFIX = 0.6
+MATCH_FUZZY = 0.4
+
+# Shortest query token that is matched inside words and with typos;
+# shorter ones match too much to be useful.
+MIN_INFIX_LENGTH = 3
+MIN_FUZZY_LENGTH = 4
+
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def fold_text(text: str) -> str:
+    """Casefold and strip accents, so "Navegación" and "navegacion" compare equal."""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text: str) -> list:
+    """Folded word tokens of a text. Package and Flatpak IDs split on their
+    separators, so "org.mozilla.firefox" yields "org", "mozilla", "firefox"."""
+    return _TOKEN_RE.findall(fold_text(text))
+
+
+def _trigrams(token: str) -> set:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance_within(a: str, b: str, limit: int) -> bool:
+    """True if the Levenshtein distance of a and b is at most limit."""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (ca != cb)))
+        # Every later row only grows from the smallest value of this one
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+class CatalogSearchIndex:
+    """
+    Inverted index over the software catalog.
+
+    Each package becomes a document with its name, translated description,
+    APT package and Flatpak ID. The vocabulary of folded tokens maps to the
+    documents containing them (with the weight of the best field), and two
+    auxiliary maps lead from a query token to vocabulary tokens: a prefix
+    map for as-you-type matching and a trigram map for matches inside words
+    and for typos. A query only touches the handful of vocabulary tokens
+    those maps return, never the catalog itself.
+    """
+
+    def __init__(self, categories: dict = None):
+        self.documents = []  # (category_id, package)
+        self._postings = {}  # token -> {doc: weight}
+        self._prefixes = {}  # prefix -> set of tokens
+        self._trigrams = {}  # trigram -> set of tokens
+        self.categories = categories if categories is not None else get_all_categories()
+        self._build(self.categories)
+
+    def _build(self, categories):
+        for category_id, category_data in categories.items():
+            for package in category_data.get('packages', []):
+                doc = len(self.documents)
+                self.documents.append((category_id, package))
+                for field, weight in FIELD_WEIGHTS.items():
+                    for token in tokenize(package.get(field) or ''):
+                        postings = self._postings.setdefault(token, {})
+                        if postings.get(doc, 0) < weight:
+                            postings[doc] = weight
+
+        for token in self._postings:
+            for i in range(1, len(token) + 1):
+                self._prefixes.setdefault(token[:i], set()).add(token)
+            for trigram in _trigrams(token):
+                self._trigrams.setdefault(trigram, set()).add(token)
+
+    def _match_token(self, query_token: str) -> dict:
+        """Map vocabulary tokens matching one query token to their match weight."""
+        matches = {}
+        if query_token in self._postings:
+            matches[query_token] = MATCH_EXACT
+        for token in self._prefixes.get(query_token, ()):
+            matches.setdefault(token, MATCH_PREFIX)
+        if len(query_token) < MIN_INFIX_LENGTH:
+            return matches
+
+        # Candidates share trigrams with the query token; count how many
+        query_trigrams = _trigrams(query_token)
+        shared = {}
+        for trigram in query_trigrams:
+            for token in self._trigrams.get(trigram, ()):
+                shared[token] = shared.get(token, 0) + 1
+
+        limit = 1 if len(query_token) <= 7 else 2
+        for token, count in shared.items():
+            if token in matches:
+                continue
+            if query_token in token:
+                matches[token] = MATCH_INFIX
+            elif (len(query_token) >= MIN_FUZZY_LENGTH
+                  # Each edit breaks at most three trigrams (q-gram lemma),
+                  # and a prefix match loses the trailing padded one
+                  and count >= len(query_trigrams) - 3 * limit - 1
+                  and _edit_distance_within(query_token, token[:len(query_token) + limit], limit)):
+                matches[token] = MATCH_FUZZY
+        return matches
+
+    def search(self, query: str) -> list:
+        """
+        Ranked matches for a query.
+
+        Every query word must match (exactly, as a prefix, inside a word or
+        with a small typo) some field of the package.
+
+        Returns:
+            List of (score, category_id, package), best first; ties keep
+            catalog order.
+        """
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+
+        scores = None
+        for query_token in query_tokens:
+            token_scores = {}
+            for token, match_weight in self._match_token(query_token).items():
+                for doc, field_weight in self._postings[token].items():
+                    score = field_weight * match_weight
+                    if token_scores.get(doc, 0) < score:
+                        token_scores[doc] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {doc: scores[doc] + score
+                          for doc, score in token_scores.items() if doc in scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(score, *self.documents[doc]) for doc, score in ranked]
+
+
+# Global instances for easy access, one per language: the catalog
+# descriptions are translated, so each language has its own vocabulary.
+_catalog_indexes = {}
+_catalog_lock = threading.Lock()
+
+def get_catalog_index() -> CatalogSearchIndex:
+    """
+    Returns the search index for the current language.
+    Creates it if it doesn't exist.
+    """
+    language = get_current_language()
+    categories = get_all_categories()
+    with _catalog_lock:
+        index = _catalog_indexes.get(language)
+        # A reloaded catalog is a new object; its old index is stale
+        if index is None or index.categories is not categories:
+            index = _catalog_indexes[language] = CatalogSearchIndex(categories)
+        return index
+
+def search_catalog(query: str) -> list:
+    """Convenience function: ranked (score, category_id, package) hits for a query."""
+    return get_catalog_index().search(query)
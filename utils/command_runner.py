@@ -3,8 +3,136 @@ import threading
 import time
 import re
 import os
+import pty
+import codecs
+import fcntl
+import select
+import shlex
+import shutil
+import struct
+import termios
+import tempfile
 from gi.repository import GLib
 from core.i18n_manager import _
+from utils.operation_scheduler import (
+    Operation, get_operation_scheduler, command_resources, RESOURCE_DPKG, RESOURCE_NETWORK,
+    PRIORITY_NORMAL
+)
+from utils.downloader import Artifact, Downloader, DOWNLOAD_DIR
+
+# Descriptor apt-get writes its status records to, inside the root shell
+APT_STATUS_FD = 3
+
+# Share of the progress bar given to downloading when apt has anything to
+# fetch; unpacking and configuring fill the rest.
+APT_DOWNLOAD_SHARE = 0.5
+
+# dlstatus:<item>:<percent>:<text>, pmstatus:<package>:<percent>:<text>,
+# pmerror:<package>:<percent>:<error>. Package names may carry an
+# architecture (libc6:amd64), hence the lazy package field.
+APT_STATUS_RE = re.compile(r'^(dlstatus|pmstatus|pmerror|pmconffile):(.*?):(\d+(?:\.\d+)?):(.*)$')
+
+
+# The UI shows a command's progress at most this often (~30 Hz), however
+# much output the command produces
+UI_FLUSH_INTERVAL_MS = 33
+
+# Terminal size reported to commands run on a pseudo-terminal; wide enough
+# that wget and flatpak do not squeeze their progress bars.
+PTY_ROWS = 24
+PTY_COLUMNS = 120
+
+# How long the pseudo-terminal may stay quiet before a pending partial line
+# (a progress bar redrawn in place) is taken as complete.
+PTY_IDLE_TIMEOUT = 0.1
+
+# CSI and OSC sequences, charset selection and keypad modes
+ANSI_ESCAPE_RE = re.compile(r'\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[()][0-9A-Za-z]|[=>78])')
+CONTROL_RE = re.compile(r'[\x00-\x08\x0b-\x1f\x7f]')
+
+# "45%" in wget's bar, flatpak's "███▌ 45%" and apt's "Progress: [ 45%]"
+PERCENT_RE = re.compile(r'(\d{1,3}(?:[.,]\d+)?)\s?%')
+# "2.1MB/s" (wget), "2.1 MB/s" (flatpak), "850 kB/s" (apt)
+RATE_RE = re.compile(r'\d+(?:[.,]\d+)?\s?[kKMG]i?B/s')
+
+
+def strip_ansi(text):
+    """Text of a terminal line without escape sequences or control characters."""
+    return CONTROL_RE.sub('', ANSI_ESCAPE_RE.sub('', text))
+
+
+def parse_native_progress(line):
+    """
+    Progress of a line as drawn by a tool that believes it is writing to a
+    terminal.
+
+    Returns:
+        (fraction, transfer rate or None), or None if the line has no percentage
+    """
+    percentages = [float(p.replace(',', '.')) for p in PERCENT_RE.findall(line)]
+    percentages = [p for p in percentages if p <= 100]
+    if not percentages:
+        return None
+    rate = RATE_RE.search(line)
+    return percentages[-1] / 100.0, rate.group(0) if rate else None
+
+
+# Row of the operation table flatpak prints before a transaction:
+# " 1. [✓] org.gnome.Platform  46  i  flathub  < 300 MB"
+FLATPAK_ROW_RE = re.compile(r'^\s*(\d+)\.\s+(?:\[[^\]]*\]\s+)?([A-Za-z0-9_-]+(?:\.[A-Za-z0-9_-]+)+)')
+# "Installing 2/5…" on flatpak's progress line; only the numbers are
+# taken, the verb is translated
+FLATPAK_STEP_RE = re.compile(r'(?<![\d.])(\d+)/(\d+)(?![\d.])')
+
+
+class FlatpakTransactionProgress:
+    """
+    Progress of a multi-ref "flatpak install", per operation of the
+    transaction (apps and the runtimes they pull in).
+
+    Reads the operation table to know which ref is number N, then turns
+    each "N/total … P%" progress line into an overall fraction.
+    """
+
+    def __init__(self):
+        self.refs = {}
+
+    def feed(self, line):
+        """
+        Returns:
+            (message, fraction, transfer rate or None), or None if the
+            line is not transaction progress
+        """
+        row = FLATPAK_ROW_RE.match(line)
+        if row:
+            self.refs[int(row.group(1))] = row.group(2)
+            return None
+        step = FLATPAK_STEP_RE.search(line)
+        native = parse_native_progress(line)
+        if not step or native is None:
+            return None
+        current, total = int(step.group(1)), int(step.group(2))
+        if not 0 < current <= total:
+            return None
+        percent, rate = native
+        ref = self.refs.get(current, '')
+        message = f"{ref} ({current}/{total})" if ref else f"{current}/{total}"
+        return message, ((current - 1) + percent) / total, rate
+
+
+def parse_apt_status(line):
+    """
+    Parse one record written to APT::Status-Fd.
+
+    Returns:
+        (kind, package, percent, text), or None for anything else
+    """
+    match = APT_STATUS_RE.match(line.strip())
+    if not match:
+        return None
+    kind, package, percent, text = match.groups()
+    return kind, package, float(percent), text
+
 
 class CommandRunner:
     def __init__(self, progress_bar=None, status_label=None, parent_window=None):
@@ -12,19 +140,415 @@ class CommandRunner:
         self.status_label = status_label
         self.parent_window = parent_window  # Add reference to parent window
         self.current_process = None
-        self.command_running = False
+        # Latest (message, fraction, hide) not yet shown, written by the
+        # reader threads and taken by the UI flush timer
+        self._update = None
+        self._update_lock = threading.Lock()
+        self._flush_source = None
+        # Every operation of this runner holds this resource: they share the
+        # update slot, last_message and current_process, so they run one
+        # after another while other runners' work still runs alongside.
+        self._resource = f"runner-{id(self)}"
     
-    def run_command(self, command, on_complete=None):
+    def run_apt(self, args, on_complete=None, priority=PRIORITY_NORMAL, label=None,
+                on_cancelled=None):
         """
-        Runs a command with optional callback on completion
+        Runs apt-get as root with optional callback on completion.
+
+        Progress comes from apt's machine-readable status records
+        (APT::Status-Fd) read through a private FIFO, not from its
+        translated output, so percentages and package names are exact in
+        every language.
+
+        Args:
+            args: apt-get arguments, e.g. ['install', '-y', 'vlc']
+
+        Returns:
+            The queued Operation
+        """
+        # pkexec does not pass extra descriptors on, so the root shell opens
+        # the FIFO itself. A private directory keeps other users out.
+        status_dir = tempfile.mkdtemp(prefix='soplos-apt-')
+        status_path = os.path.join(status_dir, 'status')
+        os.mkfifo(status_path, 0o600)
+
+        root_script = (f'exec {APT_STATUS_FD}>"$0" && exec apt-get '
+                       f'-o APT::Status-Fd={APT_STATUS_FD} -o Dpkg::Progress-Fancy=0 "$@"')
+        command = shlex.join(['pkexec', '/bin/sh', '-c', root_script, status_path, *args])
+        return self.run_command(command, on_complete, apt_status=status_path, use_pty=False,
+                                priority=priority, label=label or shlex.join(['apt-get', *args]),
+                                on_cancelled=on_cancelled)
+
+    def run_flatpak_install(self, refs, on_complete=None, remote='flathub', post_install=(),
+                            priority=PRIORITY_NORMAL, label=None, on_cancelled=None):
+        """
+        Installs several Flatpak refs in a single transaction, so runtimes
+        they share are resolved and downloaded once, with progress reported
+        per operation of the transaction.
+
+        If the transaction fails as a whole, each ref is retried on its own
+        so one broken ref does not hold back the others.
+
+        Args:
+            refs: application IDs to install from remote
+            post_install: (ref, script path) pairs; each script runs
+                afterwards if its ref ended up installed
+
+        Returns:
+            The queued Operation
+        """
+        quoted = ' '.join(shlex.quote(ref) for ref in refs)
+        remote = shlex.quote(remote)
+        lines = [
+            f"flatpak install -y {remote} {quoted} || "
+            f"for ref in {quoted}; do flatpak install -y {remote} \"$ref\"; done",
+        ]
+        for ref, script in post_install:
+            lines.append(f"if flatpak info {shlex.quote(ref)} >/dev/null 2>&1; "
+                         f"then bash {shlex.quote(script)}; fi")
+        lines.append("missing=0")
+        lines.append(f"for ref in {quoted}; do flatpak info \"$ref\" >/dev/null 2>&1 || missing=1; done")
+        lines.append("exit $missing")
+        return self.run_command('\n'.join(lines), on_complete, priority=priority,
+                                label=label or ' '.join(refs),
+                                progress_parser=FlatpakTransactionProgress(),
+                                on_cancelled=on_cancelled)
+
+    def run_downloads(self, artifacts, on_complete=None, priority=PRIORITY_NORMAL, label=None,
+                      on_cancelled=None):
+        """
+        Downloads artifacts in-process with the parallel, resumable
+        Downloader, showing their combined byte progress.
+
+        Args:
+            artifacts: utils.downloader.Artifact list
+            on_complete: called with the list of artifacts that failed
+            on_cancelled: called instead of on_complete if the operation is
+                cancelled; without it, on_complete gets every artifact
+                that did not arrive
+
+        Returns:
+            The queued Operation
+        """
+        artifacts = list(artifacts)
+        scheduler = get_operation_scheduler()
+
+        def report(done, total, rate):
+            if total:
+                message = _("Downloading {done} of {total}").format(
+                    done=GLib.format_size(done), total=GLib.format_size(total))
+                fraction = done / total
+            else:
+                message = _("Downloading {done}").format(done=GLib.format_size(done))
+                fraction = None
+            self._report_progress(f"{message} ({GLib.format_size(int(rate))}/s)", fraction)
+
+        def execute_downloads(operation):
+            failed = artifacts
+            try:
+                self._post(_("Starting..."), 0.0)
+                failed = Downloader().download(artifacts, report, operation.cancel_event)
+            except Exception as e:
+                print(f"Error downloading {operation.label}: {e}")
+            GLib.idle_add(scheduler.finished, operation)
+
+            if operation.cancel_requested:
+                self._post(_('Operation cancelled'), 0.0)
+            elif failed:
+                for artifact in failed:
+                    print(f"Download of {artifact.url} failed: {artifact.error}")
+                self._post(_('Download failed: {names}').format(
+                    names=', '.join(artifact.name for artifact in failed)), 0.0)
+            else:
+                self._post(_('Download completed'), 1.0)
+            time.sleep(3 if failed else 1)
+            self._post(None, None, hide=True)
+
+            if operation.cancel_requested and on_cancelled:
+                GLib.idle_add(on_cancelled)
+            elif on_complete:
+                GLib.idle_add(on_complete, failed)
+
+        def cancelled_while_queued():
+            if on_cancelled:
+                GLib.idle_add(on_cancelled)
+            elif on_complete:
+                GLib.idle_add(on_complete, artifacts)
+
+        operation = Operation(
+            label or ', '.join(artifact.name for artifact in artifacts),
+            {RESOURCE_NETWORK, self._resource},
+            lambda: threading.Thread(target=execute_downloads, args=(operation,), daemon=True).start(),
+            priority,
+            cancelled_while_queued
+        )
+        operation.cancel_event = threading.Event()
+        return scheduler.submit(operation)
+
+    def run_deb_install(self, debs, on_complete=None, priority=PRIORITY_NORMAL, label=None,
+                        on_cancelled=None):
+        """
+        Downloads .deb packages in parallel, then installs the ones that
+        arrived with a single apt-get transaction, which also pulls in their
+        dependencies. The files are removed once installed.
+
+        Args:
+            debs: (url, package name, sha256 or None) tuples
+            on_complete: called without arguments once everything is done
+            on_cancelled: called instead of on_complete if the download or
+                the install is cancelled
         """
-        if self.command_running:
+        artifacts = [Artifact(url, os.path.join(DOWNLOAD_DIR, f"{name}.deb"), sha256, name)
+                     for url, name, sha256 in debs]
+
+        def install(failed):
+            paths = [artifact.dest for artifact in artifacts if artifact not in failed]
+            if not paths:
+                if on_complete:
+                    on_complete()
+                return False
+
+            def remove_files():
+                for path in paths:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+
+            def installed():
+                remove_files()
+                if on_complete:
+                    on_complete()
+                return False
+
+            def install_cancelled():
+                remove_files()
+                if on_cancelled:
+                    on_cancelled()
+                elif on_complete:
+                    on_complete()
+                return False
+
+            self.run_apt(['install', '-y', *paths], installed, priority=priority, label=label,
+                         on_cancelled=install_cancelled)
+            return False
+
+        return self.run_downloads(artifacts, install, priority=priority, label=label,
+                                  on_cancelled=on_cancelled)
+
+    def _open_apt_status(self, status_path):
+        """
+        Start reading apt status records from the FIFO.
+
+        A write end is held open as well, so reads block until apt writes
+        and end-of-file only comes after it is released once the command
+        has exited (even if apt never started, e.g. authentication failed).
+
+        Returns:
+            (reader thread, held write descriptor)
+        """
+        read_fd = os.open(status_path, os.O_RDONLY | os.O_NONBLOCK)
+        hold_fd = os.open(status_path, os.O_WRONLY)
+        os.set_blocking(read_fd, True)
+        reader = threading.Thread(target=self._read_apt_status, args=(read_fd,), daemon=True)
+        reader.start()
+        return reader, hold_fd
+
+    def _read_apt_status(self, read_fd):
+        download_share = 0.0
+        with os.fdopen(read_fd, 'r', errors='replace') as stream:
+            for line in stream:
+                record = parse_apt_status(line)
+                if record is None:
+                    continue
+                kind, package, percent, text = record
+                if kind == 'dlstatus':
+                    download_share = APT_DOWNLOAD_SHARE
+                    fraction = percent / 100.0 * APT_DOWNLOAD_SHARE
+                elif kind == 'pmstatus':
+                    fraction = download_share + (1.0 - download_share) * percent / 100.0
+                else:
+                    if kind == 'pmerror':
+                        print(f"apt error ({package}): {text}")
+                    continue
+                self._report_progress(text, min(fraction, 1.0))
+
+    def _report_progress(self, message, fraction):
+        self.last_message = message
+        self._post(message, fraction)
+
+    def _post(self, message, fraction, hide=False):
+        """
+        Leave the latest status for the UI (any thread).
+
+        Updates only replace each other in a single slot; a timer on the
+        main loop shows whatever is there at most every
+        UI_FLUSH_INTERVAL_MS, so a chatty command costs the main loop no
+        more than a quiet one. fraction None pulses the bar; hide resets it.
+        """
+        with self._update_lock:
+            self._update = (message, fraction, hide)
+            if self._flush_source is None:
+                self._flush_source = GLib.timeout_add(UI_FLUSH_INTERVAL_MS, self._flush_update)
+
+    def _flush_update(self):
+        with self._update_lock:
+            update = self._update
+            self._update = None
+            if update is None:
+                # Nothing new for a whole interval; restart on the next post
+                self._flush_source = None
+                return False
+        message, fraction, hide = update
+
+        if self.parent_window and hasattr(self.parent_window, 'show_progress'):
+            if not hide:
+                self.parent_window.show_progress(message, fraction)
+            elif get_operation_scheduler().running():
+                # Another operation is still using the shared progress area
+                pass
+            elif hasattr(self.parent_window, 'hide_progress'):
+                self.parent_window.hide_progress()
+        else:
+            if self.progress_bar and (hide or fraction is not None):
+                self.progress_bar.set_fraction(0.0 if hide else fraction)
+            if self.status_label:
+                self.status_label.set_text("" if hide else message)
+        return True
+
+    def _spawn(self, command, use_pty):
+        """
+        Start a command with its output on a pseudo-terminal, or on a pipe
+        if use_pty is false or no pseudo-terminal can be allocated.
+
+        The terminal is not made the controlling terminal and stdin is
+        /dev/null, so nothing (pkexec, debconf, apt) can prompt on it.
+        Either way the command leads its own process group, so it can be
+        cancelled as a whole.
+
+        Returns:
+            (process, master descriptor or None)
+        """
+        if use_pty:
+            try:
+                master_fd, slave_fd = pty.openpty()
+            except OSError as e:
+                print(f"Error opening pseudo-terminal, using a pipe: {e}")
+            else:
+                try:
+                    fcntl.ioctl(slave_fd, termios.TIOCSWINSZ,
+                                struct.pack('HHHH', PTY_ROWS, PTY_COLUMNS, 0, 0))
+                    env = dict(os.environ)
+                    env.setdefault('TERM', 'xterm')
+                    process = subprocess.Popen(
+                        command,
+                        shell=True,
+                        stdin=subprocess.DEVNULL,
+                        stdout=slave_fd,
+                        stderr=slave_fd,
+                        env=env,
+                        start_new_session=True
+                    )
+                except Exception:
+                    os.close(master_fd)
+                    raise
+                finally:
+                    os.close(slave_fd)
+                return process, master_fd
+
+        process = subprocess.Popen(
+            command,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+            bufsize=1,
+            start_new_session=True
+        )
+        return process, None
+
+    def _output_lines(self, process, master_fd):
+        """
+        Lines of a command's output. On a pseudo-terminal every carriage
+        return ends a line too, so each redraw of a progress bar is seen,
+        and escape sequences are stripped.
+
+        The terminal is polled rather than read blindly: a bar redrawn in
+        place is taken as complete once the output goes quiet, and reading
+        ends when the command exits even if a background child it started
+        still holds the terminal open.
+        """
+        if master_fd is None:
+            yield from iter(process.stdout.readline, '')
             return
-            
-        self.command_running = True
+
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        pending = ''
+        while True:
+            ready, _w, _x = select.select([master_fd], [], [], PTY_IDLE_TIMEOUT)
+            if not ready:
+                if pending:
+                    yield strip_ansi(pending)
+                    pending = ''
+                if process.poll() is not None:
+                    break
+                continue
+            try:
+                data = os.read(master_fd, 4096)
+            except OSError:
+                # EIO: every writer has closed the terminal
+                data = b''
+            if not data:
+                break
+            segments = re.split(r'[\r\n]', pending + decoder.decode(data))
+            pending = segments.pop()
+            for segment in segments:
+                yield strip_ansi(segment)
+        if pending:
+            yield strip_ansi(pending)
+
+    def run_command(self, command, on_complete=None, apt_status=None, use_pty=True,
+                    priority=PRIORITY_NORMAL, label=None, progress_parser=None,
+                    on_cancelled=None):
+        """
+        Queues a command with optional callback on completion.
+
+        The command goes through the global operation scheduler: it starts
+        once nothing else holds the resources it needs (the dpkg lock, a
+        Flatpak installation, the network), and waits in the queue until
+        then instead of being dropped. Operations of one runner run one
+        after another, since they share its progress state.
+
+        If the operation is cancelled, queued or running, on_cancelled runs
+        instead of on_complete, so a chain of steps can stop rather than
+        go on with the next one. Without on_cancelled, on_complete runs
+        then too, to reset the caller's UI as after a failure.
+
+        By default the command runs on a pseudo-terminal, so wget, flatpak
+        and apt draw their own progress bars, which are read back as exact
+        fractions and transfer rates. use_pty=False runs it on a plain pipe.
+
+        apt_status is the FIFO run_apt() set up for apt's status records;
+        when given, progress is read from there instead of guessed from
+        the output.
+
+        progress_parser, if given, is fed every output line first; its
+        feed(line) returns (message, fraction, rate) for lines it
+        understands, or None to fall back to the generic detection.
+
+        Returns:
+            The queued Operation
+        """
+        scheduler = get_operation_scheduler()
         
-        def execute_command():
+        def execute_command(operation):
+            status_reader = None
+            hold_fd = None
+            master_fd = None
             try:
+                if apt_status:
+                    status_reader, hold_fd = self._open_apt_status(apt_status)
+
                 # Determine the type of installer/command
                 is_flatpak = 'flatpak' in command
                 is_apt = 'apt' in command
@@ -35,39 +559,39 @@ class CommandRunner:
                 total_packages = 0
                 current_package = 0
                 
-                process = subprocess.Popen(
-                    command,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1
-                )
+                process, master_fd = self._spawn(command, use_pty)
                 
+                operation.process = process
                 self.current_process = process
+                self.last_message = _("Processing...")
                 
                 # Update the progress bar at the start
-                if self.parent_window and hasattr(self.parent_window, 'show_progress'):
-                    GLib.idle_add(self.parent_window.show_progress, _("Starting..."), 0.0)
-                elif self.progress_bar:
-                    GLib.idle_add(self.progress_bar.set_fraction, 0.0)
+                self._post(_("Starting..."), 0.0)
 
-                for line in iter(process.stdout.readline, ''):
+                for line in self._output_lines(process, master_fd):
                     line = line.strip()
                     if not line:
                         continue
                     
-                    # Update status label/progress message
-                    if self.parent_window and hasattr(self.parent_window, 'show_progress'):
-                        # We update the message but keep current fraction until calculated
-                        pass 
-                    elif self.status_label:
-                        GLib.idle_add(self.status_label.set_text, line)
+                    # Progress comes from the status records
+                    if apt_status:
+                        continue
                     
                     progress = None
+                    rate = None
+                    native = parse_native_progress(line) if master_fd is not None else None
+                    parsed = progress_parser.feed(line) if progress_parser is not None else None
                     
                     # Detect progress depending on command type
-                    if is_wget:
+                    if parsed is not None:
+                        # A backend that knows this command's output
+                        self.last_message, progress, rate = parsed
+                    
+                    elif native is not None:
+                        # A tool's own progress bar, drawn for the terminal
+                        progress, rate = native
+                    
+                    elif is_wget:
                         # Parse wget progress format
                         if '%' in line:
                             try:
@@ -133,8 +657,7 @@ class CommandRunner:
                                 pass
                                 
                             if pkg_name:
-                                if self.parent_window and hasattr(self.parent_window, 'show_progress'):
-                                     GLib.idle_add(self.parent_window.show_progress, f"{_('Unpacking')} {pkg_name}...", None)
+                                self.last_message = f"{_('Unpacking')} {pkg_name}..."
                             
                             progress = min(0.5 + (current_package / max(total_packages, 1) * 0.25), 0.75)
                             
@@ -161,8 +684,7 @@ class CommandRunner:
                                 pass
 
                             if pkg_name:
-                                if self.parent_window and hasattr(self.parent_window, 'show_progress'):
-                                     GLib.idle_add(self.parent_window.show_progress, f"{_('Configuring')} {pkg_name}...", None)
+                                self.last_message = f"{_('Configuring')} {pkg_name}..."
 
                             progress = min(0.75 + (current_package / max(total_packages, 1) * 0.25), 1.0)
                     
@@ -174,76 +696,96 @@ class CommandRunner:
                     
                     # Update progress bar if we have a value
                     if progress is not None:
-                        if self.parent_window and hasattr(self.parent_window, 'show_progress'):
-                            # Only update fraction, keep text if we set it specifically above
-                            # Use last known message to avoid crashing if show_progress doesn't handle None
-                            msg = getattr(self, 'last_message', _("Processing..."))
-                            GLib.idle_add(self.parent_window.show_progress, msg, progress)
-                        elif self.progress_bar:
-                            GLib.idle_add(self.progress_bar.set_fraction, progress)
+                        # Only update fraction, keep text if we set it specifically above
+                        msg = self.last_message
+                        if rate:
+                            msg = f"{msg} ({rate})"
+                        self._post(msg, progress)
                     else:
                         # Just update text if no progress value
-                        if self.parent_window and hasattr(self.parent_window, 'show_progress'):
-                            self.last_message = line
-                            GLib.idle_add(self.parent_window.show_progress, line, None)
+                        self.last_message = line
+                        self._post(line, None)
                 
                 process.wait()
+                if status_reader is not None:
+                    os.close(hold_fd)
+                    hold_fd = None
+                    # Let the last records through before the final message
+                    status_reader.join(timeout=2)
+                
+                # Let waiting operations start while the result is on screen
+                GLib.idle_add(scheduler.finished, operation)
+                
                 success = process.returncode == 0
-                final_text = _('Operation completed successfully') if success else _('Operation failed (exit code {code})').format(code=process.returncode)
+                if operation.cancel_requested:
+                    final_text = _('Operation cancelled')
+                elif success:
+                    final_text = _('Operation completed successfully')
+                else:
+                    final_text = _('Operation failed (exit code {code})').format(code=process.returncode)
                 final_fraction = 1.0 if success else 0.0
 
                 # Complete the progress bar and status
-                if self.parent_window and hasattr(self.parent_window, 'show_progress'):
-                    GLib.idle_add(self.parent_window.show_progress, final_text, final_fraction)
-                elif self.progress_bar:
-                    GLib.idle_add(self.progress_bar.set_fraction, final_fraction)
-
-                if self.status_label and not self.parent_window:
-                     GLib.idle_add(self.status_label.set_text, final_text)
+                self._post(final_text, final_fraction)
 
                 # Wait a moment and clear (longer on failure so the user can read it)
                 time.sleep(1 if success else 3)
                 
-                if self.parent_window and hasattr(self.parent_window, 'hide_progress'):
-                    GLib.idle_add(self.parent_window.hide_progress)
-                else:
-                    if self.progress_bar:
-                        GLib.idle_add(self.progress_bar.set_fraction, 0.0)
-                    if self.status_label:
-                        GLib.idle_add(self.status_label.set_text, "")
+                self._post(None, None, hide=True)
                 
                 self.current_process = None
-                self.command_running = False
                 
                 # Run callback if provided
-                if on_complete:
+                if operation.cancel_requested and on_cancelled:
+                    GLib.idle_add(on_cancelled)
+                elif on_complete:
                     GLib.idle_add(on_complete)
                 
             except Exception as e:
+                GLib.idle_add(scheduler.finished, operation)
                 error_msg = f"{_('Error')}: {str(e)}"
-                if self.parent_window and hasattr(self.parent_window, 'show_progress'):
-                     GLib.idle_add(self.parent_window.show_progress, error_msg, 0.0)
-                elif self.status_label:
-                    GLib.idle_add(self.status_label.set_text, error_msg)
-                
-                if self.progress_bar and not self.parent_window:
-                    GLib.idle_add(self.progress_bar.set_fraction, 0.0)
+                self._post(error_msg, 0.0)
                 
                 # Hide progress after error
                 time.sleep(2)
-                if self.parent_window and hasattr(self.parent_window, 'hide_progress'):
-                    GLib.idle_add(self.parent_window.hide_progress)
+                self._post(None, None, hide=True)
                     
                 self.current_process = None
-                self.command_running = False
                 
                 # Run callback even on error so UI can reset
-                if on_complete:
+                if operation.cancel_requested and on_cancelled:
+                    GLib.idle_add(on_cancelled)
+                elif on_complete:
                     GLib.idle_add(on_complete)
+            
+            finally:
+                if master_fd is not None:
+                    os.close(master_fd)
+                if hold_fd is not None:
+                    os.close(hold_fd)
+                if apt_status:
+                    shutil.rmtree(os.path.dirname(apt_status), ignore_errors=True)
+        
+        def cancelled_while_queued():
+            if apt_status:
+                shutil.rmtree(os.path.dirname(apt_status), ignore_errors=True)
+            if on_cancelled:
+                GLib.idle_add(on_cancelled)
+            elif on_complete:
+                # Let the caller reset its UI as after a failure
+                GLib.idle_add(on_complete)
         
-        threading.Thread(target=execute_command, daemon=True).start()
+        resources = frozenset({RESOURCE_DPKG}) if apt_status else command_resources(command)
+        operation = Operation(
+            label or command,
+            resources | {self._resource},
+            lambda: threading.Thread(target=execute_command, args=(operation,), daemon=True).start(),
+            priority,
+            cancelled_while_queued
+        )
+        return scheduler.submit(operation)
 
 # Convenience function for scripts that don't need the full class
-def run_command(command, progress_bar=None, status_label=None, on_complete=None):
+def run_command(command, progress_bar=None, status_label=None, on_complete=None, use_pty=True):
     runner = CommandRunner(progress_bar, status_label)
-    runner.run_command(command, on_complete)
+    return runner.run_command(command, on_complete, use_pty=use_pty)
@@ -0,0 +1,363 @@
+"""
+Artifact downloader for Soplos Welcome.
+Fetches .deb packages and AppImages over HTTP(S) with a bounded number of
+concurrent transfers, keep-alive connections per host, resume of partial
+files through Range requests and streaming SHA-256 verification.
+"""
+
+import hashlib
+import http.client
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+
+# Transfers running at once; a batch takes about as long as its slowest file
+MAX_CONCURRENT_DOWNLOADS = 4
+
+CHUNK_SIZE = 64 * 1024
+MAX_REDIRECTS = 5
+# Network errors are retried, resuming from what was already received
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 2
+TIMEOUT = 30
+# Aggregated progress is reported at most this often (seconds)
+PROGRESS_INTERVAL = 0.1
+USER_AGENT = 'soplos-welcome'
+# Saved next to "<dest>.part": the ETag or Last-Modified the part came from
+VALIDATOR_SUFFIX = '.validator'
+
+# Partial files are kept here between attempts so a later one can resume
+DOWNLOAD_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'soplos-welcome', 'downloads'
+)
+
+_CONTENT_RANGE_RE = re.compile(r'bytes\s+(\d+)-\d+/(\d+|\*)')
+_UNSATISFIED_RANGE_RE = re.compile(r'bytes\s+\*/(\d+)')
+
+
+class DownloadError(Exception):
+    """A download that retrying will not fix: an HTTP error, a checksum
+    mismatch or cancellation."""
+
+
+class Artifact:
+    """
+    One file to download.
+
+    After Downloader.download(), error is None if dest holds the complete
+    (and, with sha256 given, verified) file.
+    """
+
+    def __init__(self, url: str, dest: str, sha256: str = None, name: str = None):
+        self.url = url
+        self.dest = dest
+        self.sha256 = sha256.lower() if sha256 else None
+        self.name = name or os.path.basename(dest)
+        self.size = None      # total bytes, once the server told
+        self.received = 0     # bytes on disk, including a resumed part
+        self.error = None
+
+
+class Downloader:
+    """
+    Downloads a list of artifacts in parallel.
+
+    Each worker thread keeps one connection per host open between requests.
+    Bytes go to "<dest>.part" and are hashed as they arrive; the part is
+    renamed to dest once complete and verified. The server's ETag or
+    Last-Modified is saved next to the part, and a part left by an earlier
+    attempt is resumed with a Range request conditional on it (If-Range),
+    so a file that changed on the server is downloaded again from the
+    start. A part without a validator is only resumed when a SHA-256 will
+    catch a mismatch; otherwise it is discarded.
+    """
+
+    def __init__(self, max_workers: int = MAX_CONCURRENT_DOWNLOADS):
+        self.max_workers = max_workers
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._artifacts = []
+        self._on_progress = None
+        self._cancel_event = None
+        self._started = 0.0
+        self._session_bytes = 0
+        self._last_report = 0.0
+
+    def download(self, artifacts, on_progress=None, cancel_event=None) -> list:
+        """
+        Download every artifact, max_workers at a time.
+
+        Args:
+            on_progress: called from the worker threads with (bytes done,
+                total bytes or None while a size is unknown, bytes/s)
+            cancel_event: threading.Event that stops all transfers when set;
+                partial files are kept for a later resume
+
+        Returns:
+            The artifacts that failed, each with its error set
+        """
+        artifacts = list(artifacts)
+        if not artifacts:
+            return []
+        self._artifacts = artifacts
+        self._on_progress = on_progress
+        self._cancel_event = cancel_event
+        self._started = time.monotonic()
+        self._session_bytes = 0
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(artifacts)),
+                                    thread_name_prefix='download') as pool:
+                list(pool.map(self._download, artifacts))
+        finally:
+            with self._lock:
+                for connection in self._connections:
+                    connection.close()
+                self._connections.clear()
+        self._report(force=True)
+        return [artifact for artifact in artifacts if artifact.error]
+
+    def _cancelled(self):
+        return self._cancel_event is not None and self._cancel_event.is_set()
+
+    def _download(self, artifact):
+        artifact.error = None
+        if artifact.sha256 and _file_sha256(artifact.dest) == artifact.sha256:
+            # Verified copy from an earlier run
+            artifact.size = artifact.received = os.path.getsize(artifact.dest)
+            self._report()
+            return
+
+        for attempt in range(MAX_ATTEMPTS):
+            if self._cancelled():
+                artifact.error = "cancelled"
+                return
+            try:
+                self._fetch(artifact)
+                artifact.error = None
+                return
+            except DownloadError as e:
+                artifact.error = str(e)
+                return
+            except (OSError, http.client.HTTPException) as e:
+                # The connection may be mid-response; start the retry on a new one
+                self._drop_connections()
+                artifact.error = str(e) or type(e).__name__
+                print(f"Download of {artifact.url} interrupted ({artifact.error}), "
+                      f"attempt {attempt + 1} of {MAX_ATTEMPTS}")
+                if attempt + 1 < MAX_ATTEMPTS:
+                    time.sleep(RETRY_DELAY)
+
+    def _drop_connections(self):
+        """Close this worker's connections."""
+        for connection in getattr(self._local, 'connections', {}).values():
+            connection.close()
+        self._local.connections = {}
+
+    def _connection(self, scheme, netloc, fresh=False):
+        """Keep-alive connection to a host, one per worker thread."""
+        connections = getattr(self._local, 'connections', None)
+        if connections is None:
+            connections = self._local.connections = {}
+        key = (scheme, netloc)
+        connection = connections.get(key)
+        if connection is not None and fresh:
+            connection.close()
+            connection = None
+        if connection is None:
+            if scheme == 'https':
+                connection = http.client.HTTPSConnection(netloc, timeout=TIMEOUT)
+            elif scheme == 'http':
+                connection = http.client.HTTPConnection(netloc, timeout=TIMEOUT)
+            else:
+                raise DownloadError(f"unsupported URL scheme: {scheme}")
+            connections[key] = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _request(self, url, offset, validator=None):
+        """GET url from offset on, following redirects."""
+        for _redirect in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+            headers = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'identity'}
+            if offset:
+                headers['Range'] = f"bytes={offset}-"
+                if validator:
+                    headers['If-Range'] = validator
+
+            connection = self._connection(parts.scheme, parts.netloc)
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # The server closed the idle keep-alive connection
+                connection = self._connection(parts.scheme, parts.netloc, fresh=True)
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+
+            if response.status in (301, 302, 303, 307, 308):
+                location = response.getheader('Location')
+                response.read()
+                if not location:
+                    raise DownloadError(f"HTTP {response.status} without a location")
+                url = urljoin(url, location)
+                continue
+            return response
+        raise DownloadError("too many redirects")
+
+    def _fetch(self, artifact):
+        part_path = artifact.dest + '.part'
+        os.makedirs(os.path.dirname(os.path.abspath(part_path)), exist_ok=True)
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        validator = _read_validator(part_path) if offset else None
+        if offset and validator is None and not artifact.sha256:
+            # Nothing would tell an old prefix from the current file
+            _remove_part(part_path)
+            offset = 0
+
+        response = self._request(artifact.url, offset, validator)
+        status = response.status
+
+        if status == 416 and offset:
+            # Nothing left past the part: it is either complete or stale
+            response.read()
+            match = _UNSATISFIED_RANGE_RE.match(response.getheader('Content-Range') or '')
+            if match and int(match.group(1)) == offset:
+                artifact.size = artifact.received = offset
+                self._finish(artifact, part_path, _file_sha256(part_path))
+                return
+            _remove_part(part_path)
+            raise http.client.HTTPException("stale partial file discarded")
+        if status == 206:
+            match = _CONTENT_RANGE_RE.match(response.getheader('Content-Range') or '')
+            if not match or int(match.group(1)) != offset:
+                response.read()
+                _remove_part(part_path)
+                raise http.client.HTTPException("unexpected Content-Range")
+        elif status == 200:
+            # Full body: no range was asked for, the server ignored it, or
+            # the file changed since the part was written (If-Range)
+            offset = 0
+            _write_validator(part_path, _response_validator(response))
+        elif 500 <= status < 600:
+            response.read()
+            raise http.client.HTTPException(f"HTTP {status}")
+        else:
+            response.read()
+            raise DownloadError(f"HTTP {status} {response.reason}")
+
+        digest = hashlib.sha256()
+        if offset:
+            _hash_file(part_path, digest)
+        length = response.getheader('Content-Length')
+        artifact.size = offset + int(length) if length is not None else None
+        with self._lock:
+            artifact.received = offset
+
+        with open(part_path, 'ab' if offset else 'wb') as f:
+            while True:
+                if self._cancelled():
+                    response.close()
+                    raise DownloadError("cancelled")
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                digest.update(chunk)
+                with self._lock:
+                    artifact.received += len(chunk)
+                    self._session_bytes += len(chunk)
+                self._report()
+
+        if artifact.size is not None and artifact.received != artifact.size:
+            raise http.client.IncompleteRead(b'', artifact.size - artifact.received)
+        artifact.size = artifact.received
+        self._finish(artifact, part_path, digest.hexdigest())
+
+    def _finish(self, artifact, part_path, sha256):
+        if artifact.sha256 and sha256 != artifact.sha256:
+            _remove_part(part_path)
+            raise DownloadError(f"SHA-256 mismatch for {artifact.name}")
+        os.replace(part_path, artifact.dest)
+        _remove_file(part_path + VALIDATOR_SUFFIX)
+        self._report()
+
+    def _report(self, force=False):
+        if self._on_progress is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_report < PROGRESS_INTERVAL:
+                return
+            self._last_report = now
+            # Failed artifacts no longer count towards the total
+            active = [artifact for artifact in self._artifacts if artifact.error is None]
+            done = sum(artifact.received for artifact in active)
+            sizes = [artifact.size for artifact in active]
+            total = None if None in sizes else sum(sizes)
+            elapsed = now - self._started
+            rate = self._session_bytes / elapsed if elapsed > 0 else 0.0
+        self._on_progress(done, total, rate)
+
+
+def _response_validator(response):
+    """Strong ETag, else Last-Modified, usable in If-Range; None if neither."""
+    etag = response.getheader('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.getheader('Last-Modified')
+
+
+def _read_validator(part_path):
+    try:
+        with open(part_path + VALIDATOR_SUFFIX, 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _write_validator(part_path, validator):
+    if validator:
+        with open(part_path + VALIDATOR_SUFFIX, 'w', encoding='utf-8') as f:
+            f.write(validator)
+    else:
+        _remove_file(part_path + VALIDATOR_SUFFIX)
+
+
+def _remove_part(part_path):
+    """Delete a partial file and its saved validator."""
+    _remove_file(part_path)
+    _remove_file(part_path + VALIDATOR_SUFFIX)
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _hash_file(path, digest):
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+
+
+def _file_sha256(path):
+    """Hex SHA-256 of a file, or None if it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        _hash_file(path, digest)
+    except OSError:
+        return None
+    return digest.hexdigest()
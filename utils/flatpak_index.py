@@ -0,0 +1,179 @@
+"""
+Flatpak installation index for Soplos Welcome.
+Answers "is this app installed" from the on-disk deploy directories of the
+system and user installations, without starting the flatpak CLI.
+"""
+
+import os
+import threading
+
+
+SYSTEM_INSTALLATION = 'system'
+USER_INSTALLATION = 'user'
+
+
+def get_installation_dirs():
+    """Return [(installation_name, base_dir)] honouring the same environment
+    overrides the flatpak CLI does."""
+    system_dir = os.environ.get('FLATPAK_SYSTEM_DIR', '/var/lib/flatpak')
+    user_dir = os.environ.get('FLATPAK_USER_DIR') or os.path.join(
+        os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share'),
+        'flatpak'
+    )
+    return [(USER_INSTALLATION, user_dir), (SYSTEM_INSTALLATION, system_dir)]
+
+
+def _parse_ref(ref):
+    """Split an app ref into (app_id, arch, branch). Accepts a bare ID
+    ("org.foo.Bar"), "org.foo.Bar//stable" and "app/org.foo.Bar/x86_64/stable"."""
+    parts = ref.split('/')
+    if parts[0] == 'app' and len(parts) > 1:
+        parts = parts[1:]
+    app_id = parts[0]
+    arch = parts[1] if len(parts) > 1 and parts[1] else None
+    branch = parts[2] if len(parts) > 2 and parts[2] else None
+    return app_id, arch, branch
+
+
+class FlatpakIndex:
+    """
+    In-process view of installed Flatpak apps.
+
+    Every installation keeps one directory per app under app/, and each app
+    has a "current" symlink pointing at the <arch>/<branch> deploy in use.
+    Those directories are enumerated once; later lookups only stat the app/
+    directories and the per-app directories below them, and enumerate again
+    when one of them changed.
+    """
+
+    def __init__(self, installations=None):
+        self._installations = installations
+        self._apps = {}
+        self._signature = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _get_installations(self):
+        return self._installations if self._installations is not None else get_installation_dirs()
+
+    def _stat_signature(self):
+        signature = []
+        for name, base in self._get_installations():
+            apps_dir = os.path.join(base, 'app')
+            try:
+                signature.append((name, os.stat(apps_dir).st_mtime_ns))
+                # Uninstalling can leave the app directory in place and only
+                # drop its deploy, which does not touch app/ itself.
+                with os.scandir(apps_dir) as it:
+                    for entry in it:
+                        signature.append((entry.name, entry.stat(follow_symlinks=False).st_mtime_ns))
+            except OSError:
+                signature.append((name, None))
+        return tuple(signature)
+
+    def _scan(self):
+        """Enumerate deploys into {app_id: [deploy, ...]}. A deploy is a dict
+        with 'id', 'arch', 'branch', 'installation' and 'current' keys."""
+        apps = {}
+        for name, base in self._get_installations():
+            apps_dir = os.path.join(base, 'app')
+            try:
+                app_ids = os.listdir(apps_dir)
+            except OSError:
+                continue
+            for app_id in app_ids:
+                app_dir = os.path.join(apps_dir, app_id)
+                try:
+                    current = os.readlink(os.path.join(app_dir, 'current'))
+                except OSError:
+                    current = None
+                try:
+                    arches = os.listdir(app_dir)
+                except OSError:
+                    continue
+                for arch in arches:
+                    arch_dir = os.path.join(app_dir, arch)
+                    if arch == 'current' or not os.path.isdir(arch_dir):
+                        continue
+                    try:
+                        branches = os.listdir(arch_dir)
+                    except OSError:
+                        continue
+                    for branch in branches:
+                        # Only a deploy with an "active" checkout is installed;
+                        # a half-removed one is just an empty directory.
+                        if not os.path.exists(os.path.join(arch_dir, branch, 'active')):
+                            continue
+                        apps.setdefault(app_id, []).append({
+                            'id': app_id,
+                            'arch': arch,
+                            'branch': branch,
+                            'installation': name,
+                            'current': current == f"{arch}/{branch}",
+                        })
+        return apps
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Re-enumerate the deploy directories if any of them changed.
+
+        Returns:
+            True if the index was rebuilt
+        """
+        signature = self._stat_signature()
+        if not force and self._loaded and signature == self._signature:
+            return False
+        with self._lock:
+            if not force and self._loaded and signature == self._signature:
+                return False
+            self._apps = self._scan()
+            self._signature = signature
+            self._loaded = True
+        return True
+
+    def get_deploys(self, ref: str) -> list:
+        """All installed deploys matching a ref, current ones first."""
+        self.refresh()
+        app_id, arch, branch = _parse_ref(ref)
+        deploys = [
+            d for d in self._apps.get(app_id, [])
+            if (arch is None or d['arch'] == arch) and (branch is None or d['branch'] == branch)
+        ]
+        return sorted(deploys, key=lambda d: not d['current'])
+
+    def get_deploy(self, ref: str):
+        """The deploy a ref resolves to (installation, arch, branch), or None."""
+        deploys = self.get_deploys(ref)
+        return deploys[0] if deploys else None
+
+    def is_installed(self, ref: str) -> bool:
+        """True if the app is installed in the system or the user installation."""
+        return bool(self.get_deploys(ref))
+
+    def installed_apps(self) -> list:
+        """IDs of all installed apps."""
+        self.refresh()
+        return list(self._apps.keys())
+
+    def all_deploys(self) -> dict:
+        """Map of app ID -> list of its deploys, for diffing two states."""
+        self.refresh()
+        return {app_id: list(deploys) for app_id, deploys in self._apps.items()}
+
+
+# Global instance for easy access
+_flatpak_index = None
+
+def get_flatpak_index() -> FlatpakIndex:
+    """
+    Returns the global Flatpak index.
+    Creates it if it doesn't exist.
+    """
+    global _flatpak_index
+    if _flatpak_index is None:
+        _flatpak_index = FlatpakIndex()
+    return _flatpak_index
+
+def is_flatpak_installed(ref: str) -> bool:
+    """Convenience function: True if a Flatpak app is installed."""
+    return get_flatpak_index().is_installed(ref)
@@ -7,16 +7,24 @@ import subprocess
 import re
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from gi.repository import GLib
 from core.i18n_manager import _
+from core.snapshot_cache import get_snapshot_cache
+from utils.package_index import get_package_index
+from utils.pci_devices import (
+    list_pci_devices, describe_device, is_display_device, is_audio_device,
+    is_wireless_device, is_bluetooth_device, VENDOR_NVIDIA, VENDOR_AMD, VENDOR_INTEL
+)
 
 
-def _get_lspci_output():
-    """Run lspci once and return output."""
+def _get_pci_devices():
+    """PCI device records read from sysfs (see utils.pci_devices)."""
     try:
-        return subprocess.check_output(['lspci'], stderr=subprocess.DEVNULL).decode('utf-8')
-    except Exception:
-        return ''
+        return list_pci_devices()
+    except Exception as e:
+        print(f"Error enumerating PCI devices: {e}")
+        return []
 
 
 def _get_lsusb_output():
@@ -27,21 +35,26 @@ def _get_lsusb_output():
         return ''
 
 
-def _is_package_installed(package):
+def _get_package_snapshot():
+    """Current package database state. A scan takes one and hands it to
+    every detector, so the database is read once per scan."""
+    return get_package_index().snapshot()
+
+
+def _is_package_installed(package, packages=None):
     """Check if a dpkg package is installed."""
-    try:
-        result = subprocess.run(
-            ['dpkg', '-s', package],
-            capture_output=True, text=True
-        )
-        return 'Status: install ok installed' in result.stdout
-    except Exception:
-        return False
+    if packages is None:
+        packages = _get_package_snapshot()
+    return packages.is_installed(package)
 
 
-def _packages_status(required_packages):
+def _packages_status(required_packages, packages=None):
     """Check status of a list of required packages. Returns (status, missing_list)."""
-    missing = [p for p in required_packages if not _is_package_installed(p)]
+    if packages is None:
+        packages = _get_package_snapshot()
+    statuses = packages.status_many(required_packages)
+    missing = [p for p, record in statuses.items()
+               if record is None or record['status'] != 'installed']
     if not missing:
         return 'installed', []
     elif len(missing) == len(required_packages):
@@ -50,7 +63,7 @@ def _packages_status(required_packages):
         return 'partial', missing
 
 
-def _detect_installed_nvidia_driver():
+def _detect_installed_nvidia_driver(packages=None):
     """Return major version string of installed NVIDIA driver, or None."""
     try:
         result = subprocess.run(
@@ -64,26 +77,22 @@ def _detect_installed_nvidia_driver():
     except Exception:
         pass
 
-    try:
-        result = subprocess.run(['dpkg', '-l'], capture_output=True, text=True)
-        for line in result.stdout.split('\n'):
-            if not line.startswith('ii'):
-                continue
-            parts = line.split()
-            if len(parts) >= 2 and re.fullmatch(r'nvidia-driver-(\d+)', parts[1]):
-                return re.search(r'\d+', parts[1]).group()
-    except Exception:
-        pass
+    if packages is None:
+        packages = _get_package_snapshot()
+    for name in packages.installed_matching(r'nvidia-driver-\d+$'):
+        return re.search(r'\d+', name).group()
 
     return None
 
 
-def _nvidia_driver_status(recommended_driver):
+def _nvidia_driver_status(recommended_driver, packages=None):
     """Check NVIDIA driver status. Returns (status, missing_packages, installed_version)."""
-    installed_version = _detect_installed_nvidia_driver()
+    if packages is None:
+        packages = _get_package_snapshot()
+    installed_version = _detect_installed_nvidia_driver(packages)
 
     if recommended_driver == 'nouveau':
-        installed = _is_package_installed('xserver-xorg-video-nouveau')
+        installed = _is_package_installed('xserver-xorg-video-nouveau', packages)
         return (
             'installed' if installed else 'missing',
             [] if installed else ['xserver-xorg-video-nouveau'],
@@ -101,7 +110,7 @@ def _nvidia_driver_status(recommended_driver):
             return 'missing', [recommended_driver], None
 
     if recommended_driver == 'nvidia-driver':
-        installed = _is_package_installed('nvidia-driver')
+        installed = _is_package_installed('nvidia-driver', packages)
         if installed:
             return 'installed', [], installed_version
         elif installed_version:
@@ -110,7 +119,7 @@ def _nvidia_driver_status(recommended_driver):
             return 'missing', ['nvidia-driver'], None
 
     # Legacy drivers (nvidia-tesla-470-driver, nvidia-legacy-390xx-driver, etc.)
-    installed = _is_package_installed(recommended_driver)
+    installed = _is_package_installed(recommended_driver, packages)
     return (
         'installed' if installed else 'missing',
         [] if installed else [recommended_driver],
@@ -241,35 +250,39 @@ def _recommend_nvidia_driver(model):
     return 'nouveau'
 
 
-def detect_all_gpus(lspci_output=None):
+# Display adapters emulated by hypervisors, by PCI vendor ID
+VIRTUAL_GPU_VENDORS = {
+    0x15ad: 'VMware SVGA II',
+    0x80ee: 'VirtualBox VGA',
+    0x1b36: 'QXL (QEMU/KVM)',
+    0x1af4: 'VirtIO GPU',
+    0x1234: 'Virtual GPU',  # Bochs/QEMU standard VGA
+}
+
+
+def detect_all_gpus(pci_devices=None, packages=None):
     """Detect all GPUs. Returns list of dicts with driver_status info."""
     try:
-        if lspci_output is None:
-            lspci_output = _get_lspci_output()
+        if pci_devices is None:
+            pci_devices = _get_pci_devices()
+        if packages is None:
+            packages = _get_package_snapshot()
 
         gpus = []
         nvidia_version_checked = False
         nvidia_installed_version = None
 
-        for line in lspci_output.split('\n'):
-            line_lower = line.lower()
-
-            if not any(k in line_lower for k in ['vga', '3d', 'display']):
+        for device in pci_devices:
+            if not is_display_device(device):
                 continue
 
+            # The model extractors read the pci.ids names, the same text lspci prints
+            line = describe_device(device)
+            vendor_id = device['vendor_id']
+
             # Virtual GPU — no real driver needed
-            if any(k in line_lower for k in ['vmware svga', 'virtualbox graphics', 'vbox graphics',
-                                              'qxl paravirtual', 'bochs vbe', 'virtio gpu', 'red hat qxl']):
-                if 'vmware' in line_lower:
-                    model = 'VMware SVGA II'
-                elif 'virtualbox' in line_lower or 'vbox' in line_lower:
-                    model = 'VirtualBox VGA'
-                elif 'qxl' in line_lower or 'red hat' in line_lower:
-                    model = 'QXL (QEMU/KVM)'
-                elif 'virtio' in line_lower:
-                    model = 'VirtIO GPU'
-                else:
-                    model = 'Virtual GPU'
+            if vendor_id in VIRTUAL_GPU_VENDORS:
+                model = VIRTUAL_GPU_VENDORS[vendor_id]
                 gpus.append({
                     'vendor': 'Virtual',
                     'model': model,
@@ -281,13 +294,13 @@ def detect_all_gpus(lspci_output=None):
                 })
 
             # NVIDIA
-            elif re.search(r'\bnvidia\b', line_lower):
+            elif vendor_id == VENDOR_NVIDIA:
                 model = _extract_nvidia_model(line)
                 recommended = _recommend_nvidia_driver(model)
                 if not nvidia_version_checked:
-                    nvidia_installed_version = _detect_installed_nvidia_driver()
+                    nvidia_installed_version = _detect_installed_nvidia_driver(packages)
                     nvidia_version_checked = True
-                status, missing, installed_ver = _nvidia_driver_status(recommended)
+                status, missing, installed_ver = _nvidia_driver_status(recommended, packages)
                 gpus.append({
                     'vendor': 'NVIDIA',
                     'model': model,
@@ -299,11 +312,11 @@ def detect_all_gpus(lspci_output=None):
                 })
 
             # AMD
-            elif re.search(r'\b(amd|ati|radeon)\b', line_lower):
+            elif vendor_id == VENDOR_AMD:
                 model = _extract_amd_model(line)
                 required = ['firmware-amd-graphics', 'libgl1-mesa-dri', 'libglx-mesa0',
                             'mesa-vulkan-drivers', 'xserver-xorg-video-all']
-                status, missing = _packages_status(required)
+                status, missing = _packages_status(required, packages)
                 gpus.append({
                     'vendor': 'AMD',
                     'model': model,
@@ -315,10 +328,10 @@ def detect_all_gpus(lspci_output=None):
                 })
 
             # Intel
-            elif re.search(r'\bintel\b', line_lower):
+            elif vendor_id == VENDOR_INTEL:
                 model = _extract_intel_model(line)
                 required = ['intel-media-va-driver', 'mesa-vulkan-drivers']
-                status, missing = _packages_status(required)
+                status, missing = _packages_status(required, packages)
                 gpus.append({
                     'vendor': 'Intel',
                     'model': model,
@@ -337,9 +350,9 @@ def detect_all_gpus(lspci_output=None):
 
 
 # Keep for backwards compatibility (used by _on_detect_hybrid_clicked indirectly)
-def detect_gpu(lspci_output=None):
+def detect_gpu(pci_devices=None):
     """Return primary GPU dict (for backwards compatibility)."""
-    gpus = detect_all_gpus(lspci_output)
+    gpus = detect_all_gpus(pci_devices)
     for vendor in ('NVIDIA', 'AMD', 'Intel'):
         for gpu in gpus:
             if gpu['vendor'] == vendor:
@@ -351,27 +364,27 @@ def detect_gpu(lspci_output=None):
     }
 
 
-def detect_hybrid_gpu(lspci_output=None):
+def detect_hybrid_gpu(pci_devices=None):
     """Detect if the system has hybrid graphics (integrated + dedicated)."""
     try:
-        if lspci_output is None:
-            lspci_output = _get_lspci_output()
+        if pci_devices is None:
+            pci_devices = _get_pci_devices()
 
         nvidia_gpu = None
         intel_gpu = None
         amd_igpu = None
 
-        for line in lspci_output.split('\n'):
-            line_lower = line.lower()
-
-            if not any(k in line_lower for k in ['vga', '3d', 'display']):
+        for device in pci_devices:
+            if not is_display_device(device):
                 continue
 
-            if re.search(r'\bnvidia\b', line_lower):
+            line = describe_device(device)
+            vendor_id = device['vendor_id']
+            if vendor_id == VENDOR_NVIDIA:
                 nvidia_gpu = f"NVIDIA {_extract_nvidia_model(line)}"
-            elif re.search(r'\bintel\b', line_lower):
+            elif vendor_id == VENDOR_INTEL:
                 intel_gpu = f"Intel {_extract_intel_model(line)}"
-            elif re.search(r'\b(amd|ati|radeon)\b', line_lower):
+            elif vendor_id == VENDOR_AMD:
                 model = _extract_amd_model(line)
                 model_lower = model.lower()
                 if not any(s in model_lower for s in ['rx ', 'vega', 'vii', 'radeon pro']):
@@ -410,32 +423,50 @@ def _identify_wifi_vendor(line_lower):
         return None, None
 
 
-def detect_wifi(lspci_output=None, lsusb_output=None):
+# Wi-Fi chip makers by PCI vendor ID, so the firmware is found even when
+# pci.ids has no name for the card
+PCI_WIFI_VENDORS = {
+    0x8086: ('Intel', 'firmware-iwlwifi'),
+    0x10ec: ('Realtek', 'firmware-realtek'),
+    0x14e4: ('Broadcom', 'firmware-b43-installer'),
+    0x168c: ('Atheros/Qualcomm', 'firmware-atheros'),
+    0x17cb: ('Atheros/Qualcomm', 'firmware-atheros'),
+    0x1814: ('Ralink/MediaTek', 'firmware-ralink'),
+    0x14c3: ('Ralink/MediaTek', 'firmware-ralink'),
+    0x11ab: ('Marvell', 'firmware-libertas'),
+    0x1b4b: ('Marvell', 'firmware-libertas'),
+}
+
+
+def detect_wifi(pci_devices=None, lsusb_output=None, packages=None):
     """Detect Wi-Fi adapters and check firmware status."""
     try:
-        if lspci_output is None:
-            lspci_output = _get_lspci_output()
+        if pci_devices is None:
+            pci_devices = _get_pci_devices()
         if lsusb_output is None:
             lsusb_output = _get_lsusb_output()
+        if packages is None:
+            packages = _get_package_snapshot()
 
         adapters = []
         seen = set()
         wifi_keywords = ['wireless', 'wifi', '802.11', 'wlan', 'wi-fi']
 
-        for line in lspci_output.split('\n'):
-            line_lower = line.lower()
-            if not any(k in line_lower for k in wifi_keywords):
+        for device in pci_devices:
+            if not is_wireless_device(device):
                 continue
-            vendor, firmware = _identify_wifi_vendor(line_lower)
+            line = describe_device(device)
+            vendor, firmware = PCI_WIFI_VENDORS.get(device['vendor_id'],
+                                                    _identify_wifi_vendor(line.lower()))
             if not vendor:
                 vendor = 'Unknown'
             key = (vendor, firmware)
             if key in seen:
                 continue
             seen.add(key)
-            missing = [firmware] if firmware and not _is_package_installed(firmware) else []
+            missing = [firmware] if firmware and not _is_package_installed(firmware, packages) else []
             adapters.append({
-                'model': line.split(':')[-1].strip()[:60],
+                'model': line[:60],
                 'vendor': vendor,
                 'firmware_package': firmware,
                 'driver_status': 'missing' if missing else 'installed',
@@ -454,7 +485,7 @@ def detect_wifi(lspci_output=None, lsusb_output=None):
                 continue
             seen.add(key)
             model = line.split(':', 3)[-1].strip()[:60] if ':' in line else line.strip()[:60]
-            missing = [firmware] if firmware and not _is_package_installed(firmware) else []
+            missing = [firmware] if firmware and not _is_package_installed(firmware, packages) else []
             adapters.append({
                 'model': model,
                 'vendor': vendor,
@@ -472,25 +503,25 @@ def detect_wifi(lspci_output=None, lsusb_output=None):
 
 # ─────────────────────────── Audio ───────────────────────────
 
-def detect_audio(lspci_output=None):
+def detect_audio(pci_devices=None, packages=None):
     """Detect audio devices and check driver status."""
     try:
-        if lspci_output is None:
-            lspci_output = _get_lspci_output()
+        if pci_devices is None:
+            pci_devices = _get_pci_devices()
+        if packages is None:
+            packages = _get_package_snapshot()
 
         devices = []
-        audio_keywords = ['audio', 'sound', 'multimedia audio', 'high definition audio', 'ac97']
 
-        for line in lspci_output.split('\n'):
-            line_lower = line.lower()
-            if not any(k in line_lower for k in audio_keywords):
+        for device in pci_devices:
+            if not is_audio_device(device):
                 continue
 
-            model = line.split(':')[-1].strip()[:60]
-            has_alsa = _is_package_installed('alsa-utils')
-            has_server = (_is_package_installed('pulseaudio') or
-                          _is_package_installed('pipewire-pulse') or
-                          _is_package_installed('pipewire'))
+            model = describe_device(device)[:60]
+            has_alsa = _is_package_installed('alsa-utils', packages)
+            has_server = (_is_package_installed('pulseaudio', packages) or
+                          _is_package_installed('pipewire-pulse', packages) or
+                          _is_package_installed('pipewire', packages))
 
             if has_alsa and has_server:
                 status = 'installed'
@@ -518,13 +549,15 @@ def detect_audio(lspci_output=None):
 
 # ─────────────────────────── Bluetooth ───────────────────────────
 
-def detect_bluetooth(lsusb_output=None, lspci_output=None):
+def detect_bluetooth(lsusb_output=None, pci_devices=None, packages=None):
     """Detect Bluetooth hardware and check driver status."""
     try:
         if lsusb_output is None:
             lsusb_output = _get_lsusb_output()
-        if lspci_output is None:
-            lspci_output = _get_lspci_output()
+        if pci_devices is None:
+            pci_devices = _get_pci_devices()
+        if packages is None:
+            packages = _get_package_snapshot()
 
         detected = False
         model = None
@@ -537,17 +570,17 @@ def detect_bluetooth(lsusb_output=None, lspci_output=None):
                 break
 
         if not detected:
-            for line in lspci_output.split('\n'):
-                if 'bluetooth' in line.lower():
+            for device in pci_devices:
+                if is_bluetooth_device(device):
                     detected = True
-                    model = line.split(':')[-1].strip()[:50]
+                    model = describe_device(device)[:50]
                     break
 
         if not detected:
             return None
 
         required = ['bluetooth', 'bluez']
-        status, missing = _packages_status(required)
+        status, missing = _packages_status(required, packages)
 
         return {
             'model': model or 'Bluetooth Controller',
@@ -563,11 +596,13 @@ def detect_bluetooth(lsusb_output=None, lspci_output=None):
 
 # ─────────────────────────── Printers ───────────────────────────
 
-def detect_printers(lsusb_output=None):
+def detect_printers(lsusb_output=None, packages=None):
     """Detect USB printers and check driver status."""
     try:
         if lsusb_output is None:
             lsusb_output = _get_lsusb_output()
+        if packages is None:
+            packages = _get_package_snapshot()
 
         detected = False
         model = None
@@ -583,7 +618,7 @@ def detect_printers(lsusb_output=None):
             return None
 
         required = ['cups', 'printer-driver-all']
-        status, missing = _packages_status(required)
+        status, missing = _packages_status(required, packages)
 
         return {
             'model': model or 'USB Printer',
@@ -610,9 +645,11 @@ def _get_vm_required_packages(vm_lower):
         return []
 
 
-def detect_vm():
+def detect_vm(packages=None):
     """Detect VM type and check whether guest tools are installed."""
     try:
+        if packages is None:
+            packages = _get_package_snapshot()
         vm_raw = None
 
         result = subprocess.run(['systemd-detect-virt'], capture_output=True, text=True, timeout=5)
@@ -672,7 +709,7 @@ def detect_vm():
 
         required = _get_vm_required_packages(vm_raw)
         if required:
-            status, missing = _packages_status(required)
+            status, missing = _packages_status(required, packages)
         else:
             status, missing = 'installed', []
 
@@ -692,27 +729,16 @@ def detect_vm():
 
 # ─────────────────────────── Unnecessary software ───────────────────────────
 
-def _get_installed_packages_matching(pattern):
-    """Return installed package names matching a regex, via dpkg pattern
-    match — not a fixed list, so new driver/CUDA/ROCm package names from
-    future releases are still caught without updating this code."""
-    try:
-        result = subprocess.run(['dpkg', '-l'], capture_output=True, text=True)
-        pkgs = []
-        for line in result.stdout.split('\n'):
-            if not line.startswith('ii'):
-                continue
-            parts = line.split()
-            if len(parts) >= 2 and re.match(pattern, parts[1], re.IGNORECASE):
-                pkgs.append(parts[1])
-        return pkgs
-    except Exception:
-        return []
+def _get_installed_packages_matching(pattern, packages):
+    """Return installed package names matching a regex — not a fixed list,
+    so new driver/CUDA/ROCm package names from future releases are still
+    caught without updating this code."""
+    return packages.installed_matching(pattern)
 
 
-def _get_installed_from_list(names):
+def _get_installed_from_list(names, packages):
     """Return the subset of `names` that are actually installed."""
-    return [p for p in names if _is_package_installed(p)]
+    return packages.installed_many(names)
 
 
 def _is_vboxadd_enabled():
@@ -732,7 +758,7 @@ def detect_unnecessary_software(results):
     Detects installed software that doesn't match the hardware actually
     present on this machine, using the same scan `results` dict that
     scan_hardware() assembles (needs 'gpus', 'wifi' and 'vm_detection'
-    already populated):
+    already populated, and uses its 'packages' snapshot when present):
       - NVIDIA driver/CUDA packages installed but no NVIDIA GPU detected.
       - AMD GPU/ROCm packages installed but no AMD GPU detected.
       - Broadcom proprietary WiFi driver installed but no Broadcom WiFi
@@ -752,6 +778,7 @@ def detect_unnecessary_software(results):
     _on_remove_driver_clicked).
     """
     findings = []
+    packages = results.get('packages') or _get_package_snapshot()
     gpus = results.get('gpus', [])
     wifi_adapters = results.get('wifi', [])
     vm_info = results.get('vm_detection', {})
@@ -761,7 +788,7 @@ def detect_unnecessary_software(results):
 
     # NVIDIA
     if 'NVIDIA' not in gpu_vendors:
-        pkgs = _get_installed_packages_matching(r'^(nvidia|libnvidia|cuda)')
+        pkgs = _get_installed_packages_matching(r'^(nvidia|libnvidia|cuda)', packages)
         if pkgs:
             findings.append({
                 'name': _('NVIDIA / CUDA packages'),
@@ -775,7 +802,7 @@ def detect_unnecessary_software(results):
         pkgs = _get_installed_from_list([
             'xserver-xorg-video-amdgpu', 'xserver-xorg-video-ati',
             'xserver-xorg-video-radeon', 'radeontop',
-        ]) + _get_installed_packages_matching(r'^rocm')
+        ], packages) + _get_installed_packages_matching(r'^rocm', packages)
         if pkgs:
             findings.append({
                 'name': _('AMD GPU / ROCm packages'),
@@ -788,7 +815,7 @@ def detect_unnecessary_software(results):
     if 'Broadcom' not in wifi_vendors:
         pkgs = _get_installed_from_list([
             'broadcom-sta-dkms', 'bcmwl-kernel-source', 'firmware-b43-installer',
-        ])
+        ], packages)
         if pkgs:
             findings.append({
                 'name': _('Broadcom WiFi driver'),
@@ -803,7 +830,7 @@ def detect_unnecessary_software(results):
             'open-vm-tools', 'open-vm-tools-desktop',
             'qemu-guest-agent', 'spice-vdagent', 'spice-webdavd',
             'hyperv-daemons',
-        ])
+        ], packages)
         if pkgs:
             findings.append({
                 'name': _('Virtual machine guest tools'),
@@ -834,17 +861,26 @@ def detect_unnecessary_software(results):
 
 # ─────────────────────────── CPU / RAM / Storage / Network ───────────────────────────
 
+def _read_cpu_info():
+    """Parse /proc/cpuinfo. Raises on error so failures are never cached."""
+    with open('/proc/cpuinfo', 'r') as f:
+        cpuinfo = f.read()
+    model_match = re.search(r'model name\s*:\s*(.+)', cpuinfo)
+    model = model_match.group(1).strip() if model_match else None
+    threads = len(re.findall(r'processor\s*:', cpuinfo))
+    physical_cores = len(set(re.findall(r'core id\s*:\s*(\d+)', cpuinfo)))
+    cores = physical_cores if physical_cores > 0 else threads
+    return {'model': model, 'cores': cores, 'threads': threads}
+
+
 def detect_cpu():
     """Detect CPU information."""
     try:
-        with open('/proc/cpuinfo', 'r') as f:
-            cpuinfo = f.read()
-        model_match = re.search(r'model name\s*:\s*(.+)', cpuinfo)
-        model = model_match.group(1).strip() if model_match else _('Unknown')
-        threads = len(re.findall(r'processor\s*:', cpuinfo))
-        physical_cores = len(set(re.findall(r'core id\s*:\s*(\d+)', cpuinfo)))
-        cores = physical_cores if physical_cores > 0 else threads
-        return {'model': model, 'cores': cores, 'threads': threads}
+        cpu = dict(get_snapshot_cache().get_or_compute('cpu', _read_cpu_info))
+        # Kept untranslated in the cache; the language may differ next launch
+        if not cpu['model']:
+            cpu['model'] = _('Unknown')
+        return cpu
     except Exception as e:
         print(f"Error detecting CPU: {e}")
         return {'model': _('Error'), 'cores': 0, 'threads': 0}
@@ -916,67 +952,114 @@ def detect_network():
 
 # ─────────────────────────── Main scan ───────────────────────────
 
-def scan_hardware(update_status_cb, update_progress_cb, show_results_cb):
-    """
-    Scan all hardware and driver status in a background thread.
-    Calls show_results_cb(results) on the GTK main thread when done.
-    """
+# Upper bound on concurrently running detectors. Most of them wait on a
+# short-lived process or a file, so a few threads are enough to overlap them.
+SCAN_MAX_WORKERS = 6
 
-    def scan_thread():
-        results = {}
-
-        GLib.idle_add(update_status_cb, _('Detecting hardware...'))
-        GLib.idle_add(update_progress_cb, 0.05)
-        lspci_output = _get_lspci_output()
-        lsusb_output = _get_lsusb_output()
+# Task outputs that only feed other detectors and are not shown as results
+SCAN_INPUTS = ('pci_devices', 'lsusb_output', 'packages')
 
-        GLib.idle_add(update_status_cb, _('Detecting CPU...'))
-        GLib.idle_add(update_progress_cb, 0.1)
-        results['cpu'] = detect_cpu()
 
-        GLib.idle_add(update_status_cb, _('Detecting memory...'))
-        GLib.idle_add(update_progress_cb, 0.2)
-        results['memory'] = detect_memory()
-
-        GLib.idle_add(update_status_cb, _('Detecting GPU...'))
-        GLib.idle_add(update_progress_cb, 0.3)
-        results['gpus'] = detect_all_gpus(lspci_output)
-
-        GLib.idle_add(update_status_cb, _('Detecting hybrid graphics...'))
-        GLib.idle_add(update_progress_cb, 0.38)
-        results['hybrid_gpu'] = detect_hybrid_gpu(lspci_output)
-
-        GLib.idle_add(update_status_cb, _('Detecting Wi-Fi...'))
-        GLib.idle_add(update_progress_cb, 0.46)
-        results['wifi'] = detect_wifi(lspci_output, lsusb_output)
+def _scan_tasks():
+    """
+    The hardware scan as a task graph: (key, status text, dependencies, function).
+    Each function receives a dict with the values of its dependencies; a
+    dependency that failed is missing from it and the detector falls back
+    to reading its input itself.
+    """
+    return [
+        ('pci_devices', _('Detecting hardware...'), (), lambda r: _get_pci_devices()),
+        ('lsusb_output', _('Detecting hardware...'), (), lambda r: _get_lsusb_output()),
+        ('packages', _('Detecting hardware...'), (), lambda r: _get_package_snapshot()),
+        ('cpu', _('Detecting CPU...'), (), lambda r: detect_cpu()),
+        ('memory', _('Detecting memory...'), (), lambda r: detect_memory()),
+        ('gpus', _('Detecting GPU...'), ('pci_devices', 'packages'),
+         lambda r: detect_all_gpus(r.get('pci_devices'), r.get('packages'))),
+        ('hybrid_gpu', _('Detecting hybrid graphics...'), ('pci_devices',),
+         lambda r: detect_hybrid_gpu(r.get('pci_devices'))),
+        ('wifi', _('Detecting Wi-Fi...'), ('pci_devices', 'lsusb_output', 'packages'),
+         lambda r: detect_wifi(r.get('pci_devices'), r.get('lsusb_output'), r.get('packages'))),
+        ('audio', _('Detecting audio...'), ('pci_devices', 'packages'),
+         lambda r: detect_audio(r.get('pci_devices'), r.get('packages'))),
+        ('bluetooth', _('Detecting Bluetooth...'), ('lsusb_output', 'pci_devices', 'packages'),
+         lambda r: detect_bluetooth(r.get('lsusb_output'), r.get('pci_devices'), r.get('packages'))),
+        ('printers', _('Detecting printers...'), ('lsusb_output', 'packages'),
+         lambda r: detect_printers(r.get('lsusb_output'), r.get('packages'))),
+        ('vm_detection', _('Detecting virtual machine...'), ('packages',),
+         lambda r: detect_vm(r.get('packages'))),
+        ('unnecessary_software', _('Checking for unnecessary software...'),
+         ('gpus', 'wifi', 'vm_detection', 'packages'), detect_unnecessary_software),
+        ('storage', _('Detecting storage...'), (), lambda r: detect_storage()),
+        ('network', _('Detecting network...'), (), lambda r: detect_network()),
+    ]
+
+
+def _run_task_graph(tasks, on_task_done, max_workers=SCAN_MAX_WORKERS):
+    """
+    Run (key, label, dependencies, function) tasks on a bounded thread pool,
+    each one as soon as all of its dependencies have finished.
 
-        GLib.idle_add(update_status_cb, _('Detecting audio...'))
-        GLib.idle_add(update_progress_cb, 0.54)
-        results['audio'] = detect_audio(lspci_output)
+    on_task_done(key, value, remaining) is called on the calling thread after
+    every task, with the keys of the tasks that have not finished yet. A task
+    that raises yields None. Returns {key: value} for all tasks.
+    """
+    values = {}
+    pending = {key: (deps, fn) for key, _label, deps, fn in tasks}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            ready = [key for key, (deps, _fn) in pending.items() if all(d in values for d in deps)]
+            for key in ready:
+                deps, fn = pending.pop(key)
+                inputs = {d: values[d] for d in deps if values[d] is not None}
+                running[executor.submit(fn, inputs)] = key
+            if not running:
+                # Only tasks with unknown dependencies are left
+                print(f"Hardware scan tasks with unmet dependencies: {', '.join(pending)}")
+                break
 
-        GLib.idle_add(update_status_cb, _('Detecting Bluetooth...'))
-        GLib.idle_add(update_progress_cb, 0.62)
-        results['bluetooth'] = detect_bluetooth(lsusb_output, lspci_output)
+            done, _not_done = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                try:
+                    values[key] = future.result()
+                except Exception as e:
+                    print(f"Error in hardware scan task {key}: {e}")
+                    values[key] = None
+                on_task_done(key, values[key], set(pending) | set(running.values()))
+    return values
 
-        GLib.idle_add(update_status_cb, _('Detecting printers...'))
-        GLib.idle_add(update_progress_cb, 0.70)
-        results['printers'] = detect_printers(lsusb_output)
 
-        GLib.idle_add(update_status_cb, _('Detecting virtual machine...'))
-        GLib.idle_add(update_progress_cb, 0.78)
-        results['vm_detection'] = detect_vm()
+def scan_hardware(update_status_cb, update_progress_cb, show_results_cb, result_cb=None):
+    """
+    Scan all hardware and driver status in a background thread.
 
-        GLib.idle_add(update_status_cb, _('Checking for unnecessary software...'))
-        GLib.idle_add(update_progress_cb, 0.82)
-        results['unnecessary_software'] = detect_unnecessary_software(results)
+    The detectors run in parallel where their inputs allow it. As each one
+    finishes, result_cb(key, value) is called on the GTK main thread and the
+    progress moves by the share of finished tasks. show_results_cb(results)
+    is called on the GTK main thread when everything is done.
+    """
+    tasks = _scan_tasks()
+    labels = {key: label for key, label, _deps, _fn in tasks}
+    order = [key for key, _label, _deps, _fn in tasks]
+
+    def on_task_done(key, value, remaining):
+        GLib.idle_add(update_progress_cb, (len(tasks) - len(remaining)) / len(tasks))
+        # Name the first task still running, in the order the results are shown
+        next_key = next((k for k in order if k in remaining), None)
+        if next_key is not None:
+            GLib.idle_add(update_status_cb, labels[next_key])
+        if result_cb and key not in SCAN_INPUTS and value is not None:
+            GLib.idle_add(result_cb, key, value)
 
-        GLib.idle_add(update_status_cb, _('Detecting storage...'))
-        GLib.idle_add(update_progress_cb, 0.86)
-        results['storage'] = detect_storage()
+    def scan_thread():
+        GLib.idle_add(update_status_cb, _('Detecting hardware...'))
+        GLib.idle_add(update_progress_cb, 0.0)
 
-        GLib.idle_add(update_status_cb, _('Detecting network...'))
-        GLib.idle_add(update_progress_cb, 0.94)
-        results['network'] = detect_network()
+        values = _run_task_graph(tasks, on_task_done)
+        results = {key: value for key, value in values.items()
+                   if key not in SCAN_INPUTS and value is not None}
 
         GLib.idle_add(update_status_cb, _('Scan completed'))
         GLib.idle_add(update_progress_cb, 1.0)
@@ -0,0 +1,225 @@
+"""
+Icon atlas for Soplos Welcome.
+Packs every icon of a category, pre-scaled to the sizes the UI shows, into
+one PNG sheet per pixel size, described by a JSON manifest.
+
+The atlas is built with the package ("setup.py build" writes it to the
+build directory, "setup.py install" installs it under assets/icons/atlas),
+or by hand into the source tree:
+
+    python3 -m utils.icon_atlas [icons_dir] [atlas_dir]
+
+At run time IconCache asks get_icon_atlas() first and decodes the small
+sheet instead of the full-size original. Originals stay in place, so
+get_icon_path() and anything that copies an icon file keeps working.
+"""
+
+import json
+import math
+import os
+import sys
+import threading
+
+import gi
+gi.require_version('GdkPixbuf', '2.0')
+from gi.repository import GdkPixbuf
+
+from config.paths import ICONS_DIR
+
+
+ATLAS_DIR = os.path.join(ICONS_DIR, 'atlas')
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# Logical sizes catalog icons are shown at (category headers and package
+# rows), and the scale factors to render them for. 24 px @2x and 48 px @1x
+# share one sheet. Icons shown at other sizes are decoded from the originals.
+ATLAS_SIZES = (24, 48)
+ATLAS_SCALES = (1, 2)
+
+
+def _sheet_name(category, pixels):
+    return f"{category}-{pixels}.png"
+
+
+def _category_dirs(icons_dir):
+    """(category, directory) for every folder holding icons directly.
+    Hicolor-style size folders (48x48, ...) and the atlas itself are skipped."""
+    result = []
+    for entry in sorted(os.scandir(icons_dir), key=lambda e: e.name):
+        if not entry.is_dir() or entry.name == 'atlas' or entry.name[0].isdigit():
+            continue
+        result.append((entry.name, entry.path))
+    return result
+
+
+def _pack_sheet(sources, pixels):
+    """
+    Scale every source into a pixels x pixels cell of a square-ish grid.
+
+    Returns:
+        (sheet pixbuf, {icon_name: [x, y, width, height]})
+    """
+    columns = max(1, math.ceil(math.sqrt(len(sources))))
+    rows = math.ceil(len(sources) / columns)
+    sheet = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, True, 8,
+                                 columns * pixels, rows * pixels)
+    sheet.fill(0x00000000)
+
+    frames = {}
+    for i, (name, pixbuf) in enumerate(sources):
+        # Same fit-inside-the-box scaling new_from_file_at_scale does.
+        ratio = min(pixels / pixbuf.get_width(), pixels / pixbuf.get_height())
+        width = max(1, round(pixbuf.get_width() * ratio))
+        height = max(1, round(pixbuf.get_height() * ratio))
+        scaled = pixbuf.scale_simple(width, height, GdkPixbuf.InterpType.HYPER)
+        if not scaled.get_has_alpha():
+            scaled = scaled.add_alpha(False, 0, 0, 0)
+        x = (i % columns) * pixels
+        y = (i // columns) * pixels
+        scaled.copy_area(0, 0, width, height, sheet, x, y)
+        frames[name] = [x, y, width, height]
+    return sheet, frames
+
+
+def build_atlas(icons_dir: str = ICONS_DIR, atlas_dir: str = ATLAS_DIR,
+                sizes=ATLAS_SIZES, scales=ATLAS_SCALES) -> dict:
+    """
+    Write one sheet per category and pixel size plus the manifest.
+
+    Returns:
+        The manifest that was written
+    """
+    os.makedirs(atlas_dir, exist_ok=True)
+    pixel_sizes = sorted({size * scale for size in sizes for scale in scales})
+    manifest = {'version': MANIFEST_VERSION, 'pixel_sizes': pixel_sizes, 'categories': {}}
+
+    for category, directory in _category_dirs(icons_dir):
+        sources = []
+        stamps = {}
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if not name.endswith('.png') or not os.path.isfile(path):
+                continue
+            try:
+                sources.append((name, GdkPixbuf.Pixbuf.new_from_file(path)))
+            except Exception as e:
+                print(f"Skipping icon {path}: {e}")
+                continue
+            stamps[name] = os.path.getsize(path)
+        if not sources:
+            continue
+
+        sheets = {}
+        for pixels in pixel_sizes:
+            sheet, frames = _pack_sheet(sources, pixels)
+            sheet.savev(os.path.join(atlas_dir, _sheet_name(category, pixels)), 'png', [], [])
+            sheets[str(pixels)] = frames
+        manifest['categories'][category] = {'sources': stamps, 'sheets': sheets}
+        print(f"{category}: {len(sources)} icons")
+
+    with open(os.path.join(atlas_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return manifest
+
+
+class IconAtlas:
+    """
+    Run-time view of a built atlas.
+
+    The manifest is read on first use and each sheet is decoded the first
+    time one of its icons is asked for. An icon is only served from the
+    atlas if the original still has the size it had at build time; anything
+    else falls back to the original file.
+    """
+
+    def __init__(self, icons_dir: str = ICONS_DIR, atlas_dir: str = ATLAS_DIR):
+        self.icons_dir = os.path.abspath(icons_dir)
+        self.atlas_dir = atlas_dir
+        self._manifest = None
+        self._sheets = {}
+        self._lock = threading.Lock()
+
+    def _load_manifest(self):
+        if self._manifest is None:
+            manifest = {}
+            try:
+                with open(os.path.join(self.atlas_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    manifest = data.get('categories', {})
+            except (OSError, ValueError):
+                pass
+            self._manifest = manifest
+        return self._manifest
+
+    def _get_sheet(self, category, pixels):
+        key = (category, pixels)
+        with self._lock:
+            if key not in self._sheets:
+                try:
+                    self._sheets[key] = GdkPixbuf.Pixbuf.new_from_file(
+                        os.path.join(self.atlas_dir, _sheet_name(category, pixels)))
+                except Exception as e:
+                    print(f"Error loading icon atlas {category}-{pixels}: {e}")
+                    self._sheets[key] = None
+            return self._sheets[key]
+
+    def get_pixbuf(self, path, pixels: int):
+        """
+        Pre-scaled copy of an icon at the given pixel size.
+
+        Returns:
+            GdkPixbuf.Pixbuf, or None if the atlas cannot serve it
+        """
+        manifest = self._load_manifest()
+        if not manifest:
+            return None
+        directory, name = os.path.split(os.path.abspath(path))
+        parent, category = os.path.split(directory)
+        if parent != self.icons_dir:
+            return None
+        entry = manifest.get(category)
+        if entry is None or name not in entry['sources']:
+            return None
+        frame = entry['sheets'].get(str(pixels), {}).get(name)
+        if frame is None:
+            return None
+        try:
+            if os.path.getsize(path) != entry['sources'][name]:
+                return None
+        except OSError:
+            return None
+
+        sheet = self._get_sheet(category, pixels)
+        if sheet is None:
+            return None
+        x, y, width, height = frame
+        # Copy so the cached icon does not keep the whole sheet alive.
+        return sheet.new_subpixbuf(x, y, width, height).copy()
+
+    def clear(self):
+        """Drop the decoded sheets and re-read the manifest on next use."""
+        with self._lock:
+            self._sheets.clear()
+            self._manifest = None
+
+
+# Global instance for easy access
+_icon_atlas = None
+
+def get_icon_atlas() -> IconAtlas:
+    """
+    Returns the global icon atlas.
+    Creates it if it doesn't exist.
+    """
+    global _icon_atlas
+    if _icon_atlas is None:
+        _icon_atlas = IconAtlas()
+    return _icon_atlas
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else ICONS_DIR
+    target = sys.argv[2] if len(sys.argv) > 2 else os.path.join(source, 'atlas')
+    build_atlas(source, target)
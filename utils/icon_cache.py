@@ -0,0 +1,255 @@
+"""
+Icon cache for Soplos Welcome.
+Decodes each catalog and tool icon once per (path, size, scale factor) and
+keeps the results in a process-wide LRU bounded by pixel memory. Icons are
+taken from the pre-scaled atlas when one was built, and can be decoded off
+the main thread behind a themed placeholder.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, Gdk, GdkPixbuf, GLib
+
+from utils.icon_atlas import get_icon_atlas
+
+
+# Upper bound on decoded pixel data kept alive by the cache. A 48 px RGBA
+# icon is ~9 KB, so this holds the whole catalog at 1x and 2x many times over.
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Decoding is mostly zlib and file I/O, which release the GIL; a couple of
+# workers keep up with a whole tab without competing with the main loop.
+DECODE_WORKERS = 2
+
+# Shown until the real icon is decoded, and kept if decoding fails
+PLACEHOLDER_ICON = 'image-x-generic'
+
+
+def _pixbuf_bytes(pixbuf) -> int:
+    return pixbuf.get_rowstride() * pixbuf.get_height()
+
+
+def get_default_scale() -> int:
+    """Scale factor of the primary monitor, 1 when there is no display."""
+    display = Gdk.Display.get_default()
+    if display is None:
+        return 1
+    monitor = display.get_primary_monitor() or display.get_monitor(0)
+    return monitor.get_scale_factor() if monitor is not None else 1
+
+
+class IconCache:
+    """
+    Process-wide store of decoded icons.
+
+    Entries are keyed by (path, size, scale) and hold the pixbuf decoded at
+    size * scale device pixels. Least recently used entries are evicted once
+    the decoded pixel data exceeds max_bytes. Files that are missing or fail
+    to decode are remembered as well, so a broken icon is not retried on
+    every rebuild; clear() forgets everything.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._first_icon = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        # (path, size, scale) -> images waiting for it; main thread only
+        self._pending = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _decode(self, path, size, scale):
+        pixels = size * scale
+        pixbuf = get_icon_atlas().get_pixbuf(path, pixels)
+        if pixbuf is not None:
+            return pixbuf
+        if not os.path.exists(path):
+            return None
+        try:
+            return GdkPixbuf.Pixbuf.new_from_file_at_scale(path, pixels, pixels, True)
+        except Exception as e:
+            print(f"Error loading icon {path}: {e}")
+            return None
+
+    def get_pixbuf(self, path, size: int, scale: int = 1):
+        """
+        Pixbuf of an icon scaled to fit size * scale pixels.
+
+        Returns:
+            GdkPixbuf.Pixbuf, or None if the file is missing or unreadable
+        """
+        key = (str(path), size, scale)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        pixbuf = self._decode(key[0], size, scale)
+
+        with self._lock:
+            # Another thread may have decoded the same icon meanwhile.
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+            self._entries[key] = pixbuf
+            if pixbuf is not None:
+                self._bytes += _pixbuf_bytes(pixbuf)
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                if evicted is not None:
+                    self._bytes -= _pixbuf_bytes(evicted)
+        return pixbuf
+
+    def new_image(self, path, size: int, scale: int = None):
+        """
+        Gtk.Image showing an icon at size logical pixels, rendered sharp at
+        the given scale factor (the primary monitor's when omitted).
+
+        Returns:
+            Gtk.Image, or None if the file is missing or unreadable
+        """
+        if scale is None:
+            scale = get_default_scale()
+        pixbuf = self.get_pixbuf(path, size, scale)
+        if pixbuf is None:
+            return None
+        image = Gtk.Image()
+        self._show(image, pixbuf, scale)
+        return image
+
+    def load_image(self, path, size: int, scale: int = None,
+                   placeholder: str = PLACEHOLDER_ICON):
+        """
+        Like new_image(), but never decodes on the calling thread. An icon
+        already in the cache is shown at once; otherwise the image shows the
+        themed placeholder icon and the decoded icon replaces it when a
+        worker has finished. Must be called from the GTK main thread.
+
+        Returns:
+            Gtk.Image, or None if the file does not exist
+        """
+        image = Gtk.Image()
+        if not self.set_image(image, path, size, scale, placeholder):
+            return None
+        return image
+
+    def set_image(self, image, path, size: int, scale: int = None,
+                  placeholder: str = PLACEHOLDER_ICON) -> bool:
+        """
+        Point an existing Gtk.Image at an icon, decoding off-thread like
+        load_image(). Images recycled for another icon before the decode
+        finished are left alone when it does.
+
+        Returns:
+            False (and an empty image) if the file does not exist
+        """
+        if scale is None:
+            scale = get_default_scale()
+        key = (str(path), size, scale)
+        image.icon_cache_key = key
+        with self._lock:
+            cached = key in self._entries
+            if cached:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                pixbuf = self._entries[key]
+        if cached:
+            if pixbuf is None:
+                image.clear()
+                return False
+            self._show(image, pixbuf, scale)
+            return True
+
+        if not os.path.exists(key[0]):
+            image.clear()
+            return False
+
+        image.set_from_icon_name(placeholder, Gtk.IconSize.DIALOG)
+        image.set_pixel_size(size)
+        waiting = self._pending.get(key)
+        if waiting is not None:
+            # Already being decoded for another widget
+            waiting.append(image)
+            return True
+
+        self._pending[key] = [image]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=DECODE_WORKERS,
+                                                thread_name_prefix='icon-decode')
+        self._executor.submit(self._decode_in_worker, key)
+        return True
+
+    def _decode_in_worker(self, key):
+        path, size, scale = key
+        try:
+            pixbuf = self.get_pixbuf(path, size, scale)
+        except Exception as e:
+            print(f"Error loading icon {path}: {e}")
+            pixbuf = None
+        GLib.idle_add(self._deliver, key, pixbuf)
+
+    def _deliver(self, key, pixbuf):
+        for image in self._pending.pop(key, []):
+            # Unreadable files keep their placeholder
+            if pixbuf is not None and getattr(image, 'icon_cache_key', None) == key:
+                self._show(image, pixbuf, key[2])
+        return False
+
+    @staticmethod
+    def _show(image, pixbuf, scale):
+        if scale == 1:
+            image.set_from_pixbuf(pixbuf)
+        else:
+            image.set_from_surface(Gdk.cairo_surface_create_from_pixbuf(pixbuf, scale, None))
+
+    def first_icon_in(self, directory):
+        """Path of the first PNG in a directory (by name), or None. The
+        directory is listed once per process."""
+        directory = str(directory)
+        with self._lock:
+            if directory in self._first_icon:
+                return self._first_icon[directory]
+        try:
+            names = sorted(n for n in os.listdir(directory) if n.endswith('.png'))
+        except OSError:
+            names = []
+        path = os.path.join(directory, names[0]) if names else None
+        with self._lock:
+            self._first_icon[directory] = path
+        return path
+
+    def clear(self):
+        """Drop every cached icon, e.g. after the icon files changed."""
+        get_icon_atlas().clear()
+        with self._lock:
+            self._entries.clear()
+            self._first_icon.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+
+# Global instance for easy access
+_icon_cache = None
+
+def get_icon_cache() -> IconCache:
+    """
+    Returns the global icon cache.
+    Creates it if it doesn't exist.
+    """
+    global _icon_cache
+    if _icon_cache is None:
+        _icon_cache = IconCache()
+    return _icon_cache
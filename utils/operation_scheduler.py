@@ -0,0 +1,204 @@
+"""
+Operation scheduler for Soplos Welcome.
+Queues the commands every tab runs and starts each one as soon as the
+resources it needs (the dpkg lock, a Flatpak installation, the network)
+are free, so conflicting work is serialized across tabs instead of
+failing, and unrelated work still runs side by side.
+"""
+
+import os
+import re
+import signal
+
+from gi.repository import GObject
+
+
+RESOURCE_DPKG = 'dpkg'                      # dpkg/apt lock
+RESOURCE_FLATPAK_SYSTEM = 'flatpak-system'  # system Flatpak installation
+RESOURCE_FLATPAK_USER = 'flatpak-user'      # per-user Flatpak installation
+RESOURCE_NETWORK = 'network'                # wget/curl downloads
+
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 10
+PRIORITY_HIGH = 20
+
+# Generated scripts are read to find what they touch; larger files are
+# only looked at up to this size.
+MAX_SCRIPT_SCAN_BYTES = 256 * 1024
+
+_DPKG_RE = re.compile(r'\b(?:apt|apt-get|aptitude|dpkg|gdebi)\b')
+_FLATPAK_RE = re.compile(r'\bflatpak\s+(?:[-\w]+\s+)*?(?:install|uninstall|remove|update|upgrade|repair)\b')
+_NETWORK_RE = re.compile(r'\b(?:wget|curl)\b')
+
+
+def command_resources(command: str) -> frozenset:
+    """
+    Resources a shell command needs, guessed from its text and from any
+    script file it runs.
+
+    Returns:
+        frozenset of RESOURCE_* names, empty if it needs none of them
+    """
+    text = command
+    for token in command.split():
+        path = token.strip('\'"')
+        if path.endswith('.sh') and os.path.isfile(path):
+            try:
+                with open(path, 'r', errors='replace') as f:
+                    text += '\n' + f.read(MAX_SCRIPT_SCAN_BYTES)
+            except OSError:
+                pass
+
+    resources = set()
+    if _DPKG_RE.search(text):
+        resources.add(RESOURCE_DPKG)
+    if _FLATPAK_RE.search(text):
+        if '--user' in text:
+            resources.add(RESOURCE_FLATPAK_USER)
+        if '--user' not in text or '--system' in text:
+            resources.add(RESOURCE_FLATPAK_SYSTEM)
+    if _NETWORK_RE.search(text):
+        resources.add(RESOURCE_NETWORK)
+    return frozenset(resources)
+
+
+class Operation:
+    """
+    One unit of queued work.
+
+    start is called on the main thread when the operation may run; whoever
+    runs it calls OperationScheduler.finished() once it is done. on_cancelled
+    is called instead of start if the operation is cancelled while queued.
+    """
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    CANCELLED = 'cancelled'
+
+    _next_sequence = 0
+
+    def __init__(self, label: str, resources, start, priority: int = PRIORITY_NORMAL,
+                 on_cancelled=None):
+        self.label = label
+        self.resources = frozenset(resources)
+        self.priority = priority
+        self.start = start
+        self.on_cancelled = on_cancelled
+        self.state = Operation.QUEUED
+        self.cancel_requested = False
+        self.process = None  # set by the runner so a running operation can be stopped
+        self.cancel_event = None  # threading.Event, for work done in-process
+        # Submission order breaks ties between equal priorities
+        self.sequence = Operation._next_sequence
+        Operation._next_sequence += 1
+
+
+class OperationScheduler(GObject.Object):
+    """
+    Emits "queue-changed" whenever an operation is queued, started,
+    finished or cancelled.
+
+    Queued operations are considered by priority, then submission order.
+    An operation starts once no running operation holds any of its
+    resources; an operation that has to wait also reserves its resources
+    against lower-priority ones, so it cannot be starved by them. All
+    methods must be called from the GTK main thread.
+    """
+
+    __gsignals__ = {
+        'queue-changed': (GObject.SignalFlags.RUN_FIRST, None, ()),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self._queued = []
+        self._running = []
+
+    def submit(self, operation: Operation) -> Operation:
+        """Queue an operation and start it right away if it can run."""
+        self._queued.append(operation)
+        self._schedule()
+        self.emit('queue-changed')
+        return operation
+
+    def finished(self, operation: Operation):
+        """Release a running operation's resources and start what was waiting."""
+        if operation in self._running:
+            self._running.remove(operation)
+        operation.state = Operation.FINISHED
+        self._schedule()
+        self.emit('queue-changed')
+        return False
+
+    def cancel(self, operation: Operation):
+        """
+        Drop a queued operation, or ask a running one to stop.
+
+        Returns:
+            True if the operation was dropped or signalled
+        """
+        if operation in self._queued:
+            self._queued.remove(operation)
+            operation.state = Operation.CANCELLED
+            if operation.on_cancelled:
+                operation.on_cancelled()
+            self.emit('queue-changed')
+            return True
+
+        if operation in self._running and operation.cancel_event is not None:
+            operation.cancel_requested = True
+            operation.cancel_event.set()
+            return True
+
+        if operation in self._running and operation.process is not None:
+            operation.cancel_requested = True
+            try:
+                os.killpg(operation.process.pid, signal.SIGTERM)
+                return True
+            except (ProcessLookupError, PermissionError) as e:
+                # Commands already elevated through pkexec belong to root
+                print(f"Could not stop {operation.label}: {e}")
+        return False
+
+    def cancel_queued(self):
+        """Drop every operation that has not started yet."""
+        for operation in list(self._queued):
+            self.cancel(operation)
+
+    def queued(self) -> list:
+        """Waiting operations, in the order they will be considered."""
+        return sorted(self._queued, key=lambda op: (-op.priority, op.sequence))
+
+    def running(self) -> list:
+        return list(self._running)
+
+    def _schedule(self):
+        held = set()
+        for operation in self._running:
+            held |= operation.resources
+        reserved = set()
+
+        for operation in self.queued():
+            if operation.resources & (held | reserved):
+                reserved |= operation.resources
+                continue
+            self._queued.remove(operation)
+            self._running.append(operation)
+            held |= operation.resources
+            operation.state = Operation.RUNNING
+            operation.start()
+
+
+# Global instance for easy access
+_operation_scheduler = None
+
+def get_operation_scheduler() -> OperationScheduler:
+    """
+    Returns the global operation scheduler.
+    Creates it if it doesn't exist.
+    """
+    global _operation_scheduler
+    if _operation_scheduler is None:
+        _operation_scheduler = OperationScheduler()
+    return _operation_scheduler
@@ -0,0 +1,198 @@
+"""
+Package status index for Soplos Welcome.
+Parses the dpkg status database once and answers installed-package
+lookups from memory, without forking dpkg for every check.
+"""
+
+import os
+import re
+import threading
+
+
+DPKG_STATUS_PATH = '/var/lib/dpkg/status'
+
+
+class PackageSnapshot:
+    """
+    Read-only view of the package database at one point in time.
+
+    A scan that asks about many packages takes one snapshot and answers
+    every question from it, so all answers agree with each other even if
+    dpkg runs in the middle of the scan.
+    """
+
+    def __init__(self, packages: dict):
+        self._packages = packages
+
+    def get_record(self, package: str):
+        """Return the record for a package, or None when dpkg does not know it."""
+        return self._packages.get(package)
+
+    def is_installed(self, package: str) -> bool:
+        """True if the package is installed (any architecture unless qualified)."""
+        record = self._packages.get(package)
+        return record is not None and record['status'] == 'installed'
+
+    def status_many(self, names) -> dict:
+        """Map each name to its record, or None when dpkg does not know it."""
+        return {name: self._packages.get(name) for name in names}
+
+    def installed_many(self, names) -> list:
+        """The subset of names that is installed, in the given order."""
+        return [name for name in names if self.is_installed(name)]
+
+    def installed_matching(self, pattern: str) -> list:
+        """Installed package names (without architecture) matching a regex,
+        case-insensitively, at the start of the name."""
+        regex = re.compile(pattern, re.IGNORECASE)
+        return sorted(name for name, record in self._packages.items()
+                      if ':' not in name and record['status'] == 'installed' and regex.match(name))
+
+
+class PackageStatusIndex:
+    """
+    In-process view of /var/lib/dpkg/status.
+
+    The file is parsed once into a name -> record map. Every lookup stats
+    the file first and re-parses it only when dpkg has rewritten it (dpkg
+    replaces the file on every transaction, so mtime, size or inode change),
+    which keeps the answers current after an install or removal without
+    paying for a parse on each call.
+    """
+
+    def __init__(self, status_path: str = DPKG_STATUS_PATH):
+        self.status_path = status_path
+        self._packages = {}
+        self._signature = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _stat_signature(self):
+        try:
+            st = os.stat(self.status_path)
+            return (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            return None
+
+    def _parse(self):
+        """Parse the status file into {name: record}. Records are dicts with
+        'status', 'version' and 'architecture' keys."""
+        packages = {}
+        try:
+            with open(self.status_path, 'r', encoding='utf-8', errors='replace') as f:
+                content = f.read()
+        except OSError as e:
+            print(f"Error reading dpkg status database: {e}")
+            return packages
+
+        for stanza in content.split('\n\n'):
+            name = status = version = arch = None
+            for line in stanza.split('\n'):
+                # Continuation lines (descriptions, conffiles) start with a
+                # space and never carry one of the fields read here.
+                if not line or line[0] == ' ':
+                    continue
+                if line.startswith('Package: '):
+                    name = line[9:].strip()
+                elif line.startswith('Status: '):
+                    status = line[8:].strip()
+                elif line.startswith('Version: '):
+                    version = line[9:].strip()
+                elif line.startswith('Architecture: '):
+                    arch = line[14:].strip()
+            if not name:
+                continue
+
+            # Status is "<want> <flag> <state>". The state is what decides
+            # whether the files are on disk: a held package reads
+            # "hold ok installed" and is just as installed.
+            state = status.split()[-1] if status else ''
+            record = {'status': state, 'version': version, 'architecture': arch}
+
+            # Multi-arch packages appear once per architecture. The bare name
+            # answers for whichever copy is installed; "name:arch" answers for
+            # that architecture only.
+            if arch:
+                packages[f"{name}:{arch}"] = record
+            current = packages.get(name)
+            if current is None or (current['status'] != 'installed' and state == 'installed'):
+                packages[name] = record
+        return packages
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Re-parse the status file if it changed since the last parse.
+
+        Returns:
+            True if the index was rebuilt
+        """
+        signature = self._stat_signature()
+        if not force and self._loaded and signature == self._signature:
+            return False
+        with self._lock:
+            # Another thread may have reloaded while this one waited.
+            if not force and self._loaded and signature == self._signature:
+                return False
+            self._packages = self._parse()
+            self._signature = signature
+            self._loaded = True
+        return True
+
+    def get_record(self, package: str):
+        """Return the record for a package, or None when dpkg does not know it."""
+        self.refresh()
+        return self._packages.get(package)
+
+    def snapshot(self) -> PackageSnapshot:
+        """
+        Current state as a PackageSnapshot. The map behind it is replaced on
+        reload, never modified, so the snapshot stays consistent.
+        """
+        self.refresh()
+        return PackageSnapshot(self._packages)
+
+    def status_many(self, names) -> dict:
+        """Records of several packages from a single check of the database."""
+        return self.snapshot().status_many(names)
+
+    def is_installed(self, package: str) -> bool:
+        """True if the package is installed (any architecture unless qualified)."""
+        record = self.get_record(package)
+        return record is not None and record['status'] == 'installed'
+
+    def get_version(self, package: str):
+        """Installed version string of a package, or None."""
+        record = self.get_record(package)
+        if record is None or record['status'] != 'installed':
+            return None
+        return record['version']
+
+    def installed_packages(self) -> list:
+        """Names of all installed packages (without architecture qualifiers)."""
+        self.refresh()
+        return [name for name, record in self._packages.items()
+                if ':' not in name and record['status'] == 'installed']
+
+    def installed_versions(self) -> dict:
+        """Map of installed package name -> version, for diffing two states."""
+        self.refresh()
+        return {name: record['version'] for name, record in self._packages.items()
+                if ':' not in name and record['status'] == 'installed'}
+
+
+# Global instance for easy access
+_package_index = None
+
+def get_package_index() -> PackageStatusIndex:
+    """
+    Returns the global package status index.
+    Creates it if it doesn't exist.
+    """
+    global _package_index
+    if _package_index is None:
+        _package_index = PackageStatusIndex()
+    return _package_index
+
+def is_package_installed(package: str) -> bool:
+    """Convenience function: True if a dpkg package is installed."""
+    return get_package_index().is_installed(package)
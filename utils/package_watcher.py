@@ -0,0 +1,160 @@
+"""
+Package state watcher for Soplos Welcome.
+Watches the dpkg database, the Flatpak installations and /snap through
+inotify and tells the tabs which packages were installed or removed.
+"""
+
+import os
+
+from gi.repository import GObject, Gio, GLib
+
+from utils.package_index import get_package_index, DPKG_STATUS_PATH
+from utils.flatpak_index import get_flatpak_index, get_installation_dirs
+
+
+SNAP_MOUNT_DIR = '/snap'
+
+# dpkg rewrites its status file several times per transaction and flatpak
+# touches its deploy directories once per ref, so changes are collected until
+# the sources have been quiet for this long and then reported together.
+SETTLE_DELAY_MS = 700
+
+
+def _snap_names():
+    """Names of the installed snaps, read from the mount directory."""
+    try:
+        entries = os.listdir(SNAP_MOUNT_DIR)
+    except OSError:
+        return set()
+    return {name for name in entries
+            if os.path.islink(os.path.join(SNAP_MOUNT_DIR, name, 'current'))}
+
+
+class PackageStateWatcher(GObject.Object):
+    """
+    Emits "packages-changed" with the set of package keys whose state changed.
+
+    Keys use the same form as the software tabs: a plain name for dpkg
+    packages, "flatpak:<app-id>" for Flatpak apps and "snap:<name>" for snaps.
+    The watcher keeps a snapshot of each source and diffs it after a change,
+    so an install done from a terminal is reported the same way as one
+    started from the app.
+    """
+
+    __gsignals__ = {
+        'packages-changed': (GObject.SignalFlags.RUN_FIRST, None, (object,)),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self._monitors = []
+        self._pending_timeout = None
+        self._dpkg_state = {}
+        self._flatpak_state = {}
+        self._snap_state = set()
+        self._started = False
+
+    def start(self):
+        """Take the initial snapshots and install the file monitors."""
+        if self._started:
+            return
+        self._started = True
+
+        self._dpkg_state = self._read_dpkg_state()
+        self._flatpak_state = self._read_flatpak_state()
+        self._snap_state = _snap_names()
+
+        # dpkg replaces the status file through a rename, which a file monitor
+        # on the path still reports.
+        self._add_monitor(DPKG_STATUS_PATH, directory=False)
+        for _name, base in get_installation_dirs():
+            self._add_monitor(os.path.join(base, 'app'), directory=True)
+            # flatpak touches .changed at the end of every transaction.
+            self._add_monitor(os.path.join(base, '.changed'), directory=False)
+        self._add_monitor(SNAP_MOUNT_DIR, directory=True)
+
+    def stop(self):
+        """Cancel all monitors and any pending notification."""
+        for monitor in self._monitors:
+            monitor.cancel()
+        self._monitors = []
+        if self._pending_timeout is not None:
+            GLib.source_remove(self._pending_timeout)
+            self._pending_timeout = None
+        self._started = False
+
+    def _add_monitor(self, path, directory):
+        try:
+            gfile = Gio.File.new_for_path(path)
+            if directory:
+                monitor = gfile.monitor_directory(Gio.FileMonitorFlags.NONE, None)
+            else:
+                monitor = gfile.monitor_file(Gio.FileMonitorFlags.NONE, None)
+            monitor.connect('changed', self._on_file_changed)
+            self._monitors.append(monitor)
+        except GLib.Error as e:
+            print(f"Error watching {path}: {e}")
+
+    def _on_file_changed(self, monitor, gfile, other_file, event_type):
+        if event_type == Gio.FileMonitorEvent.ATTRIBUTE_CHANGED:
+            return
+        if self._pending_timeout is not None:
+            GLib.source_remove(self._pending_timeout)
+        self._pending_timeout = GLib.timeout_add(SETTLE_DELAY_MS, self._on_settled)
+
+    def _on_settled(self):
+        self._pending_timeout = None
+        self.check_now()
+        return False
+
+    def check_now(self) -> set:
+        """
+        Diff every source against its last snapshot and emit
+        "packages-changed" if anything differs.
+
+        Returns:
+            The set of changed package keys
+        """
+        changed = set()
+
+        dpkg_state = self._read_dpkg_state()
+        for name in set(dpkg_state) | set(self._dpkg_state):
+            if dpkg_state.get(name) != self._dpkg_state.get(name):
+                changed.add(name)
+        self._dpkg_state = dpkg_state
+
+        flatpak_state = self._read_flatpak_state()
+        for app_id in set(flatpak_state) | set(self._flatpak_state):
+            if flatpak_state.get(app_id) != self._flatpak_state.get(app_id):
+                changed.add(f"flatpak:{app_id}")
+        self._flatpak_state = flatpak_state
+
+        snap_state = _snap_names()
+        changed.update(f"snap:{name}" for name in snap_state ^ self._snap_state)
+        self._snap_state = snap_state
+
+        if changed:
+            self.emit('packages-changed', changed)
+        return changed
+
+    def _read_dpkg_state(self):
+        return get_package_index().installed_versions()
+
+    def _read_flatpak_state(self):
+        return {app_id: tuple(sorted((d['installation'], d['arch'], d['branch']) for d in deploys))
+                for app_id, deploys in get_flatpak_index().all_deploys().items()}
+
+
+# Global instance for easy access
+_package_watcher = None
+
+def get_package_watcher() -> PackageStateWatcher:
+    """
+    Returns the global package state watcher, started.
+    Creates it if it doesn't exist.
+    """
+    global _package_watcher
+    if _package_watcher is None:
+        _package_watcher = PackageStateWatcher()
+        _package_watcher.start()
+    return _package_watcher
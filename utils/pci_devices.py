@@ -0,0 +1,354 @@
+"""
+PCI device enumeration for Soplos Welcome.
+Reads the PCI devices straight from sysfs and resolves their names through
+a compiled, memory-mapped index of pci.ids, without running lspci.
+"""
+
+import os
+import mmap
+import struct
+import fnmatch
+import threading
+
+from core.snapshot_cache import get_cache_dir
+
+
+PCI_DEVICES_DIR = '/sys/bus/pci/devices'
+
+PCI_IDS_PATHS = [
+    '/usr/share/misc/pci.ids',
+    '/usr/share/hwdata/pci.ids',
+    '/usr/share/pci.ids',
+]
+
+# PCI vendor IDs the detectors care about
+VENDOR_INTEL = 0x8086
+VENDOR_AMD = 0x1002
+VENDOR_NVIDIA = 0x10de
+
+# PCI base classes and (base, subclass) pairs
+CLASS_DISPLAY = 0x03
+CLASS_MULTIMEDIA_AUDIO = (0x04, 0x01)
+CLASS_AUDIO_DEVICE = (0x04, 0x03)
+CLASS_NETWORK_WIRELESS = (0x02, 0x80)
+CLASS_BLUETOOTH = (0x0d, 0x11)
+
+
+# ─────────────────────────── pci.ids index ───────────────────────────
+#
+# Layout of the compiled index (all little endian):
+#   header   magic(8) version(u32) count(u32) source_mtime_ns(u64) source_size(u64)
+#   entries  count x (key u64, name_offset u32, name_length u32), sorted by key
+#   names    UTF-8 blob the entries point into
+#
+# The key carries the kind of entry in its top bits so vendors, devices,
+# classes and subclasses share one sorted table and one binary search.
+
+INDEX_MAGIC = b'SWPCIIDX'
+INDEX_VERSION = 1
+_HEADER = struct.Struct('<8sIIQQ')
+_ENTRY = struct.Struct('<QII')
+
+KIND_VENDOR = 1
+KIND_DEVICE = 2
+KIND_CLASS = 3
+KIND_SUBCLASS = 4
+
+
+def _make_key(kind, high, low=0):
+    return (kind << 56) | (high << 16) | low
+
+
+def _find_pci_ids():
+    for path in PCI_IDS_PATHS:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def compile_pci_ids(source_path, index_path):
+    """Parse pci.ids and write the binary index. Subsystem and prog-if
+    lines are skipped; nothing here reads them."""
+    entries = {}
+    vendor = None
+    pci_class = None
+    with open(source_path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            if line.startswith('\t\t'):
+                continue
+            if line.startswith('\t'):
+                ident, _sep, name = line.strip().partition('  ')
+                try:
+                    value = int(ident, 16)
+                except ValueError:
+                    continue
+                if vendor is not None:
+                    entries[_make_key(KIND_DEVICE, vendor, value)] = name.strip()
+                elif pci_class is not None:
+                    entries[_make_key(KIND_SUBCLASS, pci_class, value)] = name.strip()
+                continue
+            if line.startswith('C '):
+                ident, _sep, name = line[2:].strip().partition('  ')
+                vendor = None
+                try:
+                    pci_class = int(ident, 16)
+                except ValueError:
+                    pci_class = None
+                    continue
+                entries[_make_key(KIND_CLASS, pci_class)] = name.strip()
+                continue
+            ident, _sep, name = line.strip().partition('  ')
+            pci_class = None
+            try:
+                vendor = int(ident, 16)
+            except ValueError:
+                # Device-type lists at the end of the file have other markers
+                vendor = None
+                continue
+            entries[_make_key(KIND_VENDOR, vendor)] = name.strip()
+
+    names = bytearray()
+    table = bytearray()
+    for key in sorted(entries):
+        data = entries[key].encode('utf-8')
+        table += _ENTRY.pack(key, len(names), len(data))
+        names += data
+
+    st = os.stat(source_path)
+    header = _HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(entries), st.st_mtime_ns, st.st_size)
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(table)
+        f.write(names)
+    os.replace(tmp_path, index_path)
+
+
+class PciIdsIndex:
+    """
+    Name lookups against the compiled pci.ids index.
+
+    The index is built once per pci.ids version in the cache directory and
+    memory-mapped, so a lookup is a binary search over the mapped table and
+    the database is never parsed at startup.
+    """
+
+    def __init__(self, source_path=None, index_path=None):
+        self.source_path = source_path
+        self.index_path = index_path or str(get_cache_dir() / 'pci.ids.idx')
+        self._map = None
+        self._count = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _is_current(self, source_st):
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = f.read(_HEADER.size)
+            magic, version, _count, mtime_ns, size = _HEADER.unpack(header)
+        except (OSError, struct.error):
+            return False
+        return (magic == INDEX_MAGIC and version == INDEX_VERSION
+                and mtime_ns == source_st.st_mtime_ns and size == source_st.st_size)
+
+    def _load(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            source = self.source_path or _find_pci_ids()
+            if not source:
+                return
+            try:
+                if not self._is_current(os.stat(source)):
+                    compile_pci_ids(source, self.index_path)
+                with open(self.index_path, 'rb') as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._count = _HEADER.unpack_from(self._map, 0)[2]
+            except (OSError, ValueError, struct.error) as e:
+                print(f"Error loading pci.ids index: {e}")
+                self._map = None
+
+    def _lookup(self, key):
+        self._load()
+        if self._map is None:
+            return None
+        lo, hi = 0, self._count
+        base = _HEADER.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry_key, offset, length = _ENTRY.unpack_from(self._map, base + mid * _ENTRY.size)
+            if entry_key < key:
+                lo = mid + 1
+            elif entry_key > key:
+                hi = mid
+            else:
+                start = base + self._count * _ENTRY.size + offset
+                return self._map[start:start + length].decode('utf-8', errors='replace')
+        return None
+
+    def vendor_name(self, vendor_id):
+        return self._lookup(_make_key(KIND_VENDOR, vendor_id))
+
+    def device_name(self, vendor_id, device_id):
+        return self._lookup(_make_key(KIND_DEVICE, vendor_id, device_id))
+
+    def class_name(self, base_class):
+        return self._lookup(_make_key(KIND_CLASS, base_class))
+
+    def subclass_name(self, base_class, subclass):
+        return self._lookup(_make_key(KIND_SUBCLASS, base_class, subclass))
+
+
+# ─────────────────────────── Kernel modules ───────────────────────────
+
+_pci_aliases = None
+_aliases_lock = threading.Lock()
+
+
+def _load_pci_aliases():
+    """(pattern, module) pairs for PCI devices from the running kernel's modules.alias."""
+    global _pci_aliases
+    with _aliases_lock:
+        if _pci_aliases is None:
+            aliases = []
+            path = os.path.join('/lib/modules', os.uname().release, 'modules.alias')
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    for line in f:
+                        if line.startswith('alias pci:'):
+                            parts = line.split()
+                            if len(parts) == 3:
+                                aliases.append((parts[1], parts[2]))
+            except OSError:
+                pass
+            _pci_aliases = aliases
+    return _pci_aliases
+
+
+def get_device_modules(device):
+    """Kernel modules able to drive a device, like lspci -k's "Kernel modules"."""
+    modalias = device.get('modalias')
+    if not modalias:
+        return []
+    modules = []
+    for pattern, module in _load_pci_aliases():
+        if module not in modules and fnmatch.fnmatchcase(modalias, pattern):
+            modules.append(module)
+    return modules
+
+
+# ─────────────────────────── Enumeration ───────────────────────────
+
+def _read_sysfs(path):
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _read_hex(path):
+    value = _read_sysfs(path)
+    try:
+        return int(value, 16) if value else None
+    except ValueError:
+        return None
+
+
+def list_pci_devices(with_modules=False):
+    """
+    Enumerate PCI devices from sysfs.
+
+    Returns a list of dicts with 'slot', 'vendor_id', 'device_id',
+    'class_id' (24-bit), 'base_class', 'subclass', 'vendor_name',
+    'device_name', 'class_name', 'driver' (bound driver or None),
+    'modalias' and, with with_modules=True, 'modules'. Names fall back to
+    the hex IDs when pci.ids does not know the device.
+    """
+    index = get_pci_ids_index()
+    devices = []
+    try:
+        slots = sorted(os.listdir(PCI_DEVICES_DIR))
+    except OSError:
+        return devices
+
+    for slot in slots:
+        path = os.path.join(PCI_DEVICES_DIR, slot)
+        vendor_id = _read_hex(os.path.join(path, 'vendor'))
+        device_id = _read_hex(os.path.join(path, 'device'))
+        class_id = _read_hex(os.path.join(path, 'class'))
+        if vendor_id is None or device_id is None or class_id is None:
+            continue
+        base_class = (class_id >> 16) & 0xff
+        subclass = (class_id >> 8) & 0xff
+
+        driver_link = os.path.join(path, 'driver')
+        driver = os.path.basename(os.readlink(driver_link)) if os.path.islink(driver_link) else None
+
+        device = {
+            'slot': slot,
+            'vendor_id': vendor_id,
+            'device_id': device_id,
+            'class_id': class_id,
+            'base_class': base_class,
+            'subclass': subclass,
+            'vendor_name': index.vendor_name(vendor_id) or f"Vendor {vendor_id:04x}",
+            'device_name': index.device_name(vendor_id, device_id) or f"Device {device_id:04x}",
+            'class_name': (index.subclass_name(base_class, subclass)
+                           or index.class_name(base_class) or f"Class {class_id >> 8:04x}"),
+            'driver': driver,
+            'modalias': _read_sysfs(os.path.join(path, 'modalias')),
+        }
+        if with_modules:
+            device['modules'] = get_device_modules(device)
+        devices.append(device)
+    return devices
+
+
+def describe_device(device):
+    """One-line "<vendor> <device>" description, as lspci prints it after the class."""
+    return f"{device['vendor_name']} {device['device_name']}"
+
+
+def is_display_device(device):
+    return device['base_class'] == CLASS_DISPLAY
+
+
+def is_audio_device(device):
+    return (device['base_class'], device['subclass']) in (CLASS_MULTIMEDIA_AUDIO, CLASS_AUDIO_DEVICE)
+
+
+def is_wireless_device(device):
+    # Many Wi-Fi cards report the generic "Network controller" subclass, so
+    # the name is checked too.
+    if (device['base_class'], device['subclass']) == CLASS_NETWORK_WIRELESS:
+        return True
+    if device['base_class'] != 0x02:
+        return False
+    name = device['device_name'].lower()
+    return any(k in name for k in ('wireless', 'wifi', 'wi-fi', '802.11', 'wlan'))
+
+
+def is_bluetooth_device(device):
+    return ((device['base_class'], device['subclass']) == CLASS_BLUETOOTH
+            or 'bluetooth' in device['device_name'].lower())
+
+
+# Global instance for easy access
+_pci_ids_index = None
+
+def get_pci_ids_index() -> PciIdsIndex:
+    """
+    Returns the global pci.ids index.
+    Creates it if it doesn't exist.
+    """
+    global _pci_ids_index
+    if _pci_ids_index is None:
+        _pci_ids_index = PciIdsIndex()
+    return _pci_ids_index